@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import json
 from pathlib import Path
 
 import matplotlib.pyplot as plt
@@ -9,6 +10,7 @@ import numpy as np
 from vireon_rd.metrics import peak_wavelength_from_profile, radial_average, structure_factor_2d
 from vireon_rd.sim import run_grayscott, run_sqk_model_g
 from vireon_rd.specs import GrayScottSpec, SQKModelGSpec, get_spec
+from vireon_rd.store import open_trajectory
 
 
 def _pick_field(spec_name: str, final: dict[str, np.ndarray]) -> tuple[str, np.ndarray]:
@@ -34,17 +36,36 @@ def _run_final_field(spec_name: str, seed: int) -> tuple[float, np.ndarray]:
     return dx, field
 
 
+def _stored_final_field(run_dir: Path) -> tuple[str, int, float, np.ndarray]:
+    # read a run written with --trajectory instead of re-simulating it
+    meta = json.loads((run_dir / "meta.json").read_text(encoding="utf-8"))
+    final = open_trajectory(run_dir).final
+    _, field = _pick_field(meta["model"], final)
+    grid = meta["grid"]
+    return str(meta["model"]), int(meta["seed"]), grid["L"] / grid["N"], np.asarray(field)
+
+
 def main() -> None:
-    ap = argparse.ArgumentParser(description="Generate figures for a single run (field + spectrum).")
+    ap = argparse.ArgumentParser(
+        description="Generate figures for a single run (field + spectrum)."
+    )
     ap.add_argument("--spec", default="sqk", choices=["sqk", "gs"])
     ap.add_argument("--seed", type=int, default=1)
     ap.add_argument("--figdir", default="results/figures", help="directory to write figures")
+    ap.add_argument(
+        "--run",
+        default="",
+        help="run directory with a trajectory store (skips re-simulation; overrides --spec/--seed)",
+    )
     args = ap.parse_args()
 
     figdir = Path(args.figdir)
     figdir.mkdir(parents=True, exist_ok=True)
 
-    dx, field = _run_final_field(args.spec, args.seed)
+    if args.run:
+        args.spec, args.seed, dx, field = _stored_final_field(Path(args.run))
+    else:
+        dx, field = _run_final_field(args.spec, args.seed)
 
     # --- Figure 1: final field ---
     plt.figure()
@@ -63,7 +84,7 @@ def main() -> None:
     plt.figure()
     plt.plot(k, prof)
     plt.title(f"{args.spec} seed={args.seed} radial spectrum (lambda*={lam:.4g})")
-    plt.xlabel("k")
+    plt.xlabel("k (rad / length)")
     plt.ylabel("S_radial(k)")
     out2 = figdir / f"{args.spec}_seed{args.seed}_spectrum.png"
     plt.savefig(out2, dpi=200, bbox_inches="tight")
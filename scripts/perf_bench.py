@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from vireon_rd.fused import HAVE_NUMBA
+from vireon_rd.io import write_json
+from vireon_rd.perf import LEGACY_PREFIX, PerfConfig, run_perf, select_cases
+
+
+def _base(name: str) -> str:
+    return name.removeprefix(LEGACY_PREFIX).split("[")[0]
+
+
+# --bench -> which vireon_rd.perf cases it runs
+BENCHES: dict[str, Callable[[str], bool]] = {
+    "stepping": lambda n: _base(n) == "euler_step" and "threads=" not in n,
+    "metrics": lambda n: _base(n) in ("radial_average", "anisotropy_index", "localization_index"),
+    "forcing": lambda n: _base(n) == "forcing_term",
+    "backend": lambda n: (
+        _base(n) in ("euler_step", "fused_step")
+        and not n.startswith(LEGACY_PREFIX)
+        and "threads=" not in n
+    ),
+    "threads": lambda n: _base(n) == "euler_step" and not n.startswith(LEGACY_PREFIX),
+}
+
+
+def _key(name: str) -> tuple[str, str]:
+    # "euler_step[sqk,N=64,threads=2]" -> ("sqk", "64"); "radial_average[N=64]" -> ("", "64")
+    params = dict(
+        p.split("=") if "=" in p else ("case", p) for p in name.split("[")[1][:-1].split(",")
+    )
+    return params.get("case", ""), params["N"]
+
+
+def _pairs(bench: dict[str, Any], group: str, fast: str = "") -> list[tuple[str, Any, Any]]:
+    """
+    (name, reference result, candidate result) for every case of `group`: the
+    reference is the legacy case, or the `fast`-less form when `fast` is given.
+    """
+    rows = []
+    for name, res in bench.items():
+        if name.startswith(LEGACY_PREFIX) or not BENCHES[group](name):
+            continue
+        if fast:
+            if _base(name) != fast:
+                continue
+            ref = bench.get(name.replace(fast, "euler_step", 1))
+        else:
+            ref = bench.get(LEGACY_PREFIX + name)
+        rows.append((name, ref, res))
+    return rows
+
+
+def _speedup(ref: Any, res: dict[str, Any]) -> str:
+    return f"{ref['median'] / res['median']:.2f}x" if ref else "-"
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(
+        description="Kernel benchmarks vs their legacy forms (a front end over vireon_rd.perf)"
+    )
+    ap.add_argument("--sizes", default="64,128,256", help="comma-separated grid sizes")
+    ap.add_argument("--repeats", type=int, default=7, help="samples per benchmark")
+    ap.add_argument("--min-time", type=float, default=0.1, help="minimum seconds per sample")
+    ap.add_argument("--bench", default="all", choices=["all", *BENCHES])
+    ap.add_argument(
+        "--threads", default="1,2,4,8,16,32", help="thread counts of the scaling benchmark"
+    )
+    ap.add_argument("--out", default="", help="optional output path (vireon-rd perf format)")
+    args = ap.parse_args()
+
+    groups = list(BENCHES) if args.bench == "all" else [args.bench]
+    threads = [int(x) for x in args.threads.split(",") if x.strip()] if "threads" in groups else [1]
+    cfg = PerfConfig(
+        kinds=("micro", "legacy"),
+        sizes=tuple(int(x) for x in args.sizes.split(",") if x.strip()),
+        threads=tuple(threads),
+        repeats=args.repeats,
+        min_time=args.min_time,
+    )
+    names = {c.name for c in select_cases(cfg) if any(BENCHES[g](c.name) for g in groups)}
+    doc = run_perf(cfg, names=names)
+    bench = doc["benchmarks"]
+
+    def mb(res: Any) -> str:
+        return f"{res['peak_alloc_bytes'] / 2**20:.2f}" if res else "-"
+
+    def ms(res: Any) -> str:
+        return f"{1e3 * res['median']:.3f}" if res else "-"
+
+    def us(res: Any) -> str:
+        return f"{1e6 * res['median']:.1f}" if res else "-"
+
+    if "stepping" in groups:
+        print("| model | N | legacy ms/step | kernel ms/step | speedup | legacy MB | kernel MB |")
+        print("|---|---:|---:|---:|---:|---:|---:|")
+        for name, ref, res in _pairs(bench, "stepping"):
+            model, N = _key(name)
+            print(
+                f"| {model} | {N} | {ms(ref)} | {ms(res)} | {_speedup(ref, res)} "
+                f"| {mb(ref)} | {mb(res)} |"
+            )
+
+    if "metrics" in groups:
+        print()
+        print("| metric | N | legacy us/call | cached us/call | speedup |")
+        print("|---|---:|---:|---:|---:|")
+        for name, ref, res in _pairs(bench, "metrics"):
+            print(
+                f"| {_base(name)} | {_key(name)[1]} | {us(ref)} | {us(res)} "
+                f"| {_speedup(ref, res)} |"
+            )
+
+    if "forcing" in groups:
+        print()
+        print("| forcing | N | legacy us/step | cached us/step | speedup |")
+        print("|---|---:|---:|---:|---:|")
+        for name, ref, res in _pairs(bench, "forcing"):
+            case, N = _key(name)
+            print(f"| {case} | {N} | {us(ref)} | {us(res)} | {_speedup(ref, res)} |")
+
+    if "backend" in groups:
+        if not HAVE_NUMBA:
+            print("numba not installed: skipping the backend benchmark")
+        else:
+            print()
+            print("| model | N | numpy ms/step | numba ms/step | speedup |")
+            print("|---|---:|---:|---:|---:|")
+            for name, ref, res in _pairs(bench, "backend", fast="fused_step"):
+                model, N = _key(name)
+                print(f"| {model} | {N} | {ms(ref)} | {ms(res)} | {_speedup(ref, res)} |")
+
+    if "threads" in groups:
+        print()
+        print("| model | N | threads | ms/step | speedup | efficiency |")
+        print("|---|---:|---:|---:|---:|---:|")
+        for name, res in bench.items():
+            if name.startswith(LEGACY_PREFIX) or not BENCHES["threads"](name):
+                continue
+            model, N = _key(name)
+            head, _, count = name[:-1].partition(",threads=")
+            k = int(count or 1)
+            serial = bench[head + "]"]
+            speedup = serial["median"] / res["median"]
+            print(f"| {model} | {N} | {k} | {ms(res)} | {speedup:.2f}x | {speedup / k:.0%} |")
+
+    if args.out:
+        out = Path(args.out)
+        write_json(out, doc)
+        print(f"OK: wrote {out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,25 +3,52 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
-from vireon_rd.engine import run_one, run_suite
+from vireon_rd.cache import CacheConfig
+from vireon_rd.engine import RunOptions, run_one, run_suite, submit_suite
+from vireon_rd.parallel import make_pool
 
 
 def main() -> None:
     ap = argparse.ArgumentParser(description="Run benchmark suites and write results/")
     ap.add_argument("--out", default="results", help="base output directory")
     ap.add_argument("--seeds", default="1,2,3,4,5", help="comma-separated seeds")
+    ap.add_argument("--jobs", type=int, default=1, help="worker processes")
+    ap.add_argument("--no-cache", action="store_true", help="re-simulate every run")
+    ap.add_argument("--cache-dir", default="", help="result cache directory")
     args = ap.parse_args()
 
     out = Path(args.out)
     seeds = [int(x.strip()) for x in args.seeds.split(",") if x.strip()]
-
-    # SQK: suite + one canonical run
-    run_one("sqk", seed=seeds[0], out_dir=out / "sqk" / f"seed_{seeds[0]}")
-    run_suite("sqk", seeds=seeds, out_dir=out / "sqk_suite")
+    cache = None
+    if not args.no_cache:
+        cache = CacheConfig(root=Path(args.cache_dir) if args.cache_dir else None)
+    opts = RunOptions(cache=cache)
+
+    if args.jobs > 1:
+        # SQK + Gray–Scott canonical runs and suites share one pool
+        with make_pool(args.jobs) as pool:
+            canonical = [
+                pool.submit(run_one, name, seeds[0], out / name / f"seed_{seeds[0]}", opts=opts)
+                for name in ("sqk", "gs")
+            ]
+            suites = [
+                submit_suite(pool, name, seeds, out / f"{name}_suite", chunks=args.jobs, opts=opts)
+                for name in ("sqk", "gs")
+            ]
+            for f in canonical:
+                f.result()
+            for finish in suites:
+                finish()
+        print("OK: wrote benchmark artifacts to", out)
+        return
+
+    # SQK: suite + one canonical run (the suite's first seed is a cache hit)
+    run_one("sqk", seed=seeds[0], out_dir=out / "sqk" / f"seed_{seeds[0]}", opts=opts)
+    run_suite("sqk", seeds=seeds, out_dir=out / "sqk_suite", opts=opts)
 
     # Gray–Scott: suite + one canonical run
-    run_one("gs", seed=seeds[0], out_dir=out / "gs" / f"seed_{seeds[0]}")
-    run_suite("gs", seeds=seeds, out_dir=out / "gs_suite")
+    run_one("gs", seed=seeds[0], out_dir=out / "gs" / f"seed_{seeds[0]}", opts=opts)
+    run_suite("gs", seeds=seeds, out_dir=out / "gs_suite", opts=opts)
 
     print("OK: wrote benchmark artifacts to", out)
 
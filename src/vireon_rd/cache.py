@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import time
+import uuid
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from .store import STORE_DIR
+
+CACHE_ENV = "VIREON_RD_CACHE"
+ENTRY_FILE = ".entry.json"
+
+# what a run writes into its directory; only these are cached and restored, so
+# anything else in an output directory is never copied into or over by the cache
+RUN_ARTIFACTS = ("meta.json", "metrics.json", "falsifiers.json", "report.md", STORE_DIR)
+
+
+def default_cache_dir() -> Path:
+    """
+    $VIREON_RD_CACHE, else $XDG_CACHE_HOME/vireon-rd, else ~/.cache/vireon-rd.
+    """
+    env = os.environ.get(CACHE_ENV)
+    if env:
+        return Path(env)
+    base = os.environ.get("XDG_CACHE_HOME")
+    return (Path(base) if base else Path.home() / ".cache") / "vireon-rd"
+
+
+@dataclass(frozen=True)
+class CacheConfig:
+    root: Path | None = None  # None: default_cache_dir()
+    max_bytes: int = 2 * 2**30  # LRU-evict entries beyond this total size
+    link: bool = False  # hard-link cached files into run directories instead of copying
+
+
+def canonical_hash(obj: Any) -> str:
+    """
+    sha256 of the canonical JSON form of `obj` (sorted keys, no whitespace).
+    """
+    payload = json.dumps(obj, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def run_key(
+    engine_version: str,
+    backend: str,
+    spec: Any,
+    seed: int,
+    options: dict[str, Any] | None = None,
+) -> str:
+    """
+    Cache key of one run: engine version, numerics backend, the full frozen
+    spec (type and every field), the seed and any output-affecting options.
+    """
+    return canonical_hash(
+        {
+            "engine_version": engine_version,
+            "backend": backend,
+            "spec_type": type(spec).__name__,
+            "spec": asdict(spec),
+            "seed": int(seed),
+            "options": options or {},
+        }
+    )
+
+
+def _tree_bytes(path: Path) -> int:
+    return sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+
+
+class ResultCache:
+    """
+    Content-addressed store of run directories, `<root>/<key[:2]>/<key>/`.
+
+    Entries are published with an atomic rename, so a reader never sees a
+    partial entry. Every hit refreshes the entry's use time; `put` evicts
+    least-recently-used entries until the total size is within `max_bytes`.
+    """
+
+    def __init__(self, cfg: CacheConfig | None = None) -> None:
+        self.cfg = CacheConfig() if cfg is None else cfg
+        self.root = Path(self.cfg.root) if self.cfg.root is not None else default_cache_dir()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def path(self, key: str) -> Path:
+        return self.root / key[:2] / key
+
+    def get(self, key: str, dest: Path) -> bool:
+        """
+        Materialize entry `key` into `dest` (copy or hard link); False on a miss.
+
+        Only the run artifacts (`RUN_ARTIFACTS`) are written, each replacing
+        its own previous version; other files in `dest` are left alone.
+        """
+        src = self.path(key)
+        if not (src / ENTRY_FILE).exists():
+            self.misses += 1
+            return False
+        dest.mkdir(parents=True, exist_ok=True)
+        copy = _link_or_copy if self.cfg.link else shutil.copy2
+        for name in RUN_ARTIFACTS:
+            s, d = src / name, dest / name
+            if not s.exists():
+                continue
+            # never write through an old hard link into another cache entry
+            if d.is_dir() and not d.is_symlink():
+                shutil.rmtree(d)
+            elif d.exists() or d.is_symlink():
+                d.unlink()
+            if s.is_dir():
+                shutil.copytree(s, d, copy_function=copy)
+            else:
+                copy(str(s), str(d))
+        os.utime(src / ENTRY_FILE)  # LRU: mtime of the entry file is the last use
+        self.hits += 1
+        return True
+
+    def put(self, key: str, src: Path) -> None:
+        """
+        Store the run artifacts (`RUN_ARTIFACTS`) of directory `src` under
+        `key` (no-op if already present).
+        """
+        final = self.path(key)
+        if (final / ENTRY_FILE).exists():
+            return
+        tmp = self.root / f".tmp-{uuid.uuid4().hex}"
+        tmp.mkdir(parents=True)
+        for name in RUN_ARTIFACTS:
+            s = src / name
+            if s.is_dir():
+                shutil.copytree(s, tmp / name)
+            elif s.is_file():
+                shutil.copy2(s, tmp / name)
+        entry = {"key": key, "bytes": _tree_bytes(tmp), "created": time.time()}
+        (tmp / ENTRY_FILE).write_text(json.dumps(entry) + "\n", encoding="utf-8")
+        final.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.replace(tmp, final)
+        except OSError:
+            # another process published the same key first
+            shutil.rmtree(tmp, ignore_errors=True)
+            return
+        self.evict()
+
+    def entries(self) -> list[tuple[float, int, Path]]:
+        """
+        (last use, bytes, path) of every complete entry.
+        """
+        out = []
+        for f in self.root.glob(f"??/*/{ENTRY_FILE}"):
+            try:
+                info = json.loads(f.read_text(encoding="utf-8"))
+                out.append((f.stat().st_mtime, int(info["bytes"]), f.parent))
+            except (OSError, ValueError, KeyError):
+                continue
+        return out
+
+    def evict(self, max_bytes: int | None = None) -> int:
+        """
+        Drop least-recently-used entries until the cache fits; returns bytes freed.
+        """
+        limit = self.cfg.max_bytes if max_bytes is None else int(max_bytes)
+        entries = sorted(self.entries())
+        total = sum(b for _, b, _ in entries)
+        freed = 0
+        for _, b, p in entries:
+            if total <= limit:
+                break
+            shutil.rmtree(p, ignore_errors=True)
+            total -= b
+            freed += b
+            self.evictions += 1
+        return freed
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
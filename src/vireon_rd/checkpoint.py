@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import io
+import os
+import pickle
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+CHECKPOINT_FILE = "checkpoint.npz"
+CHECKPOINT_VERSION = 1
+
+
+@dataclass(frozen=True)
+class CheckpointConfig:
+    path: Path  # checkpoint file (replaced atomically on every write)
+    every: int = 1000  # steps between checkpoints, rounded up to a multiple of save_every
+    resume: bool = False  # continue from `path` if it exists
+    keep: bool = False  # keep the file once the run has finished
+    tag: str = ""  # caller-side identity (e.g. sink layout); must match on resume
+
+
+def checkpoint_stride(every: int, save_every: int) -> int:
+    """
+    Checkpoints are taken on snapshot steps, where every sink is in a pushed state.
+    """
+    return max(1, -(-max(1, int(every)) // save_every)) * save_every
+
+
+def save_checkpoint(path: Path, arrays: dict[str, np.ndarray], meta: dict[str, Any]) -> None:
+    """
+    Atomically write `arrays` plus a pickled `meta` blob as one .npz file.
+
+    The file is written next to `path`, fsync'ed and renamed over it, so a
+    crash leaves either the previous checkpoint or the new one, never a mix.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    blob = pickle.dumps({"version": CHECKPOINT_VERSION, **meta}, protocol=pickle.HIGHEST_PROTOCOL)
+    buf = io.BytesIO()
+    np.savez(buf, __meta__=np.frombuffer(blob, dtype=np.uint8), **arrays)
+    tmp = path.with_name(f".{path.name}.tmp")
+    with tmp.open("wb") as f:
+        f.write(buf.getbuffer())
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def load_checkpoint(path: Path) -> tuple[dict[str, np.ndarray], dict[str, Any]]:
+    """
+    Read a checkpoint written by `save_checkpoint`: (arrays, meta).
+
+    The meta blob is unpickled, so only load checkpoints this engine wrote.
+    """
+    with np.load(Path(path)) as z:
+        arrays = {k: z[k] for k in z.files if k != "__meta__"}
+        meta = pickle.loads(z["__meta__"].tobytes())
+    if int(meta.get("version", 0)) > CHECKPOINT_VERSION:
+        raise ValueError(f"unsupported checkpoint version {meta['version']}")
+    return arrays, meta
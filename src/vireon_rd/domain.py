@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import contextlib
+import multiprocessing as mp
+import traceback
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any
+
+import numpy as np
+
+from .parallel import pin_threads, split_chunks
+
+
+class SharedDomain:
+    """
+    Row-strip domain decomposition of an Euler stepper over shared memory.
+
+    The double-buffered state lives in one shared segment, (2, fields, B, N, N).
+    Each worker process owns a strip of rows. On every step it reads its rows
+    plus one halo row on each side straight from the current buffer and writes
+    its rows of the next buffer. The parent waits for every strip, which is the
+    one barrier per step. Parent and workers flip buffers in lockstep.
+    Snapshots, health checks and checkpoints stay in the parent, on views of
+    the segment. When ensemble members are dropped the parent packs the kept
+    ones into the first `members` rows and the workers step only those, so
+    the segment and the processes live as long as the domain.
+    """
+
+    def __init__(self, stepper_cls: type, spec: Any, state: list[np.ndarray], workers: int) -> None:
+        shape = (2, len(state), *state[0].shape)
+        dtype = state[0].dtype
+        self.shm = SharedMemory(create=True, size=max(1, int(np.prod(shape)) * dtype.itemsize))
+        self.buffers = np.ndarray(shape, dtype=dtype, buffer=self.shm.buf)
+        self.members = shape[2]  # leading stack rows the workers step
+        for a, b in zip(self.buffers[0], state, strict=True):
+            a[...] = b
+        self.procs: list[Any] = []
+        self.conns: list[Connection] = []
+        ctx = mp.get_context("spawn")
+        try:
+            for rows in split_chunks(range(shape[-2]), workers):
+                parent, child = ctx.Pipe()
+                args = (
+                    child,
+                    stepper_cls,
+                    spec,
+                    self.shm.name,
+                    shape,
+                    dtype.str,
+                    rows[0],
+                    rows[-1] + 1,
+                )
+                proc = ctx.Process(target=_worker, args=args, daemon=True)
+                proc.start()
+                child.close()
+                self.procs.append(proc)
+                self.conns.append(parent)
+            self._collect()
+        except BaseException:
+            self.close()
+            raise
+
+    def views(self, parity: int) -> list[np.ndarray]:
+        return list(self.buffers[parity])
+
+    def _collect(self) -> None:
+        errors = []
+        for c in self.conns:
+            try:
+                msg = c.recv()
+            except EOFError:
+                msg = ("error", "domain worker exited")
+            if msg[0] == "error":
+                errors.append(msg[1])
+        if errors:
+            raise RuntimeError(f"domain worker failed:\n{errors[0]}")
+
+    def step(self, t: float) -> None:
+        for c in self.conns:
+            c.send(("step", t, self.members))
+        self._collect()
+
+    def close(self) -> None:
+        for c in self.conns:
+            with contextlib.suppress(OSError):
+                c.send(("stop", 0.0, 0))
+        for p in self.procs:
+            p.join(timeout=5)
+            if p.is_alive():
+                p.terminate()
+        self.procs, self.conns = [], []
+        del self.buffers
+        with contextlib.suppress(BufferError):
+            # fails while parent-side views are alive; the mapping then goes with them
+            self.shm.close()
+        self.shm.unlink()
+
+
+def _worker(
+    conn: Connection,
+    stepper_cls: type,
+    spec: Any,
+    name: str,
+    shape: tuple[int, ...],
+    dtype: str,
+    r0: int,
+    r1: int,
+) -> None:
+    pin_threads(1)
+    shm = SharedMemory(name=name)
+    try:
+        bufs = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+        stepper, full = stepper_cls.tile(spec, shape[2:], r0, r1)
+        blk, members = full, shape[2]
+        parity = 0
+        conn.send(("ready", ""))
+        while True:
+            cmd, t, b = conn.recv()
+            if cmd == "stop":
+                break
+            try:
+                if b != members:
+                    blk, members = full.first(b), b
+                stepper.cur = [a[:b] for a in bufs[parity]]
+                stepper.nxt = [a[:b] for a in bufs[1 - parity]]
+                stepper._step_block(blk, stepper._forcing_term(t, r0, r1))
+                parity = 1 - parity
+                conn.send(("ok", ""))
+            except Exception:
+                conn.send(("error", traceback.format_exc()))
+        del bufs, stepper
+    finally:
+        shm.close()
@@ -1,20 +1,155 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
 import json
+import math
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, as_completed
+from dataclasses import asdict, dataclass, replace
 from pathlib import Path
+from typing import Any
 
 import numpy as np
 
-from .eval import EvalConfig, eval_field, eval_time_drift
-from .falsify import FalsifierConfig, falsify_one, suite_delta_e_store
+from .cache import CacheConfig, ResultCache, canonical_hash, run_key
+from .checkpoint import CHECKPOINT_FILE, CheckpointConfig
+from .eval import EvalConfig, eval_field, eval_field_batch, eval_time_drift
+from .falsify import FalsifierConfig, GateProbe, ProbeConfig, falsify_one, suite_delta_e_store
+from .fused import resolve_backend
 from .io import asdict_safe, run_meta, write_json, write_report_md
-from .sim import run_grayscott, run_sqk_model_g
-from .specs import GrayScottSpec, SQKModelGSpec, get_spec
+from .numerics import metrics_dtype
+from .parallel import make_pool, split_chunks
+from .sim import SimResult, run_grayscott_ensemble, run_sqk_model_g_ensemble
+from .sinks import DriftSink, SnapshotSink, TeeSink
+from .specs import BACKENDS, PRECISIONS, SCHEMES, GrayScottSpec, SQKModelGSpec, get_spec
+from .store import STORE_DIR, StoreConfig, TrajectoryWriter, open_trajectory
+from .timing import PhaseTimer, peak_rss_bytes, profiled, rollup
 from .trp import TRPConfig
 
 ENGINE_VERSION = "0.1.0"
 
+PRIMARY_FIELD = {"sqk": "X", "gs": "v"}
+
+
+@dataclass(frozen=True)
+class RunOptions:
+    """
+    Optional per-run outputs and controls shared by `run_one` and the suites.
+    """
+
+    store: StoreConfig | None = None  # write <run>/trajectory/
+    probe: ProbeConfig | None = None  # in-flight gate probes (status "early_stop")
+    cache: CacheConfig | None = None  # reuse artifacts of identical runs
+    checkpoint_every: int = 0  # save restartable state every N steps (0: off)
+    resume: bool = False  # continue from an existing checkpoint of the same run
+    threads: int = 1  # row-block threads per Euler step (results unchanged)
+    workers: int = 1  # shared-memory worker processes per Euler run (results unchanged)
+
+
+AUDIT_KEYS = ("lambda_star", "anisotropy", "localization", "label", "kl_mean_to_final")
+
+# metrics compared by `validate_precision`
+PRECISION_KEYS = ("lambda_star", "localization", "kl_mean_to_final", "anisotropy")
+
+
+def _add_store_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
+        "--trajectory",
+        action="store_true",
+        help=f"write a chunked snapshot store to <run>/{STORE_DIR}/",
+    )
+    p.add_argument(
+        "--trajectory-fields",
+        default="",
+        help="comma-separated fields to store (default: all)",
+    )
+    p.add_argument("--compress", action="store_true", help="zlib-compress trajectory chunks")
+
+
+def _add_probe_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
+        "--probe-every",
+        type=int,
+        default=0,
+        help="probe gates every M snapshots and stop settled runs early (0: off)",
+    )
+    p.add_argument(
+        "--probe-stationary",
+        type=float,
+        default=0.0,
+        help="also stop once consecutive probe spectra differ by less than this KL",
+    )
+
+
+def _add_cache_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--no-cache", action="store_true", help="always simulate; bypass the cache")
+    p.add_argument("--cache-dir", default="", help="result cache directory")
+    p.add_argument("--cache-max-gb", type=float, default=2.0, help="LRU cache size bound")
+
+
+def _add_stepping_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
+        "--threads",
+        type=int,
+        default=1,
+        help="threads per Euler step (row blocks; worthwhile from N ~ 512, same results)",
+    )
+    p.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="processes per Euler run over shared memory (very large N; same results)",
+    )
+
+
+def _add_profile_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
+        "--profile",
+        action="store_true",
+        help="write profile.pstats / profile.txt (cProfile) and memory.txt (tracemalloc) to --out",
+    )
+
+
+def _add_checkpoint_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
+        "--checkpoint-every",
+        type=int,
+        default=0,
+        help="save restartable state to <out>/checkpoint.npz every N steps (0: off)",
+    )
+    p.add_argument(
+        "--resume",
+        action="store_true",
+        help="continue bit-identically from <out>/checkpoint.npz if present",
+    )
+
+
+def _run_options(args: argparse.Namespace) -> RunOptions:
+    store = None
+    if args.trajectory:
+        names = tuple(x.strip() for x in str(args.trajectory_fields).split(",") if x.strip())
+        store = StoreConfig(fields=names or None, compress=bool(args.compress))
+    probe = None
+    if args.probe_every > 0:
+        probe = ProbeConfig(every=int(args.probe_every), stationary_kl=args.probe_stationary)
+    cache = None
+    if not args.no_cache:
+        cache = CacheConfig(
+            root=Path(args.cache_dir) if args.cache_dir else None,
+            max_bytes=int(args.cache_max_gb * 2**30),
+        )
+    return RunOptions(
+        store=store,
+        probe=probe,
+        cache=cache,
+        checkpoint_every=int(getattr(args, "checkpoint_every", 0)),
+        resume=bool(getattr(args, "resume", False)),
+        threads=int(getattr(args, "threads", 1)),
+        workers=int(getattr(args, "workers", 1)),
+    )
+
 
 def build_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(
@@ -27,6 +162,17 @@ def build_parser() -> argparse.ArgumentParser:
     runp.add_argument("--spec", default="sqk", choices=["sqk", "gs"])
     runp.add_argument("--seed", type=int, default=1)
     runp.add_argument("--out", default="results/run", help="output directory")
+    runp.add_argument("--scheme", default=None, choices=SCHEMES, help="override grid.scheme")
+    runp.add_argument(
+        "--precision", default=None, choices=PRECISIONS, help="override grid.precision"
+    )
+    runp.add_argument("--backend", default=None, choices=BACKENDS, help="override grid.backend")
+    _add_store_args(runp)
+    _add_probe_args(runp)
+    _add_cache_args(runp)
+    _add_stepping_args(runp)
+    _add_checkpoint_args(runp)
+    _add_profile_args(runp)
 
     suite = sub.add_parser(
         "suite",
@@ -35,46 +181,309 @@ def build_parser() -> argparse.ArgumentParser:
     suite.add_argument("--spec", default="sqk", choices=["sqk", "gs"])
     suite.add_argument("--seeds", default="1,2,3,4,5", help="comma-separated seeds")
     suite.add_argument("--out", default="results/suite", help="output directory")
+    suite.add_argument("--scheme", default=None, choices=SCHEMES, help="override grid.scheme")
+    suite.add_argument(
+        "--precision", default=None, choices=PRECISIONS, help="override grid.precision"
+    )
+    suite.add_argument("--backend", default=None, choices=BACKENDS, help="override grid.backend")
+    suite.add_argument(
+        "--no-ensemble",
+        action="store_true",
+        help="step seeds one after another instead of as one stacked ensemble",
+    )
+    suite.add_argument("--jobs", type=int, default=1, help="worker processes")
+    _add_store_args(suite)
+    _add_probe_args(suite)
+    _add_cache_args(suite)
+    _add_stepping_args(suite)
+    _add_profile_args(suite)
+
+    sweep = sub.add_parser(
+        "sweep",
+        help="run a grid / random / Latin-hypercube parameter sweep and write summary.csv",
+    )
+    sweep.add_argument("--design", required=True, help="sweep design (.toml or .json)")
+    sweep.add_argument("--out", default="results/sweep", help="output directory")
+    sweep.add_argument("--jobs", type=int, default=1, help="worker processes")
+    sweep.add_argument("--dry-run", action="store_true", help="list the jobs without running")
+    _add_store_args(sweep)
+    _add_probe_args(sweep)
+    _add_cache_args(sweep)
+    _add_stepping_args(sweep)
+
+    vp = sub.add_parser(
+        "validate-precision",
+        help="run seeds at float64 and a reduced precision and compare metrics + gates",
+    )
+    vp.add_argument("--spec", default="gs", choices=["sqk", "gs"])
+    vp.add_argument("--seeds", default="1,2,3", help="comma-separated seeds")
+    vp.add_argument("--precision", default="float32", choices=[p for p in PRECISIONS[1:]])
+    vp.add_argument("--scheme", default=None, choices=SCHEMES, help="override grid.scheme")
+    vp.add_argument("--rtol", type=float, default=1e-2, help="relative metric tolerance")
+    vp.add_argument("--atol", type=float, default=1e-6, help="absolute metric tolerance")
+    vp.add_argument("--out", default="", help="optional JSON report path")
+
+    rf = sub.add_parser(
+        "refine",
+        help="run a spec at a ladder of (N, dt) with warm starts and report convergence",
+    )
+    rf.add_argument("--spec", default="gs", choices=["sqk", "gs"])
+    rf.add_argument("--seed", type=int, default=1)
+    rf.add_argument("--N", default="", help="comma-separated grid sizes (default: N/2,N,2N)")
+    rf.add_argument("--dt", default="", help="comma-separated time steps (default: dt*(N0/N)^2)")
+    rf.add_argument(
+        "--warm-frac",
+        type=float,
+        default=0.5,
+        help="finer levels start from the coarse state at this fraction of T (0: all cold)",
+    )
+    rf.add_argument("--order", type=float, default=2.0, help="assumed convergence order")
+    rf.add_argument("--scheme", default=None, choices=SCHEMES, help="override grid.scheme")
+    rf.add_argument("--out", default="results/refine", help="output directory")
+    _add_stepping_args(rf)
+
+    perf = sub.add_parser(
+        "perf",
+        help="run the micro / macro performance benchmarks into a machine-tagged baseline",
+    )
+    perf.add_argument("--kind", default="all", choices=["all", "micro", "macro", "legacy"])
+    perf.add_argument("--sizes", default="64,128,256", help="micro benchmark grid sizes")
+    perf.add_argument("--macro-sizes", default="32,64", help="run_one / run_suite grid sizes")
+    perf.add_argument("--repeats", type=int, default=7, help="samples per benchmark")
+    perf.add_argument("--filter", default="", help="fnmatch pattern on benchmark names")
+    perf.add_argument("--out", default="", help="baseline path (default: benchmarks/<tag>.json)")
+
+    pc = sub.add_parser(
+        "perf-compare",
+        help="compare benchmark results with a baseline and flag significant slowdowns",
+    )
+    pc.add_argument("--baseline", default="", help="baseline JSON (default: this machine's)")
+    pc.add_argument(
+        "--current", default="", help="results JSON (default: re-run the baseline's set)"
+    )
+    pc.add_argument("--alpha", type=float, default=0.01, help="Mann–Whitney significance level")
+    pc.add_argument("--threshold", type=float, default=0.05, help="relative median change")
+    pc.add_argument("--out", default="", help="optional JSON report path")
+
+    audit = sub.add_parser(
+        "audit",
+        help="recompute metrics of a run from its trajectory store and compare",
+    )
+    audit.add_argument("--run", required=True, help="run directory (written with --trajectory)")
+    audit.add_argument("--rtol", type=float, default=1e-9, help="relative tolerance")
+
+    sv = sub.add_parser(
+        "serve",
+        help="keep warm worker processes serving run/suite/sweep requests on a Unix socket",
+    )
+    sv.add_argument(
+        "--socket",
+        default=None,
+        help="socket path (default: $VIREON_RD_SOCKET or $XDG_RUNTIME_DIR/vireon-rd.sock)",
+    )
+    sv.add_argument("--workers", type=int, default=0, help="worker processes (0: one per CPU)")
+    sv.add_argument("--no-warm", action="store_true", help="skip the start-up warm-up runs")
+
+    cl = sub.add_parser(
+        "client",
+        help="send a run/suite/sweep command to `serve` (runs in-process if none is up)",
+    )
+    cl.add_argument("--socket", default=None, help="socket path (default: as for serve)")
+    cl.add_argument(
+        "--no-fallback",
+        action="store_true",
+        help="fail instead of running in-process when no server is listening",
+    )
+    cl.add_argument(
+        "command",
+        nargs=argparse.REMAINDER,
+        help="e.g. run --spec gs --seed 3 --out results/r3, or ping / shutdown",
+    )
 
     sub.add_parser("smoke", help="minimal smoke command")
     return p
 
 
-def _pick_primary_field(model: str, final: dict[str, np.ndarray]) -> np.ndarray:
-    if model == "sqk":
-        return final["X"]
-    if model == "gs":
-        return final["v"]
-    raise ValueError(model)
+def _resolve_spec(
+    spec_name: str,
+    scheme: str | None,
+    precision: str | None = None,
+    backend: str | None = None,
+) -> SQKModelGSpec | GrayScottSpec:
+    spec = get_spec(spec_name)
+    if scheme is not None:
+        spec = replace(spec, grid=replace(spec.grid, scheme=scheme))
+    if precision is not None:
+        spec = replace(spec, grid=replace(spec.grid, precision=precision))
+    if backend is not None:
+        spec = replace(spec, grid=replace(spec.grid, backend=backend))
+    return spec
 
 
-def run_one(spec_name: str, seed: int, out_dir: Path) -> None:
-    spec = get_spec(spec_name)
+def _pick_primary_field(model: str, final: dict[str, np.ndarray]) -> np.ndarray:
+    if model not in PRIMARY_FIELD:
+        raise ValueError(model)
+    return final[PRIMARY_FIELD[model]]
 
+
+def _simulate(
+    spec: SQKModelGSpec | GrayScottSpec,
+    seeds: list[int],
+    out_dirs: list[Path] | None = None,
+    opts: RunOptions | None = None,
+) -> list[tuple[SimResult, DriftSink]]:
+    """
+    Run `seeds`, streaming the primary field of each into its own drift sink,
+    so peak memory does not grow with the number of snapshots. With
+    `opts.store`, snapshots are also written to `<out_dir>/trajectory/`; with
+    `opts.probe`, gate probes may stop a run early. With `opts.checkpoint_every`
+    the run is checkpointed to `<out_dir>/checkpoint.npz` (one seed) or
+    `<parent>/checkpoint-<seeds>.npz`, which is removed once it finishes.
+    """
+    opts = RunOptions() if opts is None else opts
+    out_dirs = [Path()] * len(seeds) if out_dirs is None else out_dirs  # only used for files
     if isinstance(spec, SQKModelGSpec):
-        sim = run_sqk_model_g(spec, seed=seed)
-        model = "sqk"
-        T = spec.grid.T
-        primary_series = [snap["X"] for snap in sim.snapshots]
+        model, run = "sqk", run_sqk_model_g_ensemble
     elif isinstance(spec, GrayScottSpec):
-        sim = run_grayscott(spec, seed=seed)
-        model = "gs"
-        T = spec.grid.T
-        primary_series = [snap["v"] for snap in sim.snapshots]
+        model, run = "gs", run_grayscott_ensemble
     else:
         raise TypeError("Unknown spec type")
 
-    primary_final = _pick_primary_field(model, sim.final)
+    primary = PRIMARY_FIELD[model]
+    cfg = EvalConfig()
+    dtype = metrics_dtype(spec.grid.precision)
+    drifts = [
+        DriftSink(primary, mode=cfg.drift_mode, factor=cfg.drift_factor, dtype=dtype) for _ in seeds
+    ]
+    writers = [
+        None if opts.store is None else TrajectoryWriter(d / STORE_DIR, opts.store)
+        for d in out_dirs
+    ]
+    sinks: list[SnapshotSink] = []
+    for drift, w in zip(drifts, writers, strict=True):
+        parts: list[SnapshotSink] = [drift]
+        if w is not None:
+            parts.append(w)
+        if opts.probe is not None:
+            parts.append(GateProbe(primary, opts.probe, eval_cfg=cfg))
+        sinks.append(parts[0] if len(parts) == 1 else TeeSink(*parts))
+    checkpoint = None
+    if opts.checkpoint_every > 0 or opts.resume:
+        if len(seeds) == 1:
+            path = out_dirs[0] / CHECKPOINT_FILE
+        else:
+            path = out_dirs[0].parent / f"checkpoint-{'_'.join(map(str, seeds))}.npz"
+        layout = {k: asdict(v) for k, v in (("store", opts.store), ("probe", opts.probe)) if v}
+        checkpoint = CheckpointConfig(
+            path=path,
+            every=opts.checkpoint_every or CheckpointConfig.every,
+            resume=opts.resume,
+            tag=canonical_hash(layout),
+        )
+    timer = PhaseTimer()
+    with timer.phase("simulate"):
+        sims = run(
+            spec,
+            seeds,
+            sinks=sinks,
+            checkpoint=checkpoint,
+            threads=opts.threads,
+            workers=opts.workers,
+        )
+        for sim, w in zip(sims, writers, strict=True):
+            if w is not None:
+                w.write_final(sim.final)
+    for sim in sims:
+        sim.timing.setdefault("stack", {}).update(timer.as_dict())
+    return list(zip(sims, drifts, strict=True))
+
 
-    eval_cfg = EvalConfig()
-    m = eval_field(primary_final, eval_cfg)
-    m.update(eval_time_drift(primary_series))
+def _eval_finals(
+    spec: SQKModelGSpec | GrayScottSpec,
+    sims: list[SimResult],
+) -> list[dict[str, Any]]:
+    """
+    `eval_field` of the primary final field of every run, as one batch.
+    """
+    dtype = metrics_dtype(spec.grid.precision)
+    finals = np.stack([_pick_primary_field(sim.model, sim.final) for sim in sims]).astype(dtype)
+    m = eval_field_batch(finals, EvalConfig())
+    return [
+        {
+            "lambda_star": float(m["lambda_star"][i]),
+            "anisotropy": float(m["anisotropy"][i]),
+            "localization": float(m["localization"][i]),
+            "label": str(m["label"][i]),
+        }
+        for i in range(len(sims))
+    ]
 
-    trp_cfg = TRPConfig()
-    fals_cfg = FalsifierConfig()
-    gates, extras = falsify_one(metrics=m, T=T, trp_cfg=trp_cfg, cfg=fals_cfg)
+
+def _evaluate(
+    spec: SQKModelGSpec | GrayScottSpec,
+    sim: SimResult,
+    drift: DriftSink,
+    field: dict[str, Any] | None = None,
+    timer: PhaseTimer | None = None,
+) -> tuple[dict[str, Any], dict[str, bool]]:
+    """
+    Metrics (with TRP extras) and falsifier gates of one simulated run;
+    `field` are its precomputed `_eval_finals` metrics. `timer` records the
+    "eval_field" (if computed here), "drift" and "falsify" phases.
+    """
+    timer = PhaseTimer() if timer is None else timer
+    if field is None:
+        with timer.phase("eval_field"):
+            field = _eval_finals(spec, [sim])[0]
+    m = dict(field)
+    with timer.phase("drift"):
+        m.update(drift.result())
+
+    with timer.phase("falsify"):
+        gates, extras = falsify_one(
+            metrics=m, T=spec.grid.T, trp_cfg=TRPConfig(), cfg=FalsifierConfig()
+        )
     metrics = dict(m)
     metrics.update(extras)
+    return metrics, gates
+
+
+def _write_run(
+    spec_name: str,
+    spec: SQKModelGSpec | GrayScottSpec,
+    seed: int,
+    sim: SimResult,
+    drift: DriftSink,
+    out_dir: Path,
+    opts: RunOptions | None = None,
+    field: dict[str, Any] | None = None,
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """
+    Evaluate + falsify one simulated run and write its artifact directory.
+    Returns the metrics dict (as written to metrics.json) and the meta.json
+    timing block.
+
+    `meta.json` `timing` holds wall times per phase: "stack" phases (stepping,
+    snapshots, health checks, Laplacians / forcing / FFTs, the whole
+    simulation and the batched field metrics) are shared by the `members`
+    runs stepped together; "run" phases (drift, falsifiers, writing
+    metrics.json and falsifiers.json) are this run's own. Plus steps per
+    second, the stepper's array bytes and the process's peak RSS.
+    """
+    model = sim.model
+    timer = PhaseTimer()
+    metrics, gates = _evaluate(spec, sim, drift, field, timer)
+
+    extra: dict[str, Any] = {}
+    store = None if opts is None else opts.store
+    if store is not None:
+        extra["trajectory"] = {
+            "path": STORE_DIR,
+            "fields": list(store.fields) if store.fields else list(sim.final),
+            "n_frames": len(sim.times),
+            "chunk_frames": int(store.chunk_frames),
+            "compress": bool(store.compress),
+        }
 
     meta = run_meta(
         engine_version=ENGINE_VERSION,
@@ -89,26 +498,118 @@ def run_one(spec_name: str, seed: int, out_dir: Path) -> None:
             "status": getattr(sim, "status", "ok"),
             "stop_step": getattr(sim, "stop_step", None),
             "stop_time": getattr(sim, "stop_time", None),
+            "stop_reason": sim.stop_reason,
+            # step counts, RHS evaluations and (adaptive) step-size histograms
+            "integrator": dict(sim.stats),
+            **extra,
         },
     )
 
     out_dir.mkdir(parents=True, exist_ok=True)
+    with timer.phase("write"):
+        write_json(out_dir / "metrics.json", metrics)
+        write_json(out_dir / "falsifiers.json", gates)
+    meta["timing"] = {**sim.timing, "run": timer.as_dict(), "peak_rss_bytes": peak_rss_bytes()}
     write_json(out_dir / "meta.json", meta)
-    write_json(out_dir / "metrics.json", metrics)
-    write_json(out_dir / "falsifiers.json", gates)
     write_report_md(out_dir / "report.md", meta, metrics, gates)
+    return metrics, meta["timing"]
 
 
-def run_suite(spec_name: str, seeds: list[int], out_dir: Path) -> None:
-    out_dir.mkdir(parents=True, exist_ok=True)
-    E_list: list[float] = []
-    runs: list[dict[str, float]] = []
+def run_one(
+    spec_name: str,
+    seed: int,
+    out_dir: Path,
+    spec: SQKModelGSpec | GrayScottSpec | None = None,
+    opts: RunOptions | None = None,
+) -> dict[str, Any]:
+    """
+    Run one seed of a spec (resolved by name unless `spec` is given).
+    """
+    spec = get_spec(spec_name) if spec is None else spec
+    ((metrics, _, _),) = _run_dirs(spec_name, spec, [seed], [out_dir], True, opts)
+    return metrics
+
+
+def cache_key(
+    spec_name: str,
+    spec: SQKModelGSpec | GrayScottSpec,
+    seed: int,
+    opts: RunOptions | None = None,
+) -> str:
+    """
+    Result-cache key of one run: everything that shapes its artifacts.
+    """
+    options: dict[str, Any] = {"spec_name": spec_name}
+    if opts is not None and opts.store is not None:
+        options["store"] = asdict(opts.store)
+    if opts is not None and opts.probe is not None:
+        options["probe"] = asdict(opts.probe)
+    backend = resolve_backend(spec.grid.backend, spec.grid.scheme)
+    return run_key(ENGINE_VERSION, backend, spec, seed, options)
+
+
+def _run_dirs(
+    spec_name: str,
+    spec: SQKModelGSpec | GrayScottSpec,
+    seeds: list[int],
+    dirs: list[Path],
+    ensemble: bool,
+    opts: RunOptions | None = None,
+) -> list[tuple[dict[str, Any], bool, dict[str, Any]]]:
+    """
+    Produce the artifacts of `seeds` in `dirs`, from the result cache where
+    possible. Returns (metrics, cache hit, meta.json timing) per seed; the
+    timing of a cache hit is empty (it was not run here).
+    """
+    cache = None if opts is None or opts.cache is None else ResultCache(opts.cache)
+    keys = [cache_key(spec_name, spec, s, opts) for s in seeds] if cache else []
+    out: dict[int, tuple[dict[str, Any], bool, dict[str, Any]]] = {}
+    todo: list[int] = []
+    for i, d in enumerate(dirs):
+        if cache is not None and cache.get(keys[i], d):
+            metrics = json.loads((d / "metrics.json").read_text(encoding="utf-8"))
+            out[i] = (metrics, True, {})
+        else:
+            todo.append(i)
 
-    for s in seeds:
-        run_dir = out_dir / f"seed_{s}"
-        run_one(spec_name, s, run_dir)
+    groups = [todo] if ensemble else [[i] for i in todo]
+    for group in (g for g in groups if g):
+        runs = _simulate(spec, [seeds[i] for i in group], [dirs[i] for i in group], opts)
+        timer = PhaseTimer()
+        with timer.phase("eval_field"):
+            fields = _eval_finals(spec, [sim for sim, _ in runs])
+        for sim, _ in runs:
+            sim.timing.setdefault("stack", {}).update(timer.as_dict())
+        for i, (sim, drift), f in zip(group, runs, fields, strict=True):
+            metrics, timing = _write_run(spec_name, spec, seeds[i], sim, drift, dirs[i], opts, f)
+            out[i] = (metrics, False, timing)
+            if cache is not None:
+                cache.put(keys[i], dirs[i])
+    return [out[i] for i in range(len(seeds))]
 
-        mj = json.loads((run_dir / "metrics.json").read_text(encoding="utf-8"))
+
+def _run_seeds(
+    spec_name: str,
+    spec: SQKModelGSpec | GrayScottSpec,
+    seeds: list[int],
+    out_dir: Path,
+    ensemble: bool,
+    opts: RunOptions | None = None,
+) -> list[tuple[dict[str, Any], bool, dict[str, Any]]]:
+    dirs = [out_dir / f"seed_{s}" for s in seeds]
+    return _run_dirs(spec_name, spec, seeds, dirs, ensemble, opts)
+
+
+def _write_suite(
+    spec_name: str,
+    seeds: list[int],
+    results: list[tuple[dict[str, Any], bool, dict[str, Any]]],
+    out_dir: Path,
+    opts: RunOptions | None = None,
+) -> dict[str, Any]:
+    E_list: list[float] = []
+    runs: list[dict[str, float]] = []
+    for s, (mj, _, _) in zip(seeds, results, strict=True):
         e = float(mj.get("E_current", 0.0))
         trp = float(mj.get("TRP", 0.0))
         E_list.append(e)
@@ -122,7 +623,199 @@ def run_suite(spec_name: str, seeds: list[int], out_dir: Path) -> None:
         "dE_store_mean": dE_mean,
         "runs": runs,
     }
+    if opts is not None and opts.cache is not None:
+        hits = sum(hit for _, hit, _ in results)
+        suite_summary["cache"] = {"hits": hits, "misses": len(results) - hits}
+    # phase totals of the runs simulated here (cache hits cost nothing)
+    suite_summary["timing"] = rollup([tm for _, hit, tm in results if not hit])
     write_json(out_dir / "suite.json", suite_summary)
+    return suite_summary
+
+
+def submit_suite(
+    executor: Executor,
+    spec_name: str,
+    seeds: list[int],
+    out_dir: Path,
+    *,
+    chunks: int,
+    ensemble: bool = True,
+    spec: SQKModelGSpec | GrayScottSpec | None = None,
+    opts: RunOptions | None = None,
+    progress: Callable[[list[int], list[tuple[dict[str, Any], bool, dict[str, Any]]]], None]
+    | None = None,
+) -> Callable[[], dict[str, Any]]:
+    """
+    Schedule a suite on `executor` and return a callable that waits for it,
+    writes suite.json and returns its contents.
+
+    Seeds are split into `chunks` ensemble stacks (or one job per seed with
+    `ensemble=False`). Results travel back in memory and are assembled in
+    `seeds` order, so suite.json does not depend on completion order.
+    `progress(seeds, results)` is called (by the waiting thread) as each
+    stack completes.
+    """
+    spec = get_spec(spec_name) if spec is None else spec
+    out_dir.mkdir(parents=True, exist_ok=True)
+    parts = split_chunks(seeds, chunks) if ensemble else [[s] for s in seeds]
+    futures = [
+        executor.submit(_run_seeds, spec_name, spec, part, out_dir, ensemble, opts)
+        for part in parts
+    ]
+
+    def finish() -> dict[str, Any]:
+        if progress is not None:
+            part_of = dict(zip(futures, parts, strict=True))
+            for f in as_completed(futures):
+                progress(part_of[f], f.result())
+        results = [m for f in futures for m in f.result()]
+        return _write_suite(spec_name, seeds, results, out_dir, opts)
+
+    return finish
+
+
+def run_suite(
+    spec_name: str,
+    seeds: list[int],
+    out_dir: Path,
+    *,
+    ensemble: bool = True,
+    jobs: int = 1,
+    spec: SQKModelGSpec | GrayScottSpec | None = None,
+    opts: RunOptions | None = None,
+) -> dict[str, Any]:
+    """
+    Run a seed suite and write per-seed artifacts plus suite.json (returned).
+
+    With `ensemble=True` (default) seeds are stepped together as stacked
+    state; per-seed artifacts are identical to sequential `run_one` calls.
+    With `jobs > 1` the seeds are spread over a process pool.
+    """
+    spec = get_spec(spec_name) if spec is None else spec
+    if jobs > 1:
+        with make_pool(jobs) as pool:
+            return submit_suite(
+                pool,
+                spec_name,
+                seeds,
+                out_dir,
+                chunks=jobs,
+                ensemble=ensemble,
+                spec=spec,
+                opts=opts,
+            )()
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    results = _run_seeds(spec_name, spec, seeds, out_dir, ensemble, opts)
+    return _write_suite(spec_name, seeds, results, out_dir, opts)
+
+
+def _same(a: Any, b: Any, rtol: float) -> bool:
+    if isinstance(a, str) or isinstance(b, str):
+        return a == b
+    a, b = float(a), float(b)
+    if math.isnan(a) or math.isnan(b):
+        return math.isnan(a) and math.isnan(b)
+    return math.isclose(a, b, rel_tol=rtol, abs_tol=1e-12)
+
+
+def audit_run(run_dir: Path, rtol: float = 1e-9) -> dict[str, Any]:
+    """
+    Recompute the field and drift metrics of a run from its trajectory store
+    (no re-simulation) and compare them with metrics.json.
+    """
+    meta = json.loads((run_dir / "meta.json").read_text(encoding="utf-8"))
+    recorded = json.loads((run_dir / "metrics.json").read_text(encoding="utf-8"))
+    traj = open_trajectory(run_dir)
+    primary = PRIMARY_FIELD[meta["model"]]
+    dtype = metrics_dtype(meta.get("grid", {}).get("precision", "float64"))
+
+    m = eval_field(np.asarray(traj.final[primary], dtype=dtype), EvalConfig())
+    m.update(eval_time_drift(traj.series(primary), dtype=dtype))
+
+    checks = {
+        k: {
+            "recorded": recorded.get(k),
+            "recomputed": m[k],
+            "ok": k in recorded and _same(recorded[k], m[k], rtol),
+        }
+        for k in AUDIT_KEYS
+    }
+    return {
+        "run": str(run_dir),
+        "frames": traj.n_frames,
+        "ok": all(c["ok"] for c in checks.values()),
+        "checks": checks,
+    }
+
+
+def _close(a: float, b: float, rtol: float, atol: float) -> bool:
+    if math.isnan(a) or math.isnan(b):
+        return math.isnan(a) and math.isnan(b)
+    return abs(a - b) <= atol + rtol * abs(a)
+
+
+def validate_precision(
+    spec_name: str,
+    seeds: list[int],
+    precision: str = "float32",
+    *,
+    spec: SQKModelGSpec | GrayScottSpec | None = None,
+    rtol: float = 1e-2,
+    atol: float = 1e-6,
+) -> dict[str, Any]:
+    """
+    Run `seeds` at float64 and at `precision` and compare status, the
+    `PRECISION_KEYS` metrics and every gate outcome. `safe` is True when
+    statuses and gates agree and all metrics are within atol + rtol * |ref|.
+    """
+    spec = get_spec(spec_name) if spec is None else spec
+    evaluated: dict[str, list[tuple[str, dict[str, Any], dict[str, bool]]]] = {}
+    seconds: dict[str, float] = {}
+    for prec in ("float64", precision):
+        s = replace(spec, grid=replace(spec.grid, precision=prec))
+        t0 = time.perf_counter()
+        runs = _simulate(s, seeds)
+        seconds[prec] = time.perf_counter() - t0
+        fields = _eval_finals(s, [sim for sim, _ in runs])
+        evaluated[prec] = [
+            (sim.status, *_evaluate(s, sim, drift, f))
+            for (sim, drift), f in zip(runs, fields, strict=True)
+        ]
+
+    rows: list[dict[str, Any]] = []
+    for seed, ref, low in zip(seeds, evaluated["float64"], evaluated[precision], strict=True):
+        metrics = {
+            k: {
+                "float64": float(ref[1][k]),
+                precision: float(low[1][k]),
+                "abs_diff": abs(float(ref[1][k]) - float(low[1][k])),
+                "ok": _close(float(ref[1][k]), float(low[1][k]), rtol, atol),
+            }
+            for k in PRECISION_KEYS
+        }
+        gates = {k: {"float64": v, precision: low[2].get(k)} for k, v in ref[2].items()}
+        rows.append(
+            {
+                "seed": int(seed),
+                "status": {"float64": ref[0], precision: low[0]},
+                "metrics": metrics,
+                "gates": gates,
+                "ok": ref[0] == low[0]
+                and ref[2] == low[2]
+                and all(c["ok"] for c in metrics.values()),
+            }
+        )
+    return {
+        "spec": spec_name,
+        "precision": precision,
+        "rtol": rtol,
+        "atol": atol,
+        "seconds": seconds,
+        "speedup": seconds["float64"] / max(seconds[precision], 1e-12),
+        "seeds": rows,
+        "safe": all(r["ok"] for r in rows),
+    }
 
 
 def main(argv=None) -> None:
@@ -133,14 +826,201 @@ def main(argv=None) -> None:
         return
 
     if args.cmd == "run":
-        run_one(args.spec, int(args.seed), Path(args.out))
+        spec = _resolve_spec(args.spec, args.scheme, args.precision, args.backend)
+        opts = _run_options(args)
+        with profiled(Path(args.out)) if args.profile else contextlib.nullcontext():
+            ((_, hit, _),) = _run_dirs(
+                args.spec, spec, [int(args.seed)], [Path(args.out)], True, opts
+            )
+        if opts.cache is not None:
+            print(f"cache: {'hit' if hit else 'miss'}")
         print(f"OK: wrote {args.out}")
         return
 
     if args.cmd == "suite":
         seeds = [int(x.strip()) for x in str(args.seeds).split(",") if x.strip()]
-        run_suite(args.spec, seeds, Path(args.out))
+        with profiled(Path(args.out)) if args.profile else contextlib.nullcontext():
+            summary = run_suite(
+                args.spec,
+                seeds,
+                Path(args.out),
+                ensemble=not args.no_ensemble,
+                jobs=int(args.jobs),
+                spec=_resolve_spec(args.spec, args.scheme, args.precision, args.backend),
+                opts=_run_options(args),
+            )
+        if "cache" in summary:
+            print(f"cache: {summary['cache']['hits']} hits, {summary['cache']['misses']} misses")
         print(f"OK: wrote {args.out}")
         return
 
+    if args.cmd == "sweep":
+        from .sweep import expand_design, load_design, run_sweep
+
+        design = load_design(Path(args.design))
+        if args.dry_run:
+            for j in expand_design(design):
+                print(f"{j.id} seed={j.seed} {json.dumps(j.params, sort_keys=True)}")
+            return
+        rows = run_sweep(design, Path(args.out), jobs=int(args.jobs), opts=_run_options(args))
+        if any("cached" in r for r in rows):
+            hits = sum(int(r["cached"]) for r in rows)
+            print(f"cache: {hits} hits, {len(rows) - hits} misses")
+        print(f"OK: wrote {len(rows)} runs to {args.out}")
+        return
+
+    if args.cmd == "validate-precision":
+        seeds = [int(x.strip()) for x in str(args.seeds).split(",") if x.strip()]
+        p = args.precision
+        res = validate_precision(
+            args.spec,
+            seeds,
+            p,
+            spec=_resolve_spec(args.spec, args.scheme),
+            rtol=float(args.rtol),
+            atol=float(args.atol),
+        )
+        print(f"| seed | metric | float64 | {p} | abs diff | ok |")
+        print("|---:|---|---:|---:|---:|---|")
+        for r in res["seeds"]:
+            for k, c in r["metrics"].items():
+                print(
+                    f"| {r['seed']} | {k} | {c['float64']:.6g} | {c[p]:.6g} "
+                    f"| {c['abs_diff']:.3g} | {'OK' if c['ok'] else 'DRIFT'} |"
+                )
+            flips = [k for k, g in r["gates"].items() if g["float64"] != g[p]]
+            verdict = "FLIP: " + ", ".join(flips) if flips else "OK"
+            print(f"| {r['seed']} | gates | | | | {verdict} |")
+        print(f"time: float64 {res['seconds']['float64']:.2f}s, {p} {res['seconds'][p]:.2f}s")
+        if args.out:
+            write_json(Path(args.out), res)
+        if not res["safe"]:
+            print(f"UNSAFE: {p} changes results beyond rtol={args.rtol:g} / atol={args.atol:g}")
+            raise SystemExit(1)
+        print(f"OK: {p} reproduces float64 results for {args.spec}")
+        return
+
+    if args.cmd == "refine":
+        from .refine import REFINE_FILE, REFINE_KEYS, run_refine
+
+        spec = _resolve_spec(args.spec, args.scheme)
+        Ns = [int(x) for x in str(args.N).split(",") if x.strip()]
+        Ns = Ns or [spec.grid.N // 2, spec.grid.N, 2 * spec.grid.N]
+        dts = [float(x) for x in str(args.dt).split(",") if x.strip()] or None
+        res = run_refine(
+            spec,
+            int(args.seed),
+            Ns,
+            dts=dts,
+            warm_frac=float(args.warm_frac),
+            order=float(args.order),
+            threads=int(args.threads),
+            workers=int(args.workers),
+        )
+        print("| N | dt | start | status | " + " | ".join(REFINE_KEYS) + " | label | s |")
+        print("|---:|---:|---|---|" + "---:|" * len(REFINE_KEYS) + "---|---:|")
+        for lv in res["levels"]:
+            vals = " | ".join(f"{lv['metrics'][k]:.6g}" for k in REFINE_KEYS)
+            print(
+                f"| {lv['N']} | {lv['dt']:g} | {lv['start']} | {lv['status']} | {vals} "
+                f"| {lv['label']} | {lv['seconds']:.2f} |"
+            )
+        for k, c in res["convergence"].items():
+            if c["error"] is not None:
+                print(
+                    f"{k}: extrapolated {c['extrapolated']:.6g} ± {c['error']:.3g} "
+                    f"(order {c['order']:.2f})"
+                )
+        write_json(Path(args.out) / REFINE_FILE, res)
+        flips = [k for k, g in res["gates"].items() if not g["stable"]]
+        if not res["stable"]:
+            print("UNSTABLE under refinement: " + (", ".join(flips) or "label / status"))
+            raise SystemExit(1)
+        print(f"OK: gates and label stable across N={Ns}; wrote {args.out}")
+        return
+
+    if args.cmd == "perf":
+        from .perf import PerfConfig, default_baseline_path, run_perf
+
+        cfg = PerfConfig(
+            kinds=("micro", "macro") if args.kind == "all" else (args.kind,),
+            sizes=tuple(int(x) for x in str(args.sizes).split(",") if x.strip()),
+            macro_sizes=tuple(int(x) for x in str(args.macro_sizes).split(",") if x.strip()),
+            repeats=int(args.repeats),
+            filter=str(args.filter),
+        )
+
+        def show(name: str, r: dict[str, Any]) -> None:
+            print(f"{name:<44} {1e3 * r['median']:>11.4f} ms  (min {1e3 * r['min']:.4f})")
+
+        doc = run_perf(cfg, progress=show)
+        out = Path(args.out) if args.out else default_baseline_path()
+        write_json(out, doc)
+        print(f"OK: wrote {len(doc['benchmarks'])} benchmarks to {out}")
+        return
+
+    if args.cmd == "perf-compare":
+        from .perf import check, default_baseline_path
+
+        base_path = Path(args.baseline) if args.baseline else default_baseline_path()
+        baseline = json.loads(base_path.read_text(encoding="utf-8"))
+        current = None
+        if args.current:
+            current = json.loads(Path(args.current).read_text(encoding="utf-8"))
+        res, current = check(
+            baseline, current, alpha=float(args.alpha), threshold=float(args.threshold)
+        )
+        if not res["same_machine"]:
+            print(
+                f"WARNING: baseline from {res['baseline_machine']}, "
+                f"current run on {res['current_machine']}"
+            )
+        print("| benchmark | baseline ms | current ms | ratio | p(slower) | verdict |")
+        print("|---|---:|---:|---:|---:|---|")
+        for r in res["rows"]:
+            print(
+                f"| {r['name']} | {1e3 * r['baseline_median']:.4f} "
+                f"| {1e3 * r['current_median']:.4f} | {r['ratio']:.3f} "
+                f"| {r['p_slower']:.3g} | {r['verdict'].upper()} |"
+            )
+        if args.out:
+            write_json(Path(args.out), {**res, "current": current})
+        if res["regressions"]:
+            print("REGRESSION: " + ", ".join(res["regressions"]))
+            raise SystemExit(1)
+        print(f"OK: no significant slowdowns against {base_path}")
+        return
+
+    if args.cmd == "audit":
+        res = audit_run(Path(args.run), rtol=float(args.rtol))
+        for k, c in res["checks"].items():
+            flag = "OK" if c["ok"] else "MISMATCH"
+            print(f"{flag}: {k} recorded={c['recorded']} recomputed={c['recomputed']}")
+        if not res["ok"]:
+            raise SystemExit(1)
+        print(f"OK: {res['run']} matches its trajectory ({res['frames']} frames)")
+        return
+
+    if args.cmd == "serve":
+        from .serve import ServeConfig, serve
+
+        cfg = ServeConfig(
+            socket=Path(args.socket) if args.socket else None,
+            workers=int(args.workers),
+            warm=not args.no_warm,
+        )
+        serve(
+            cfg, ready=lambda s: print(f"OK: serving on {s.path} ({s.workers} workers)", flush=True)
+        )
+        return
+
+    if args.cmd == "client":
+        from .serve import client_main
+
+        if not args.command:
+            raise SystemExit("error: client needs a command, e.g. `client run --spec gs`")
+        path = Path(args.socket) if args.socket else None
+        client_main(args.command, path, fallback=not args.no_fallback)
+        return
+
     raise SystemExit(2)
@@ -1,17 +1,22 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
-from typing import Literal
+from typing import Any, Literal
 
 import numpy as np
 
 from .metrics import (
-    anisotropy_index,
-    kl_divergence,
-    localization_index,
-    peak_wavelength_from_profile,
-    radial_average,
+    anisotropy_index_batch,
+    localization_index_batch,
+    normalize_spectra,
+    peak_wavelength_batch,
+    radial_average_batch,
+    radial_geometry,
+    safe_log,
+    spectral_pipeline,
     structure_factor_2d,
+    structure_factor_batch,
 )
 
 Label = Literal["spots", "stripes", "radial", "blank", "unknown"]
@@ -25,6 +30,9 @@ class EvalConfig:
     anisotropy_stripe: float = 0.25
     localization_radial: float = 0.65
     blank_std: float = 1e-6
+    # streaming drift reduction: "exact" | "radial" | "downsample" (see DriftAccumulator)
+    drift_mode: str = "exact"
+    drift_factor: int = 4
 
 
 def classify_pattern(S: np.ndarray, u: np.ndarray, cfg: EvalConfig) -> Label:
@@ -35,57 +43,168 @@ def classify_pattern(S: np.ndarray, u: np.ndarray, cfg: EvalConfig) -> Label:
       - radial if highly localized
       - else spots
     """
-    if float(np.std(u)) <= cfg.blank_std:
-        return "blank"
-
-    a = anisotropy_index(S)
-    if a >= cfg.anisotropy_stripe:
-        return "stripes"
-
-    loc = localization_index(u, q=cfg.loc_q)
-    if loc >= cfg.localization_radial:
-        return "radial"
-
-    return "spots"
+    std = np.std(u, axis=(-2, -1))[None]
+    a = anisotropy_index_batch(np.asarray(S)[None])
+    loc = localization_index_batch(np.asarray(u)[None], q=cfg.loc_q)
+    return classify_batch(std, a, loc, cfg)[0]
+
+
+def classify_batch(
+    std: np.ndarray,
+    anisotropy: np.ndarray,
+    localization: np.ndarray,
+    cfg: EvalConfig,
+) -> list[Label]:
+    """
+    `classify_pattern` labels from per-member field std, anisotropy and
+    localization that the caller has already computed.
+    """
+    labels: list[Label] = []
+    for sd, a, loc in zip(std, anisotropy, localization, strict=True):
+        if float(sd) <= cfg.blank_std:
+            labels.append("blank")
+        elif a >= cfg.anisotropy_stripe:
+            labels.append("stripes")
+        elif loc >= cfg.localization_radial:
+            labels.append("radial")
+        else:
+            labels.append("spots")
+    return labels
 
 
 def eval_field(u: np.ndarray, cfg: EvalConfig) -> dict[str, float]:
     """
     Compute metrics for a single 2D field.
     """
-    S = structure_factor_2d(u)
-    r, prof = radial_average(S)
-    lam = peak_wavelength_from_profile(r, prof)
-    a = anisotropy_index(S)
-    loc = localization_index(u, q=cfg.loc_q)
+    m = eval_field_batch(np.asarray(u)[None], cfg)
+    return {
+        "lambda_star": float(m["lambda_star"][0]),
+        "anisotropy": float(m["anisotropy"][0]),
+        "localization": float(m["localization"][0]),
+        "label": str(m["label"][0]),
+    }
 
-    label = classify_pattern(S, u, cfg)
 
+def eval_field_batch(u: np.ndarray, cfg: EvalConfig) -> dict[str, Any]:
+    """
+    `eval_field` of every (N, N) field of a (B, N, N) stack (ensemble members,
+    snapshot series) in one pass: (B,) arrays `lambda_star`, `anisotropy`,
+    `localization` and a list of `label`s. The spectra, anisotropy and
+    localization are computed once and shared with the classification.
+    """
+    S = structure_factor_batch(u)
+    r, prof = radial_average_batch(S)
+    lam = peak_wavelength_batch(r, prof)
+    a = anisotropy_index_batch(S)
+    loc = localization_index_batch(u, q=cfg.loc_q)
     return {
-        "lambda_star": float(lam) if np.isfinite(lam) else float("nan"),
-        "anisotropy": float(a),
-        "localization": float(loc),
-        "label": str(label),
+        "lambda_star": np.where(np.isfinite(lam), lam, np.nan),
+        "anisotropy": a,
+        "localization": loc,
+        "label": classify_batch(np.std(u, axis=(-2, -1)), a, loc, cfg),
     }
 
 
-def eval_time_drift(fields_over_time: list[np.ndarray]) -> dict[str, float]:
+def eval_time_drift(
+    fields_over_time: Sequence[np.ndarray],
+    batch: int = 8,
+    dtype: np.dtype | type | None = None,
+) -> dict[str, float]:
     """
     Spectral drift over time using KL divergence between
     the last snapshot spectrum and earlier spectra (averaged).
+
+    Spectra are computed by `spectral_pipeline` in stacks of `batch` frames;
+    frames are fetched by slice, so a lazy sequence such as
+    `store.Trajectory.series(...)` is never fully loaded. `dtype` casts frames
+    before analysis (float64 metrics of a float32 trajectory).
     """
-    if len(fields_over_time) < 2:
+    n = len(fields_over_time)
+    if n < 2:
         return {"kl_mean_to_final": 0.0}
 
-    S_final = structure_factor_2d(fields_over_time[-1])
-    Sf = np.maximum(S_final, 0.0)
-    Sf = Sf / max(float(Sf.sum()), 1e-12)
+    Sf = normalize_spectra(structure_factor_2d(np.asarray(fields_over_time[n - 1], dtype=dtype)))
+    kls: list[np.ndarray] = []
+    for i in range(0, n - 1, batch):
+        stack = np.asarray(fields_over_time[i : min(i + batch, n - 1)], dtype=dtype)
+        kls.append(spectral_pipeline(stack, q=Sf)["kl_to_final"])
+    return {"kl_mean_to_final": float(np.mean(np.concatenate(kls)))}
+
+
+DRIFT_MODES = ("exact", "radial", "downsample")
+
 
-    kls: list[float] = []
-    for u in fields_over_time[:-1]:
-        S = structure_factor_2d(u)
-        S = np.maximum(S, 0.0)
-        S = S / max(float(S.sum()), 1e-12)
-        kls.append(kl_divergence(S, Sf))
+def _normalized_spectrum(u: np.ndarray) -> np.ndarray:
+    return normalize_spectra(structure_factor_2d(u))
+
+
+class DriftAccumulator:
+    """
+    Streaming form of `eval_time_drift`; memory does not depend on T.
+
+    KL(p_t || q) = sum p_t log p_t - sum p_t log q is linear in p_t apart from
+    the entropy term, so the mean over earlier frames only needs the running
+    sum of their normalized spectra and of their sum p log p. The newest frame
+    is held back as the candidate final spectrum q until another frame
+    arrives.
+
+    Modes (state size for an N x N field):
+      exact       N^2 floats; matches `eval_time_drift` up to summation order.
+      radial      ~0.71 N floats; spectra summed over integer-radius rings.
+      downsample  (N/factor)^2 floats; spectra summed over factor x factor blocks.
+
+    The reduced modes compute the KL divergence of the coarse-grained
+    distributions, which by the log-sum inequality never exceeds the exact
+    value; they coincide when p_t / q is constant within every bin. Radial
+    mode discards orientation (rotating patterns read as zero drift);
+    downsample keeps it at lower k-resolution.
+    """
 
-    return {"kl_mean_to_final": float(np.mean(kls)) if kls else 0.0}
+    def __init__(self, mode: str = "exact", factor: int = 4, eps: float = 1e-12) -> None:
+        if mode not in DRIFT_MODES:
+            raise ValueError(f"unknown drift mode {mode!r}; expected one of {DRIFT_MODES}")
+        if factor < 1:
+            raise ValueError(f"downsample factor must be >= 1, got {factor}")
+        self.mode = mode
+        self.factor = int(factor)
+        self.eps = eps
+        self.frames = 0
+        self._p_sum: np.ndarray | None = None
+        self._plogp = 0.0
+        self._pending: np.ndarray | None = None
+
+    def _reduce(self, p: np.ndarray) -> np.ndarray:
+        if self.mode == "radial":
+            return np.bincount(radial_geometry(p.shape).bins, weights=p.ravel())
+        if self.mode == "downsample":
+            f = self.factor
+            ny, nx = p.shape
+            if ny % f or nx % f:
+                raise ValueError(f"grid {p.shape} not divisible by downsample factor {f}")
+            return p.reshape(ny // f, f, nx // f, f).sum(axis=(1, 3))
+        return p
+
+    def add(self, u: np.ndarray) -> None:
+        if self._pending is not None:
+            self._commit(self._pending)
+        self._pending = self._reduce(_normalized_spectrum(u))
+        self.frames += 1
+
+    def _commit(self, S: np.ndarray) -> None:
+        # same guard/renormalization as kl_divergence: (near-)empty spectra contribute 0
+        sp = float(S.sum())
+        if self.eps >= sp:
+            return
+        p = S / sp
+        self._plogp += float((p * safe_log(p, self.eps)).sum())
+        self._p_sum = p if self._p_sum is None else self._p_sum + p
+
+    def result(self) -> dict[str, float]:
+        if self.frames < 2 or self._pending is None:
+            return {"kl_mean_to_final": 0.0}
+        sq = float(self._pending.sum())
+        if self.eps >= sq or self._p_sum is None:
+            return {"kl_mean_to_final": 0.0}
+        q = self._pending / sq
+        cross = float((self._p_sum * safe_log(q, self.eps)).sum())
+        return {"kl_mean_to_final": float((self._plogp - cross) / (self.frames - 1))}
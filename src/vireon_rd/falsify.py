@@ -4,6 +4,9 @@ from dataclasses import dataclass
 
 import numpy as np
 
+from .eval import EvalConfig
+from .metrics import kl_divergence, localization_index, structure_factor_2d
+from .sinks import SnapshotSink
 from .trp import TRPConfig, trp_score
 
 
@@ -17,6 +20,90 @@ class FalsifierConfig:
     forbid_blank: bool = True
 
 
+@dataclass(frozen=True)
+class ProbeConfig:
+    # in-flight gate probes (GateProbe): evaluated every `every` snapshots
+    every: int = 1
+    # consecutive settled probes required before stopping
+    patience: int = 3
+    # NonBlankGate: field std <= EvalConfig.blank_std and not rising
+    blank: bool = True
+    # LocalizationGate: localization below FalsifierConfig.min_localization and not rising
+    localization: bool = False
+    # pattern settled: KL between consecutive probe spectra below this (0: off)
+    stationary_kl: float = 0.0
+
+
+class GateProbe(SnapshotSink):
+    """
+    Cheap in-flight gate prediction on one field, run at snapshot cadence.
+
+    Each probe costs one std (plus one localization or one spectrum when those
+    probes are on). When a probe has been settled for `patience` consecutive
+    probes, `stop_reason` is set and the integrator stops the run with
+    status "early_stop":
+      blank         std <= blank_std and non-increasing: NonBlankGate will fail
+      localization  below the gate threshold and non-increasing: gate will fail
+      stationary    spectrum no longer changes: all gates are settled
+    """
+
+    def __init__(
+        self,
+        field: str,
+        cfg: ProbeConfig | None = None,
+        eval_cfg: EvalConfig | None = None,
+        fals_cfg: FalsifierConfig | None = None,
+    ) -> None:
+        self.field = field
+        self.cfg = ProbeConfig() if cfg is None else cfg
+        self.eval_cfg = EvalConfig() if eval_cfg is None else eval_cfg
+        self.fals_cfg = FalsifierConfig() if fals_cfg is None else fals_cfg
+        self.stop_reason: str | None = None
+        self._pushed = 0
+        self._std: list[float] = []
+        self._loc: list[float] = []
+        self._kl: list[float] = []
+        self._S: np.ndarray | None = None
+
+    def push(self, t: float, fields: dict[str, np.ndarray]) -> None:
+        self._pushed += 1
+        if (self._pushed - 1) % max(1, self.cfg.every) or self.stop_reason:
+            return
+        u = fields[self.field]
+        c = self.cfg
+        self._std.append(float(np.std(u)))
+        if c.localization:
+            self._loc.append(localization_index(u, q=self.eval_cfg.loc_q))
+        if c.stationary_kl > 0.0:
+            S = structure_factor_2d(u)
+            if self._S is not None:
+                self._kl.append(kl_divergence(self._S, S))
+            self._S = S
+        self.stop_reason = self._verdict(t)
+
+    def _settled(self, xs: list[float], below: float) -> bool:
+        last = xs[-self.cfg.patience :]
+        return (
+            len(last) == self.cfg.patience
+            and all(x <= below for x in last)
+            and all(b <= a for a, b in zip(last, last[1:], strict=False))
+        )
+
+    def _verdict(self, t: float) -> str | None:
+        c, n = self.cfg, self.cfg.patience
+        if c.blank and self._settled(self._std, self.eval_cfg.blank_std):
+            return f"NonBlankGate: std {self._std[-1]:.3g} <= {self.eval_cfg.blank_std:g} (t={t:g})"
+        if c.localization and self._settled(self._loc, self.fals_cfg.min_localization):
+            return (
+                f"LocalizationGate: localization {self._loc[-1]:.3g} "
+                f"< {self.fals_cfg.min_localization:g} (t={t:g})"
+            )
+        kl = self._kl[-n:]
+        if c.stationary_kl > 0.0 and len(kl) == n and max(kl) < c.stationary_kl:
+            return f"stationary: spectral KL {max(kl):.3g} < {c.stationary_kl:g} (t={t:g})"
+        return None
+
+
 def compute_RP_from_metrics(metrics: dict[str, float]) -> tuple[float, float]:
     """
     Define R and P from metrics.
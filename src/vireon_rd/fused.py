@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import numpy as np
+
+from .specs import BACKENDS, GrayScottSpec, SQKModelGSpec
+
+try:  # optional: compiled fused kernels
+    import numba
+except ImportError:  # pragma: no cover - depends on the environment
+    numba = None
+
+HAVE_NUMBA = numba is not None
+
+if HAVE_NUMBA:
+    _jit = numba.njit(parallel=True, cache=True)
+    prange = numba.prange
+else:
+    # same kernels as plain Python loops: slow, only used to check them without numba
+    def _jit(f):
+        return f
+
+    prange = range
+
+
+def resolve_backend(backend: str, scheme: str = "euler") -> str:
+    """
+    Stepping backend actually used for `GridSpec.backend` / `scheme`.
+
+    "auto" picks "numba" when it is installed and the scheme has fused kernels
+    (Euler only), else "numpy". Asking for "numba" without it is an error.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend: {backend!r} (use one of {BACKENDS})")
+    if backend == "numpy":
+        return "numpy"
+    if backend == "auto":
+        return "numba" if HAVE_NUMBA and scheme == "euler" else "numpy"
+    if not HAVE_NUMBA:
+        raise ValueError("backend 'numba' needs numba installed (pip install numba)")
+    if scheme != "euler":
+        raise ValueError(f"backend 'numba' only covers scheme 'euler', not {scheme!r}")
+    return "numba"
+
+
+@_jit
+def sqk_euler_step(
+    G: np.ndarray,
+    X: np.ndarray,
+    Y: np.ndarray,
+    G1: np.ndarray,
+    X1: np.ndarray,
+    Y1: np.ndarray,
+    chi: np.ndarray,
+    forced: bool,
+    p: np.ndarray,
+    dx: float,
+    dt: float,
+) -> None:
+    """
+    One fused SQK Euler step on (B, N, N) stacks: 5-point periodic Laplacians,
+    reactions, forcing and the update in a single pass, rows in parallel.
+
+    p = (Dg, Dx, Dy, alpha_g, alpha_x, alpha_y, beta_g, beta_x, beta_y, c1, c2).
+    Writes the new state into G1, X1, Y1.
+    """
+    B, N, M = G.shape
+    h2 = dx * dx
+    for r in prange(B * N):
+        b = r // N
+        i = r % N
+        im = i - 1 if i > 0 else N - 1
+        ip = i + 1 if i < N - 1 else 0
+        for j in range(M):
+            jm = j - 1 if j > 0 else M - 1
+            jp = j + 1 if j < M - 1 else 0
+            g = G[b, i, j]
+            x = X[b, i, j]
+            y = Y[b, i, j]
+            lg = (G[b, im, j] + G[b, ip, j] + G[b, i, jm] + G[b, i, jp] - 4.0 * g) / h2
+            lx = (X[b, im, j] + X[b, ip, j] + X[b, i, jm] + X[b, i, jp] - 4.0 * x) / h2
+            ly = (Y[b, im, j] + Y[b, ip, j] + Y[b, i, jm] + Y[b, i, jp] - 4.0 * y) / h2
+            q = (x + p[9]) * (x + p[9]) * (y + p[10])
+            dg = p[0] * lg + p[3] * q - p[6] * g
+            dxx = p[1] * lx + p[4] * q - p[7] * x
+            if forced:
+                dxx += chi[i, j]
+            dy = p[2] * ly + p[5] * q - p[8] * y
+            G1[b, i, j] = g + dt * dg
+            X1[b, i, j] = x + dt * dxx
+            Y1[b, i, j] = y + dt * dy
+
+
+@_jit
+def grayscott_euler_step(
+    U: np.ndarray,
+    V: np.ndarray,
+    U1: np.ndarray,
+    V1: np.ndarray,
+    p: np.ndarray,
+    dx: float,
+    dt: float,
+) -> None:
+    """
+    One fused Gray–Scott Euler step on (B, N, N) stacks; p = (Du, Dv, F, k).
+    Writes the new state into U1, V1.
+    """
+    B, N, M = U.shape
+    h2 = dx * dx
+    for r in prange(B * N):
+        b = r // N
+        i = r % N
+        im = i - 1 if i > 0 else N - 1
+        ip = i + 1 if i < N - 1 else 0
+        for j in range(M):
+            jm = j - 1 if j > 0 else M - 1
+            jp = j + 1 if j < M - 1 else 0
+            u = U[b, i, j]
+            v = V[b, i, j]
+            lu = (U[b, im, j] + U[b, ip, j] + U[b, i, jm] + U[b, i, jp] - 4.0 * u) / h2
+            lv = (V[b, im, j] + V[b, ip, j] + V[b, i, jm] + V[b, i, jp] - 4.0 * v) / h2
+            uv2 = u * v * v
+            U1[b, i, j] = u + dt * (p[0] * lu - uv2 + p[2] * (1.0 - u))
+            V1[b, i, j] = v + dt * (p[1] * lv + uv2 - (p[2] + p[3]) * v)
+
+
+def sqk_params(s: SQKModelGSpec) -> np.ndarray:
+    return np.array(
+        [
+            s.Dg,
+            s.Dx,
+            s.Dy,
+            s.alpha_g,
+            s.alpha_x,
+            s.alpha_y,
+            s.beta_g,
+            s.beta_x,
+            s.beta_y,
+            s.c1,
+            s.c2,
+        ],
+        dtype=np.float64,
+    )
+
+
+def grayscott_params(spec: GrayScottSpec) -> np.ndarray:
+    return np.array([spec.Du, spec.Dv, spec.F, spec.k], dtype=np.float64)
@@ -71,6 +71,8 @@ def write_report_md(
             lines.append(f"- **stop_step**: `{stop_step}`")
         if stop_time is not None:
             lines.append(f"- **stop_time**: `{stop_time}`")
+        if meta.get("stop_reason"):
+            lines.append(f"- **stop_reason**: `{meta['stop_reason']}`")
         lines.append("")
 
     lines.append("## Meta")
@@ -1,10 +1,69 @@
 from __future__ import annotations
 
 import math
+from dataclasses import dataclass
+from functools import lru_cache
 
 import numpy as np
 
 
+@dataclass(frozen=True)
+class RadialGeometry:
+    """
+    Per-shape Fourier-plane geometry shared by the radial and moment metrics.
+    Arrays are read-only: instances are cached and shared between callers.
+    """
+
+    bins: np.ndarray  # (ny*nx,) radial bin of each flattened pixel
+    counts: np.ndarray  # (R,) pixels per bin
+    r: np.ndarray  # (R,) bin coordinate: index radius, or |k| when dx is given
+    gx: np.ndarray  # (ny, nx) x - cx
+    gy: np.ndarray  # (ny, nx) y - cy
+
+
+@lru_cache(maxsize=32)
+def radial_geometry(
+    shape: tuple[int, int],
+    dx: float | None = None,
+    bin_width: float = 1.0,
+) -> RadialGeometry:
+    """
+    Radial binning about the fftshift centre, LRU-cached per (shape, dx, bin_width).
+
+    Without `dx`, bins are floor(r / bin_width) of the index radius and `r`
+    holds their lower edges (bin_width=1 is the original integer binning).
+    With `dx`, radii are physical wavenumbers |k| (kx = 2π i / (nx dx),
+    ky = 2π j / (ny dx)) binned in widths of bin_width * 2π / (max(ny, nx) dx);
+    on square grids the bins are the same and only `r` is rescaled.
+    """
+    ny, nx = shape
+    if bin_width <= 0.0:
+        raise ValueError(f"bin_width must be > 0, got {bin_width}")
+    y, x = np.indices((ny, nx))
+    gx = x - (nx - 1) / 2.0
+    gy = y - (ny - 1) / 2.0
+    if dx is None:
+        r = np.sqrt(gx**2 + gy**2)
+        unit = 1.0
+    else:
+        # radius in steps of the finest k-spacing; equals the index radius on square grids
+        m = max(ny, nx)
+        r = np.sqrt((gx * (m / nx)) ** 2 + (gy * (m / ny)) ** 2)
+        unit = 2.0 * math.pi / (m * dx)
+    bins = (r if bin_width == 1.0 else r / bin_width).astype(int).ravel()
+    counts = np.bincount(bins).astype(float)
+    coords = np.arange(counts.size, dtype=float) * (bin_width * unit)
+    for a in (bins, counts, coords, gx, gy):
+        a.setflags(write=False)
+    return RadialGeometry(bins=bins, counts=counts, r=coords, gx=gx, gy=gy)
+
+
+def _real(x: np.ndarray) -> np.ndarray:
+    # float32 input stays float32 (GridSpec.precision="float32"); anything else is float64
+    x = np.asarray(x)
+    return x if x.dtype == np.float32 else x.astype(float, copy=False)
+
+
 def safe_log(x: np.ndarray, eps: float = 1e-12) -> np.ndarray:
     return np.log(np.maximum(x, eps))
 
@@ -13,8 +72,8 @@ def kl_divergence(p: np.ndarray, q: np.ndarray, eps: float = 1e-12) -> float:
     """
     D_KL(p||q) for discrete distributions (nonnegative, not necessarily normalized).
     """
-    p = np.asarray(p, dtype=float)
-    q = np.asarray(q, dtype=float)
+    p = _real(p)
+    q = _real(q)
     p = np.maximum(p, 0.0)
     q = np.maximum(q, 0.0)
     sp = float(p.sum())
@@ -30,39 +89,138 @@ def structure_factor_2d(u: np.ndarray) -> np.ndarray:
     """
     S(kx,ky) = |FFT(u - mean(u))|^2
     """
-    x = np.asarray(u, dtype=float)
-    x = x - float(x.mean())
-    F = np.fft.fft2(x)
-    S = np.abs(F) ** 2
-    return np.fft.fftshift(S)
+    return structure_factor_batch(u)
+
 
+def structure_factor_batch(u: np.ndarray) -> np.ndarray:
+    """
+    fftshifted structure factor of every (N, M) field in a (..., N, M) stack.
 
-def radial_average(S: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    One batched `rfft2` over the last two axes; the negative-kx half-plane is
+    rebuilt from Hermitian symmetry |F(-k)| = |F(k)| of real input instead of
+    being transformed.
+    """
+    x = _real(u)
+    x = x - x.mean(axis=(-2, -1), keepdims=True)
+    F = np.fft.rfft2(x)
+    half = F.real * F.real
+    half += F.imag * F.imag
+    ny, nx = x.shape[-2:]
+    m = half.shape[-1]
+    S = np.empty(x.shape, dtype=x.dtype)
+    S[..., :m] = half
+    # column kx (m <= kx < nx) mirrors column nx - kx at row -ky (mod ny)
+    S[..., 0, m:] = half[..., 0, nx - m : 0 : -1]
+    S[..., 1:, m:] = half[..., :0:-1, nx - m : 0 : -1]
+    return np.fft.fftshift(S, axes=(-2, -1))
+
+
+def normalize_spectra(S: np.ndarray) -> np.ndarray:
+    """
+    Clip to >= 0 and scale each (N, M) spectrum of a (..., N, M) stack to unit sum.
+    """
+    S = np.maximum(S, 0.0)
+    return S / np.maximum(S.sum(axis=(-2, -1), keepdims=True), 1e-12)
+
+
+def kl_divergence_batch(p: np.ndarray, q: np.ndarray, eps: float = 1e-12) -> np.ndarray:
+    """
+    `kl_divergence(p[t], q)` for every leading index t of a (T, N, M) stack.
+    """
+    p = np.maximum(_real(p), 0.0)
+    q = np.maximum(_real(q), 0.0)
+    sp = p.sum(axis=(-2, -1))
+    sq = float(q.sum())
+    if eps >= sq:
+        return np.zeros(sp.shape)
+    p /= np.maximum(sp, eps)[..., None, None]
+    log_q = safe_log(q / sq, eps)
+    d = safe_log(p, eps)
+    d -= log_q
+    d *= p
+    return np.where(sp > eps, d.sum(axis=(-2, -1)), 0.0)
+
+
+def radial_average_batch(
+    S: np.ndarray,
+    dx: float | None = None,
+    bin_width: float = 1.0,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    `radial_average` of every (N, M) spectrum of a (T, N, M) stack: (r, (T, R) profiles).
+    """
+    S = np.asarray(S, dtype=float)
+    T, ny, nx = S.shape
+    geo = radial_geometry((ny, nx), dx, bin_width)
+    R = geo.counts.size
+    bins = (geo.bins[None, :] + R * np.arange(T)[:, None]).ravel()
+    prof = np.bincount(bins, weights=S.reshape(T, -1).ravel(), minlength=T * R).reshape(T, R)
+    return geo.r, prof / np.maximum(geo.counts, 1.0)
+
+
+def peak_wavelength_batch(r: np.ndarray, prof: np.ndarray) -> np.ndarray:
+    """
+    `peak_wavelength_from_profile` for each row of a (T, R) profile stack.
+    """
+    r = np.asarray(r, dtype=float)
+    prof = np.asarray(prof, dtype=float)
+    if prof.shape[-1] < 5:
+        return np.full(prof.shape[0], np.nan)
+    start = min(3, prof.shape[-1] - 1)
+    k = r[np.argmax(prof[:, start:], axis=-1) + start]
+    with np.errstate(divide="ignore"):
+        return np.where(k > 0.0, 2.0 * math.pi / k, np.nan)
+
+
+def spectral_pipeline(
+    stack: np.ndarray,
+    q: np.ndarray | None = None,
+    lambda_star: bool = False,
+) -> dict[str, np.ndarray]:
+    """
+    Batched spectral analysis of a (T, N, M) field stack.
+
+    Returns
+      spectra      (T, N, M) normalized fftshifted structure factors
+      kl_to_final  (T,) KL(spectrum_t || q); `q` defaults to the last frame's spectrum
+      lambda_star  (T,) peak wavelengths (only with `lambda_star=True`)
+    """
+    S = structure_factor_batch(stack)
+    p = normalize_spectra(S)
+    out = {
+        "spectra": p,
+        "kl_to_final": kl_divergence_batch(p, p[-1] if q is None else q),
+    }
+    if lambda_star:
+        r, prof = radial_average_batch(S)
+        out["lambda_star"] = peak_wavelength_batch(r, prof)
+    return out
+
+
+def radial_average(
+    S: np.ndarray,
+    dx: float | None = None,
+    bin_width: float = 1.0,
+) -> tuple[np.ndarray, np.ndarray]:
     """
     Radial average of a 2D array around its center.
-    Returns (r, profile) with integer radii bins.
+    Returns (r, profile); by default r are integer radii (index units).
+    With `dx` the bins are physical wavenumbers |k| (see `radial_geometry`);
+    `bin_width` < 1 gives sub-integer bins.
     """
     S = np.asarray(S, dtype=float)
-    ny, nx = S.shape
-    cy = (ny - 1) / 2.0
-    cx = (nx - 1) / 2.0
-    y, x = np.indices((ny, nx))
-    r = np.sqrt((x - cx) ** 2 + (y - cy) ** 2)
-    r_int = r.astype(int)
-    r_max = int(r_int.max())
-    prof = np.zeros(r_max + 1, dtype=float)
-    cnt = np.zeros(r_max + 1, dtype=float)
-    np.add.at(prof, r_int, S)
-    np.add.at(cnt, r_int, 1.0)
-    prof = prof / np.maximum(cnt, 1.0)
-    return np.arange(r_max + 1, dtype=float), prof
+    geo = radial_geometry(S.shape, dx, bin_width)
+    prof = np.bincount(geo.bins, weights=S.ravel(), minlength=geo.counts.size)
+    prof = prof / np.maximum(geo.counts, 1.0)
+    return geo.r, prof
 
 
 def peak_wavelength_from_profile(r: np.ndarray, prof: np.ndarray) -> float:
     """
     Estimate dominant wavelength λ* from peak radius in the radial spectrum.
 
-    Uses k_index ~= r_peak, so λ* ~ 2π / k_peak in index-units.
+    Uses k_index ~= r_peak, so λ* ~ 2π / k_peak in index-units
+    (physical units if `r` are wavenumbers from `radial_average(..., dx=)`).
     If peak is at 0 or too flat, returns NaN.
     """
     r = np.asarray(r, dtype=float)
@@ -84,21 +242,28 @@ def anisotropy_index(S: np.ndarray, eps: float = 1e-12) -> float:
     Simple anisotropy proxy from second moments around center in Fourier domain.
     0 ~ isotropic; larger => more directional.
     """
-    S = np.asarray(S, dtype=float)
-    ny, nx = S.shape
-    cy = (ny - 1) / 2.0
-    cx = (nx - 1) / 2.0
-    y, x = np.indices((ny, nx))
+    return float(anisotropy_index_batch(np.asarray(S)[None], eps)[0])
+
+
+def anisotropy_index_batch(S: np.ndarray, eps: float = 1e-12) -> np.ndarray:
+    """
+    `anisotropy_index` of every (N, M) spectrum of a (B, N, M) stack.
+    """
+    S = _real(S)
+    geo = radial_geometry(S.shape[-2:])
     w = np.maximum(S, 0.0)
-    Z = float(w.sum())
-    if eps >= Z:
-        return 0.0
-    dx = x - cx
-    dy = y - cy
-    mxx = float((w * dx * dx).sum()) / Z
-    myy = float((w * dy * dy).sum()) / Z
-    # normalized difference
-    return float(abs(mxx - myy) / (mxx + myy + eps))
+    B = w.shape[0]
+    # each sum runs over one contiguous flattened row: the same pairwise order as .sum()
+    # of a single field, so the B=1 wrapper reproduces the per-field formula bit for bit
+    Z = w.reshape(B, -1).sum(axis=-1).astype(float)
+    # only a (near-)zero spectrum is 0.0; a nan / inf total propagates as in the per-field formula
+    blank = eps >= Z
+    safe = np.where(blank, 1.0, Z)
+    with np.errstate(invalid="ignore"):
+        mxx = (w * geo.gx * geo.gx).reshape(B, -1).sum(axis=-1).astype(float) / safe
+        myy = (w * geo.gy * geo.gy).reshape(B, -1).sum(axis=-1).astype(float) / safe
+        # normalized difference
+        return np.where(blank, 0.0, np.abs(mxx - myy) / (mxx + myy + eps))
 
 
 def localization_index(u: np.ndarray, q: float = 0.95, eps: float = 1e-12) -> float:
@@ -106,13 +271,22 @@ def localization_index(u: np.ndarray, q: float = 0.95, eps: float = 1e-12) -> fl
     How concentrated is the field energy?
     Returns fraction of L2 energy contained in top-q pixels (by |u|).
     """
-    x = np.asarray(u, dtype=float)
-    e = x * x
-    total = float(e.sum())
-    if eps >= total:
-        return 0.0
-    flat = np.sort(e.ravel())
-    k = int(max(1, round((1.0 - q) * flat.size)))
+    return float(localization_index_batch(np.asarray(u)[None], q, eps)[0])
+
+
+def localization_index_batch(u: np.ndarray, q: float = 0.95, eps: float = 1e-12) -> np.ndarray:
+    """
+    `localization_index` of every (N, M) field of a (B, N, M) stack.
+
+    Each row of pixel energies is sorted and its top-q share summed in sorted
+    order (in the input dtype), exactly as the single-field definition does.
+    """
+    x = _real(u)
+    e = (x * x).reshape(x.shape[0], -1)
+    total = e.sum(axis=-1).astype(np.float64)
+    k = int(max(1, round((1.0 - q) * e.shape[-1])))
     # top-q => drop lowest (1-q)
-    top = float(flat[k:].sum())
-    return float(top / total)
+    top = np.sort(e, axis=-1)[:, k:].sum(axis=-1).astype(np.float64)
+    blank = eps >= total  # nan / inf totals propagate
+    with np.errstate(invalid="ignore"):
+        return np.where(blank, 0.0, top / np.where(blank, 1.0, total))
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import os
+import sys
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from typing import TypeVar
+
+from threadpoolctl import threadpool_info, threadpool_limits
+
+T = TypeVar("T")
+
+# native thread pools that would otherwise oversubscribe a box running one job per core
+THREAD_ENV_VARS = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+    "NUMBA_NUM_THREADS",
+)
+
+
+def pin_threads(n: int = 1) -> None:
+    """
+    Pin BLAS/FFT/OpenMP thread pools of the current process to `n` threads.
+
+    Environment variables cover libraries loaded after this call; pools that
+    are already loaded (e.g. NumPy's BLAS inherited by a forked pool worker)
+    are limited through threadpoolctl.
+    """
+    for k in THREAD_ENV_VARS:
+        os.environ[k] = str(n)
+    numba = sys.modules.get("numba")
+    if numba is not None:
+        # fused kernels (backend "numba") imported before the fork
+        numba.set_num_threads(min(n, numba.config.NUMBA_NUM_THREADS))
+    threadpool_limits(limits=n)
+
+
+def native_threads() -> dict[str, int]:
+    """
+    Thread count of every native thread pool loaded in this process, by library API.
+    """
+    return {i["internal_api"]: int(i["num_threads"]) for i in threadpool_info()}
+
+
+def make_pool(jobs: int) -> ProcessPoolExecutor:
+    """
+    Process pool whose workers run single-threaded native code.
+    """
+    return ProcessPoolExecutor(max_workers=max(1, int(jobs)), initializer=pin_threads)
+
+
+@lru_cache(maxsize=4)
+def thread_pool(threads: int) -> ThreadPoolExecutor:
+    """
+    Process-wide thread pool of `threads` workers (NumPy ufuncs release the GIL).
+    """
+    return ThreadPoolExecutor(max_workers=max(1, int(threads)), thread_name_prefix="vireon-rd")
+
+
+def split_chunks(items: Sequence[T], n: int) -> list[list[T]]:
+    """
+    Split `items` into at most `n` contiguous, non-empty, near-equal chunks.
+    """
+    n = max(1, min(int(n), len(items)))
+    size, extra = divmod(len(items), n)
+    out: list[list[T]] = []
+    start = 0
+    for i in range(n):
+        stop = start + size + (1 if i < extra else 0)
+        out.append(list(items[start:stop]))
+        start = stop
+    return [c for c in out if c]
@@ -0,0 +1,543 @@
+from __future__ import annotations
+
+import fnmatch
+import gc
+import hashlib
+import math
+import os
+import platform
+import re
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable, Collection, Sequence
+from dataclasses import asdict, dataclass, replace
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from .engine import ENGINE_VERSION, run_one, run_suite
+from .eval import eval_time_drift
+from .fused import HAVE_NUMBA
+from .metrics import anisotropy_index, localization_index, radial_average, structure_factor_2d
+from .numerics import forcing_field, init_grayscott, init_sqk, laplacian_periodic
+from .sim import _make_stepper, _SQKEuler
+from .specs import ForcingSpec, GrayScottSpec, GridSpec, SQKModelGSpec, get_spec
+
+PERF_VERSION = 1
+
+# default location of machine-tagged baselines: <dir>/<machine tag>.json
+BASELINE_DIR = "benchmarks"
+
+# "legacy" cases time the reference implementations that optimised kernels replaced, named
+# LEGACY_PREFIX + the matching micro case; they are not part of a default baseline
+KINDS = ("micro", "macro", "legacy")
+DEFAULT_KINDS = ("micro", "macro")
+LEGACY_PREFIX = "legacy:"
+
+# forcing_term cases: (ForcingSpec, t)
+FORCING_CASES = {
+    "static": (ForcingSpec(), 10.0),
+    "cutoff": (ForcingSpec(cutoff=1e-8), 59.0),  # off-pulse: below the cutoff, skipped
+    "moving": (ForcingSpec(centers=((0.0, 0.0), (5.0, 0.0)), velocity=(0.5, 0.0)), 10.0),
+}
+
+
+@dataclass(frozen=True)
+class PerfConfig:
+    """
+    Which benchmarks `run_perf` runs and how often it samples them.
+    """
+
+    kinds: tuple[str, ...] = DEFAULT_KINDS
+    sizes: tuple[int, ...] = (64, 128, 256)  # micro / legacy benchmark grids
+    threads: tuple[int, ...] = (1,)  # micro: also time row-block threaded Euler steps at these
+    macro_sizes: tuple[int, ...] = (32, 64)  # run_one / run_suite grids
+    macro_T: float = 10.0  # simulated time of the macro runs
+    macro_seeds: tuple[int, ...] = (1, 2, 3)  # run_suite seeds
+    repeats: int = 7  # samples per benchmark
+    min_time: float = 0.1  # micro: calls per sample are raised until a sample takes this long
+    filter: str = ""  # fnmatch pattern on benchmark names ("" = all)
+
+
+@dataclass(frozen=True)
+class PerfCase:
+    name: str
+    kind: str
+    # setup(workdir) -> the timed callable; setup itself is not timed
+    setup: Callable[[Path], Callable[[], object]]
+
+
+def machine_info() -> dict[str, Any]:
+    """
+    What a baseline was measured on, plus a short `tag` naming the machine.
+
+    The tag covers the CPU model and count and the Python / NumPy versions,
+    which all move timings; baselines are only comparable within one tag.
+    """
+    cpu = platform.processor() or platform.machine()
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8") as f:
+            names = [ln.split(":", 1)[1].strip() for ln in f if ln.startswith("model name")]
+        cpu = names[0] if names else cpu
+    except OSError:
+        pass
+    info = {
+        "system": platform.system(),
+        "machine": platform.machine(),
+        "cpu": cpu,
+        "cpus": os.cpu_count() or 1,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+    }
+    py = ".".join(platform.python_version_tuple()[:2])
+    key = "|".join([str(info["cpu"]), str(info["cpus"]), py, str(info["numpy"])])
+    digest = hashlib.sha256(key.encode()).hexdigest()[:8]
+    slug = re.sub(r"[^a-z0-9_]+", "-", f"{info['system']}-{info['machine']}".lower())
+    info["tag"] = f"{slug}-{info['cpus']}cpu-{digest}"
+    return info
+
+
+def _micro(name: str, make: Callable[[], Callable[[], object]]) -> PerfCase:
+    return PerfCase(name, "micro", lambda _: make())
+
+
+def _inputs(N: int) -> tuple[np.ndarray, list[np.ndarray], np.ndarray]:
+    # one field, 16 frames and the field's structure factor, the same for every kind
+    rng = np.random.default_rng(N)
+    u = rng.random((N, N))
+    frames = [rng.random((N, N)) for _ in range(16)]
+    return u, frames, structure_factor_2d(u)
+
+
+def micro_cases(sizes: Sequence[int], threads: Sequence[int] = (1,)) -> list[PerfCase]:
+    """
+    Kernel-level benchmarks: metrics, forcing, the Laplacian and one Euler
+    step (serial, row-block threaded for each of `threads` > 1, and fused
+    when numba is installed).
+    """
+    cases: list[PerfCase] = []
+    for N in sizes:
+        u, frames, S = _inputs(N)
+        fs = ForcingSpec()
+        L = float(N) / 3.2
+        cases += [
+            _micro(f"laplacian_periodic[N={N}]", lambda u=u: lambda: laplacian_periodic(u, 0.5)),
+            _micro(
+                f"forcing_field[N={N}]",
+                lambda N=N, L=L, fs=fs: lambda: forcing_field(N, L, 10.0, fs),
+            ),
+            _micro(f"structure_factor_2d[N={N}]", lambda u=u: lambda: structure_factor_2d(u)),
+            _micro(f"radial_average[N={N}]", lambda S=S: lambda: radial_average(S)),
+            _micro(f"anisotropy_index[N={N}]", lambda S=S: lambda: anisotropy_index(S)),
+            _micro(f"localization_index[N={N}]", lambda u=u: lambda: localization_index(u)),
+            _micro(
+                f"eval_time_drift[N={N},frames=16]", lambda f=frames: lambda: eval_time_drift(f)
+            ),
+        ]
+        for case, (fs, t) in FORCING_CASES.items():
+            cases.append(
+                _micro(f"forcing_term[{case},N={N}]", lambda N=N, fs=fs, t=t: _forcing(N, fs, t))
+            )
+        for model, spec in _bench_specs(N, 1e9).items():
+            cases.append(_micro(f"euler_step[{model},N={N}]", lambda s=spec: _stepper(s)))
+            for k in (k for k in threads if k > 1):
+                name = f"euler_step[{model},N={N},threads={k}]"
+                cases.append(_micro(name, lambda s=spec, k=k: _stepper(s, threads=k)))
+            if HAVE_NUMBA:
+                fused = replace(spec, grid=replace(spec.grid, backend="numba"))
+                cases.append(_micro(f"fused_step[{model},N={N}]", lambda s=fused: _stepper(s)))
+    return cases
+
+
+def _forcing(N: int, fs: ForcingSpec, t: float) -> Callable[[], object]:
+    # what an SQK Euler step does for χ: rows from the cached basis, added into the X tendency
+    spec = SQKModelGSpec(grid=GridSpec(N=N, L=float(N) / 3.2), forcing=fs)
+    stepper = _SQKEuler(spec, init_sqk(spec, seed=1))
+    out = np.zeros((N, N))
+
+    def add() -> None:
+        chi = stepper._forcing_term(t)
+        if chi is not None:
+            np.add(out, chi, out=out)
+
+    return add
+
+
+def _bench_specs(N: int, T: float) -> dict[str, SQKModelGSpec | GrayScottSpec]:
+    # spec defaults on an N grid; c1/c2 keep SQK from blowing up, so every run does full work
+    specs: dict[str, SQKModelGSpec | GrayScottSpec] = {}
+    for name in ("sqk", "gs"):
+        spec = get_spec(name)
+        if isinstance(spec, SQKModelGSpec):
+            spec = replace(spec, c1=0.5, c2=0.3)
+        specs[name] = replace(spec, grid=replace(spec.grid, N=int(N), T=float(T)))
+    return specs
+
+
+def _stepper(spec: SQKModelGSpec | GrayScottSpec, threads: int = 1) -> Callable[[], object]:
+    model = "sqk" if isinstance(spec, SQKModelGSpec) else "gs"
+    init = init_sqk(spec, seed=1) if model == "sqk" else init_grayscott(spec, seed=1)
+    stepper = _make_stepper(model, spec, tuple(a[None] for a in init), threads=threads)
+    clock = [0.0]
+
+    def step() -> None:
+        stepper.step(clock[0])
+        clock[0] += spec.grid.dt
+
+    return step
+
+
+# reference implementations replaced by the optimised kernels (kind "legacy")
+
+
+def _legacy_sqk_step(spec: SQKModelGSpec, state: tuple, t: float) -> tuple:
+    # the original roll-based Euler step
+    G, X, Y = state
+    N, L, dt = spec.grid.N, spec.grid.L, spec.grid.dt
+    dx = L / N
+    chi = _legacy_forcing_field(N, L, t, spec.forcing)
+    Q = (X + spec.c1) ** 2 * (Y + spec.c2)
+    dG = spec.Dg * laplacian_periodic(G, dx) + spec.alpha_g * Q - spec.beta_g * G
+    dX = spec.Dx * laplacian_periodic(X, dx) + spec.alpha_x * Q - spec.beta_x * X + chi
+    dY = spec.Dy * laplacian_periodic(Y, dx) + spec.alpha_y * Q - spec.beta_y * Y
+    return G + dt * dG, X + dt * dX, Y + dt * dY
+
+
+def _legacy_gs_step(spec: GrayScottSpec, state: tuple, t: float) -> tuple:
+    u, v = state
+    dx = spec.grid.L / spec.grid.N
+    uv2 = u * v * v
+    du = spec.Du * laplacian_periodic(u, dx) - uv2 + spec.F * (1.0 - u)
+    dv = spec.Dv * laplacian_periodic(v, dx) + uv2 - (spec.F + spec.k) * v
+    return u + spec.grid.dt * du, v + spec.grid.dt * dv
+
+
+def _legacy_radial_average(S: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # per-call geometry + np.add.at
+    ny, nx = S.shape
+    y, x = np.indices((ny, nx))
+    r = np.sqrt((x - (nx - 1) / 2.0) ** 2 + (y - (ny - 1) / 2.0) ** 2)
+    r_int = r.astype(int)
+    r_max = int(r_int.max())
+    prof = np.zeros(r_max + 1, dtype=float)
+    cnt = np.zeros(r_max + 1, dtype=float)
+    np.add.at(prof, r_int, S)
+    np.add.at(cnt, r_int, 1.0)
+    return np.arange(r_max + 1, dtype=float), prof / np.maximum(cnt, 1.0)
+
+
+def _legacy_anisotropy_index(S: np.ndarray, eps: float = 1e-12) -> float:
+    # per-call coordinate grids
+    ny, nx = S.shape
+    y, x = np.indices((ny, nx))
+    w = np.maximum(S, 0.0)
+    Z = float(w.sum())
+    dx = x - (nx - 1) / 2.0
+    dy = y - (ny - 1) / 2.0
+    mxx = float((w * dx * dx).sum()) / Z
+    myy = float((w * dy * dy).sum()) / Z
+    return float(abs(mxx - myy) / (mxx + myy + eps))
+
+
+def _legacy_localization_index(u: np.ndarray, q: float = 0.95) -> float:
+    e = u * u
+    flat = np.sort(e.ravel())
+    k = int(max(1, round((1.0 - q) * flat.size)))
+    return float(flat[k:].sum() / e.sum())
+
+
+def _legacy_forcing_field(N: int, L: float, t: float, fs: ForcingSpec) -> np.ndarray:
+    # meshgrid + Gaussian rebuilt on every call (single centred source only)
+    dx = L / N
+    x = (np.arange(N) - (N - 1) / 2.0) * dx
+    X, Y = np.meshgrid(x, x, indexing="xy")
+    r2 = X * X + Y * Y
+    spatial = np.exp(-0.5 * r2 / (fs.sigma_r * fs.sigma_r))
+    temporal = np.exp(-0.5 * ((t - fs.t0) ** 2) / (fs.sigma_t * fs.sigma_t))
+    return -fs.scale * spatial * temporal
+
+
+def _legacy(name: str, make: Callable[[], Callable[[], object]]) -> PerfCase:
+    return PerfCase(LEGACY_PREFIX + name, "legacy", lambda _: make())
+
+
+def _legacy_stepper(spec: SQKModelGSpec | GrayScottSpec) -> Callable[[], object]:
+    sqk = isinstance(spec, SQKModelGSpec)
+    step = _legacy_sqk_step if sqk else _legacy_gs_step
+    box = [init_sqk(spec, seed=1) if sqk else init_grayscott(spec, seed=1), 0.0]
+
+    def run() -> None:
+        box[0] = step(spec, box[0], box[1])
+        box[1] += spec.grid.dt
+
+    return run
+
+
+def legacy_cases(sizes: Sequence[int]) -> list[PerfCase]:
+    """
+    The pre-optimisation forms of the metric, forcing and Euler-step micro
+    cases, on the same inputs (moving forcing has no legacy form).
+    """
+    cases: list[PerfCase] = []
+    for N in sizes:
+        u, _, S = _inputs(N)
+        L = float(N) / 3.2
+        cases += [
+            _legacy(f"radial_average[N={N}]", lambda S=S: lambda: _legacy_radial_average(S)),
+            _legacy(f"anisotropy_index[N={N}]", lambda S=S: lambda: _legacy_anisotropy_index(S)),
+            _legacy(
+                f"localization_index[N={N}]", lambda u=u: lambda: _legacy_localization_index(u)
+            ),
+        ]
+        for case in ("static", "cutoff"):
+            fs, t = FORCING_CASES[case]
+
+            def rebuild(N: int = N, L: float = L, fs: ForcingSpec = fs, t: float = t) -> Any:
+                out = np.zeros((N, N))
+                return lambda: np.add(out, _legacy_forcing_field(N, L, t, fs), out=out)
+
+            cases.append(_legacy(f"forcing_term[{case},N={N}]", rebuild))
+        for model, spec in _bench_specs(N, 1e9).items():
+            cases.append(_legacy(f"euler_step[{model},N={N}]", lambda s=spec: _legacy_stepper(s)))
+    return cases
+
+
+def macro_cases(sizes: Sequence[int], T: float, seeds: Sequence[int]) -> list[PerfCase]:
+    """
+    End-to-end benchmarks: `run_one` and a `run_suite` per spec and grid size.
+    """
+    cases: list[PerfCase] = []
+    for N in sizes:
+        for name, spec in _bench_specs(N, T).items():
+
+            def one(d: Path, name: str = name, spec: Any = spec) -> Callable[[], object]:
+                return lambda: run_one(name, seeds[0], d / f"run_{name}", spec=spec)
+
+            def suite(d: Path, name: str = name, spec: Any = spec) -> Callable[[], object]:
+                return lambda: run_suite(name, list(seeds), d / f"suite_{name}", spec=spec)
+
+            cases.append(PerfCase(f"run_one[{name},N={N}]", "macro", one))
+            cases.append(PerfCase(f"run_suite[{name},N={N},seeds={len(seeds)}]", "macro", suite))
+    return cases
+
+
+def select_cases(cfg: PerfConfig) -> list[PerfCase]:
+    cases: list[PerfCase] = []
+    if "micro" in cfg.kinds:
+        cases += micro_cases(cfg.sizes, cfg.threads)
+    if "legacy" in cfg.kinds:
+        cases += legacy_cases(cfg.sizes)
+    if "macro" in cfg.kinds:
+        cases += macro_cases(cfg.macro_sizes, cfg.macro_T, cfg.macro_seeds)
+    if cfg.filter:
+        cases = [c for c in cases if fnmatch.fnmatchcase(c.name, cfg.filter)]
+    return cases
+
+
+def _sample(fn: Callable[[], object], number: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(number):
+        fn()
+    return (time.perf_counter() - t0) / number
+
+
+def measure(
+    fn: Callable[[], object],
+    repeats: int,
+    min_time: float,
+    trace_calls: int = 0,
+) -> dict[str, Any]:
+    """
+    `repeats` samples of seconds per call, gc disabled (as `timeit` does).
+    Calls per sample are doubled until one sample takes at least `min_time`.
+    With `trace_calls`, that many further calls run under tracemalloc and
+    their peak traced allocation is reported (untimed).
+    """
+    fn()  # warm caches / first-touch buffers
+    number = 1
+    while min_time > 0.0 and number < 1 << 20 and _sample(fn, number) * number < min_time:
+        number *= 2
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        samples = [_sample(fn, number) for _ in range(max(1, repeats))]
+    finally:
+        if enabled:
+            gc.enable()
+    res: dict[str, Any] = {
+        "number": number,
+        "samples": samples,
+        "median": float(np.median(samples)),
+        "min": float(min(samples)),
+    }
+    if trace_calls > 0:
+        tracemalloc.start()
+        try:
+            for _ in range(trace_calls):
+                fn()
+            res["peak_alloc_bytes"] = int(tracemalloc.get_traced_memory()[1])
+        finally:
+            tracemalloc.stop()
+    return res
+
+
+def run_perf(
+    cfg: PerfConfig | None = None,
+    progress: Callable[[str, dict[str, Any]], None] | None = None,
+    names: Collection[str] | None = None,
+) -> dict[str, Any]:
+    """
+    Run the selected benchmarks (only `names`, if given) and return a baseline
+    document: {version, engine_version, created, machine, config, benchmarks}.
+    Macro runs write into a temporary directory that is removed afterwards.
+    """
+    cfg = PerfConfig() if cfg is None else cfg
+    results: dict[str, Any] = {}
+    with tempfile.TemporaryDirectory(prefix="vireon-perf-") as tmp:
+        for case in select_cases(cfg):
+            if names is not None and case.name not in names:
+                continue
+            fn = case.setup(Path(tmp))
+            kernel = case.kind != "macro"
+            min_time = cfg.min_time if kernel else 0.0
+            res = {"kind": case.kind, **measure(fn, cfg.repeats, min_time, 3 if kernel else 0)}
+            results[case.name] = res
+            if progress is not None:
+                progress(case.name, res)
+    return {
+        "version": PERF_VERSION,
+        "engine_version": ENGINE_VERSION,
+        "created": datetime.now(UTC).isoformat(),
+        "machine": machine_info(),
+        "config": asdict(cfg),
+        "benchmarks": results,
+    }
+
+
+def config_from(doc: dict[str, Any]) -> PerfConfig:
+    """
+    The `PerfConfig` a baseline was recorded with (to re-run the same set).
+    """
+    raw = dict(doc.get("config", {}))
+    for k in ("kinds", "sizes", "threads", "macro_sizes", "macro_seeds"):
+        if k in raw:
+            raw[k] = tuple(raw[k])
+    return PerfConfig(**raw)
+
+
+def default_baseline_path(root: Path = Path(BASELINE_DIR)) -> Path:
+    return Path(root) / f"{machine_info()['tag']}.json"
+
+
+def _rank(z: np.ndarray) -> np.ndarray:
+    # 1-based ranks, ties get their average rank
+    ranks = np.empty(z.size)
+    ranks[np.argsort(z, kind="mergesort")] = np.arange(1, z.size + 1)
+    _, inv = np.unique(z, return_inverse=True)
+    return (np.bincount(inv, ranks) / np.bincount(inv))[inv]
+
+
+def mann_whitney_greater(x: Sequence[float], y: Sequence[float]) -> float:
+    """
+    One-sided Mann–Whitney U p-value for "x tends to be larger than y".
+
+    Normal approximation with tie and continuity correction (rank-based, so a
+    few outlier samples from a noisy machine do not decide the verdict).
+    """
+    a, b = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    n, m = a.size, b.size
+    if n == 0 or m == 0:
+        return 1.0
+    z = np.concatenate([a, b])
+    U = float(_rank(z)[:n].sum()) - n * (n + 1) / 2.0
+    _, counts = np.unique(z, return_counts=True)
+    tot = n + m
+    var = n * m / 12.0 * ((tot + 1) - float((counts**3 - counts).sum()) / (tot * (tot - 1)))
+    if var <= 0.0:
+        return 1.0
+    zscore = (U - n * m / 2.0 - 0.5) / math.sqrt(var)
+    return 0.5 * math.erfc(zscore / math.sqrt(2.0))
+
+
+def compare(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    *,
+    alpha: float = 0.01,
+    threshold: float = 0.05,
+) -> dict[str, Any]:
+    """
+    Compare two baseline documents benchmark by benchmark.
+
+    A benchmark is "slower" when its median time grew by more than
+    `threshold` (relative) and the one-sided Mann–Whitney test on the samples
+    gives p < `alpha`; "faster" likewise the other way; else "same". Only
+    benchmarks present in both are compared.
+    """
+    base, cur = baseline["benchmarks"], current["benchmarks"]
+    rows: list[dict[str, Any]] = []
+    for name in (k for k in base if k in cur):
+        b, c = base[name], cur[name]
+        ratio = c["median"] / b["median"] if b["median"] > 0.0 else math.inf
+        p_slower = mann_whitney_greater(c["samples"], b["samples"])
+        p_faster = mann_whitney_greater(b["samples"], c["samples"])
+        verdict = "same"
+        if p_slower < alpha and ratio > 1.0 + threshold:
+            verdict = "slower"
+        elif p_faster < alpha and ratio < 1.0 - threshold:
+            verdict = "faster"
+        rows.append(
+            {
+                "name": name,
+                "kind": b.get("kind", ""),
+                "baseline_median": b["median"],
+                "current_median": c["median"],
+                "ratio": ratio,
+                "p_slower": p_slower,
+                "p_faster": p_faster,
+                "verdict": verdict,
+            }
+        )
+    return {
+        "alpha": alpha,
+        "threshold": threshold,
+        "same_machine": baseline["machine"]["tag"] == current["machine"]["tag"],
+        "baseline_machine": baseline["machine"]["tag"],
+        "current_machine": current["machine"]["tag"],
+        "rows": rows,
+        "missing": sorted(set(base) - set(cur)),
+        "regressions": [r["name"] for r in rows if r["verdict"] == "slower"],
+    }
+
+
+def check(
+    baseline: dict[str, Any],
+    current: dict[str, Any] | None = None,
+    *,
+    alpha: float = 0.01,
+    threshold: float = 0.05,
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """
+    `compare` `current` (default: a fresh run of the baseline's benchmark set)
+    with `baseline`; returns (report, current). On a fresh run, slowdowns are
+    measured a second time and only kept when that confirms them, which
+    filters out transient load on shared machines.
+    """
+    if current is not None:
+        return compare(baseline, current, alpha=alpha, threshold=threshold), current
+    cfg = config_from(baseline)
+    current = run_perf(cfg)
+    res = compare(baseline, current, alpha=alpha, threshold=threshold)
+    if res["regressions"]:
+        again = run_perf(cfg, names=set(res["regressions"]))
+        second = compare(baseline, again, alpha=alpha, threshold=threshold)
+        confirmed = set(second["regressions"])
+        for r in res["rows"]:
+            if r["verdict"] == "slower" and r["name"] not in confirmed:
+                r["verdict"] = "same"
+                r["unconfirmed"] = True
+        res["regressions"] = [n for n in res["regressions"] if n in confirmed]
+    return res, current
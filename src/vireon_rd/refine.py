@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import math
+import time
+from collections.abc import Sequence
+from dataclasses import replace
+from typing import Any
+
+import numpy as np
+
+from .engine import PRIMARY_FIELD, _evaluate
+from .eval import EvalConfig
+from .numerics import metrics_dtype
+from .sim import SimResult, run_grayscott, run_sqk_model_g
+from .sinks import DriftSink, SnapshotSink, TeeSink
+from .specs import GrayScottSpec, SQKModelGSpec
+from .spectral import spectral_resample
+
+REFINE_FILE = "refine.json"
+
+# metrics whose convergence `run_refine` reports
+REFINE_KEYS = ("lambda_star", "localization", "anisotropy")
+
+
+def level_spec(
+    spec: SQKModelGSpec | GrayScottSpec,
+    N: int,
+    dt: float | None = None,
+) -> SQKModelGSpec | GrayScottSpec:
+    """
+    `spec` on an N x N grid of the same domain. Without `dt`, grids finer than
+    the spec's get dt * (N_spec / N)^2 (the explicit diffusive limit scales
+    with dx^2); `save_every` is rescaled to keep the snapshot times.
+    """
+    g = spec.grid
+    if dt is None:
+        dt = min(g.dt, g.dt * (g.N / N) ** 2)
+    save_every = max(1, round(g.save_every * g.dt / dt))
+    return replace(spec, grid=replace(g, N=int(N), dt=float(dt), save_every=save_every))
+
+
+def richardson(
+    values: Sequence[float],
+    Ns: Sequence[int],
+    order: float = 2.0,
+) -> dict[str, Any]:
+    """
+    Richardson-style estimate for a quantity computed on grids `Ns` (coarse to fine).
+
+    With three levels at one refinement ratio r and monotone convergence the
+    observed order p = log(|Q1 - Q0| / |Q2 - Q1|) / log(r) is used, else `order`.
+    `error` = |Q_f - Q_c| / (r^p - 1) estimates the error of the finest value
+    and `extrapolated` = Q_f + (Q_f - Q_c) / (r^p - 1) its grid-converged limit.
+    """
+    q = [float(v) for v in values]
+    out: dict[str, Any] = {
+        "values": q,
+        "observed_order": None,
+        "order": float(order),
+        "extrapolated": None,
+        "error": None,
+        "rel_error": None,
+    }
+    if len(q) < 2 or not all(math.isfinite(v) for v in q[-3:]):
+        return out
+    r = Ns[-1] / Ns[-2]
+    if len(q) >= 3 and math.isclose(Ns[-2] / Ns[-3], r, rel_tol=1e-9):
+        e1, e2 = q[-2] - q[-3], q[-1] - q[-2]
+        if e1 * e2 > 0.0 and abs(e2) < abs(e1):
+            out["observed_order"] = math.log(e1 / e2) / math.log(r)
+    p = out["observed_order"] or float(order)
+    diff = (q[-1] - q[-2]) / (r**p - 1.0)
+    out["order"] = p
+    out["extrapolated"] = q[-1] + diff
+    out["error"] = abs(diff)
+    out["rel_error"] = abs(diff) / abs(q[-1]) if q[-1] != 0.0 else None
+    return out
+
+
+class _WarmCapture(SnapshotSink):
+    """
+    Keep the primary field of every frame before `t_warm` and the full state
+    at the first frame with t >= t_warm (the warm-start point).
+    """
+
+    def __init__(self, field: str, t_warm: float) -> None:
+        self.field = field
+        self.t_warm = t_warm
+        self.frames: list[np.ndarray] = []
+        self.t: float | None = None
+        self.state: dict[str, np.ndarray] | None = None
+
+    def push(self, t: float, fields: dict[str, np.ndarray]) -> None:
+        if self.state is not None:
+            return
+        if t < self.t_warm * (1.0 - 1e-12):
+            self.frames.append(fields[self.field].copy())
+        else:
+            self.t = float(t)
+            self.state = {k: v.copy() for k, v in fields.items()}
+
+
+def _run_level(
+    spec: SQKModelGSpec | GrayScottSpec,
+    seed: int,
+    sink: SnapshotSink,
+    initial: tuple[np.ndarray, ...] | None,
+    threads: int,
+    workers: int,
+) -> SimResult:
+    run = run_sqk_model_g if isinstance(spec, SQKModelGSpec) else run_grayscott
+    return run(spec, seed, sink=sink, threads=threads, workers=workers, initial=initial)
+
+
+def run_refine(
+    spec: SQKModelGSpec | GrayScottSpec,
+    seed: int,
+    Ns: Sequence[int],
+    *,
+    dts: Sequence[float] | None = None,
+    warm_frac: float = 0.5,
+    order: float = 2.0,
+    threads: int = 1,
+    workers: int = 1,
+) -> dict[str, Any]:
+    """
+    Run one seed of `spec` at a ladder of grids `Ns` (coarse to fine, time
+    steps `dts` or from `level_spec`) and report how the field metrics, label
+    and gates converge.
+
+    The coarsest level runs in full. Every finer level starts at the first
+    coarse snapshot t_warm >= warm_frac * T from the coarse state spectrally
+    interpolated onto its grid and only integrates [t_warm, T] (SQK forcing
+    is shifted so χ keeps its absolute timing). Its drift metric sees the
+    interpolated coarse frames before t_warm, then its own. warm_frac = 0
+    runs every level cold from its own seeded initial state, as do all levels
+    when the coarsest one stops (e.g. blows up) before t_warm.
+    """
+    Ns = [int(n) for n in Ns]
+    if len(Ns) < 2 or any(b <= a for a, b in zip(Ns, Ns[1:], strict=False)):
+        raise ValueError(f"need at least two strictly increasing grid sizes, got {Ns}")
+    if dts is not None and len(dts) != len(Ns):
+        raise ValueError(f"need one dt per level: got {len(dts)} for {len(Ns)} levels")
+    if not 0.0 <= warm_frac < 1.0:
+        raise ValueError(f"warm_frac must be in [0, 1), got {warm_frac}")
+    model = "sqk" if isinstance(spec, SQKModelGSpec) else "gs"
+    primary = PRIMARY_FIELD[model]
+    cfg = EvalConfig()
+    specs = [level_spec(spec, n, None if dts is None else dts[i]) for i, n in enumerate(Ns)]
+
+    def drift_sink(s: SQKModelGSpec | GrayScottSpec) -> DriftSink:
+        dtype = metrics_dtype(s.grid.precision)
+        return DriftSink(primary, mode=cfg.drift_mode, factor=cfg.drift_factor, dtype=dtype)
+
+    levels: list[dict[str, Any]] = []
+    capture: _WarmCapture | None = None
+    for i, s in enumerate(specs):
+        drift = drift_sink(s)
+        sink: SnapshotSink = drift
+        run_spec, initial, t_warm = s, None, 0.0
+        if i == 0 and warm_frac > 0.0:
+            capture = _WarmCapture(primary, warm_frac * s.grid.T)
+            sink = TeeSink(drift, capture)
+        elif capture is not None and capture.state is not None:
+            t_warm = capture.t
+            n = s.grid.N
+            for frame in capture.frames:
+                drift.push(0.0, {primary: spectral_resample(frame, n)})
+            initial = tuple(spectral_resample(capture.state[k], n) for k in capture.state)
+            grid = replace(s.grid, T=s.grid.T - t_warm)
+            run_spec = replace(s, grid=grid)
+            if isinstance(s, SQKModelGSpec):
+                run_spec = replace(run_spec, forcing=replace(s.forcing, t0=s.forcing.t0 - t_warm))
+        t0 = time.perf_counter()
+        sim = _run_level(run_spec, seed, sink, initial, threads, workers)
+        seconds = time.perf_counter() - t0
+        metrics, gates = _evaluate(s, sim, drift)
+        levels.append(
+            {
+                "N": s.grid.N,
+                "dt": s.grid.dt,
+                "save_every": s.grid.save_every,
+                "start": "cold" if initial is None else "warm",
+                "t_start": t_warm,
+                "steps": int(sim.stats.get("steps", 0)),
+                "status": sim.status,
+                "seconds": seconds,
+                "metrics": {k: float(metrics[k]) for k in REFINE_KEYS},
+                "label": str(metrics["label"]),
+                "gates": {k: bool(v) for k, v in gates.items()},
+            }
+        )
+
+    convergence = {
+        k: richardson([lv["metrics"][k] for lv in levels], Ns, order) for k in REFINE_KEYS
+    }
+    gate_rows = {}
+    for k in levels[0]["gates"]:
+        vals = [lv["gates"][k] for lv in levels]
+        gate_rows[k] = {"values": vals, "stable": len(set(vals)) == 1}
+    labels = [lv["label"] for lv in levels]
+    statuses = [lv["status"] for lv in levels]
+    return {
+        "model": model,
+        "seed": int(seed),
+        "warm_frac": float(warm_frac),
+        "t_warm": None if capture is None else capture.t,  # None: all levels ran cold
+        "levels": levels,
+        "convergence": convergence,
+        "gates": gate_rows,
+        "label": {"values": labels, "stable": len(set(labels)) == 1},
+        "stable": all(st == "ok" for st in statuses)
+        and len(set(labels)) == 1
+        and all(g["stable"] for g in gate_rows.values()),
+    }
@@ -0,0 +1,384 @@
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any
+
+from .engine import (
+    _eval_finals,
+    _resolve_spec,
+    _run_dirs,
+    _run_options,
+    build_parser,
+    main,
+    submit_suite,
+)
+from .parallel import pin_threads
+from .sim import run_grayscott, run_sqk_model_g
+from .specs import get_spec
+
+SOCKET_ENV = "VIREON_RD_SOCKET"
+
+# request "cmd"s: jobs run on the worker pool, control requests are answered directly
+SERVE_COMMANDS = ("run", "suite", "sweep")
+CONTROL_COMMANDS = ("ping", "shutdown")
+
+# request fields holding paths; the client makes them absolute before sending
+PATH_FIELDS = ("out", "design", "cache_dir")
+
+Send = Callable[[dict[str, Any]], None]
+
+
+def default_socket_path() -> Path:
+    """
+    $VIREON_RD_SOCKET, else $XDG_RUNTIME_DIR/vireon-rd.sock, else <tmp>/vireon-rd-<uid>.sock.
+    """
+    env = os.environ.get(SOCKET_ENV)
+    if env:
+        return Path(env)
+    run_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if run_dir:
+        return Path(run_dir) / "vireon-rd.sock"
+    return Path(tempfile.gettempdir()) / f"vireon-rd-{os.getuid()}.sock"
+
+
+@dataclass(frozen=True)
+class ServeConfig:
+    socket: Path | None = None  # None: default_socket_path()
+    workers: int = 0  # warm worker processes (0: one per CPU)
+    warm: bool = True  # step each named spec briefly in every worker before serving
+
+
+def _warm_worker(warm: bool) -> None:
+    """
+    Pool initializer: single-threaded native code, then (with `warm`) one
+    snapshot stride of each named spec, so imports, forcing bases and radial
+    geometries are cached before the first request arrives.
+    """
+    pin_threads(1)
+    if not warm:
+        return
+    for name, run in (("sqk", run_sqk_model_g), ("gs", run_grayscott)):
+        spec = get_spec(name)
+        grid = spec.grid
+        spec = replace(spec, grid=replace(grid, T=grid.save_every * grid.dt))
+        _eval_finals(spec, [run(spec, seed=1)])
+
+
+def request_args(req: dict[str, Any]) -> argparse.Namespace:
+    """
+    `vireon-rd <cmd>` arguments of a JSON request such as
+    {"cmd": "suite", "spec": "gs", "seeds": [1, 2, 3], "out": "/abs/dir"}.
+
+    Keys are the command's option names (dashes or underscores); omitted
+    options take their CLI defaults. A sweep "design" may be a path or an
+    inline design object. Relative paths resolve against the server's
+    working directory.
+    """
+    cmd = req.get("cmd")
+    if cmd not in SERVE_COMMANDS:
+        raise ValueError(f"cmd must be one of {SERVE_COMMANDS + CONTROL_COMMANDS}, got {cmd!r}")
+    fields = {k.replace("-", "_"): v for k, v in req.items()}
+    args = build_parser().parse_args([cmd, "--design", ""] if cmd == "sweep" else [cmd])
+    unknown = sorted(set(fields) - set(vars(args)))
+    if unknown:
+        raise ValueError(f"unknown {cmd} options: {unknown}")
+    vars(args).update(fields)
+    if cmd == "suite" and not isinstance(args.seeds, str):
+        args.seeds = ",".join(str(int(s)) for s in args.seeds)
+    if cmd == "sweep" and not args.design:
+        raise ValueError("sweep needs a design (a path or an inline object)")
+    if getattr(args, "profile", False) or getattr(args, "dry_run", False):
+        raise ValueError("--profile / --dry-run only make sense in-process")
+    return args
+
+
+def _run_event(run_dir: Path, seed: int, hit: bool) -> dict[str, Any]:
+    meta = json.loads((run_dir / "meta.json").read_text(encoding="utf-8"))
+    return {
+        "event": "run",
+        "path": str(run_dir),
+        "seed": seed,
+        "status": meta.get("status"),
+        "cache": bool(hit),
+    }
+
+
+def _serve_run(pool: Executor, args: argparse.Namespace, send: Send) -> dict[str, Any]:
+    spec = _resolve_spec(args.spec, args.scheme, args.precision, args.backend)
+    out, seed = Path(args.out), int(args.seed)
+    job = pool.submit(_run_dirs, args.spec, spec, [seed], [out], True, _run_options(args))
+    ((_, hit, _),) = job.result()
+    send(_run_event(out, seed, hit))
+    return {"out": str(out)}
+
+
+def _serve_suite(pool: Executor, args: argparse.Namespace, send: Send) -> dict[str, Any]:
+    seeds = [int(x.strip()) for x in str(args.seeds).split(",") if x.strip()]
+    out = Path(args.out)
+
+    def progress(
+        part: list[int], results: list[tuple[dict[str, Any], bool, dict[str, Any]]]
+    ) -> None:
+        for s, (_, hit, _) in zip(part, results, strict=True):
+            send(_run_event(out / f"seed_{s}", s, hit))
+
+    summary = submit_suite(
+        pool,
+        args.spec,
+        seeds,
+        out,
+        chunks=max(1, int(args.jobs)),
+        ensemble=not args.no_ensemble,
+        spec=_resolve_spec(args.spec, args.scheme, args.precision, args.backend),
+        opts=_run_options(args),
+        progress=progress,
+    )()
+    return {"out": str(out), "suite": str(out / "suite.json"), "cache": summary.get("cache")}
+
+
+def _serve_sweep(pool: Executor, args: argparse.Namespace, send: Send) -> dict[str, Any]:
+    from .sweep import SWEEP_RUNS_DIR, design_from_dict, load_design, run_sweep
+
+    if isinstance(args.design, dict):
+        design = design_from_dict(args.design)
+    else:
+        design = load_design(Path(args.design))
+    out = Path(args.out)
+
+    def progress(rows: list[dict[str, Any]]) -> None:
+        for r in rows:
+            send(
+                {
+                    "event": "run",
+                    "path": str(out / SWEEP_RUNS_DIR / r["id"]),
+                    "seed": r["seed"],
+                    "status": r.get("status"),
+                    "cache": bool(r.get("cached", 0)),
+                }
+            )
+
+    rows = run_sweep(design, out, opts=_run_options(args), executor=pool, progress=progress)
+    return {"out": str(out), "summary": str(out / "summary.csv"), "runs": len(rows)}
+
+
+_JOBS = {"run": _serve_run, "suite": _serve_suite, "sweep": _serve_sweep}
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def send(self, event: dict[str, Any]) -> None:
+        self.wfile.write((json.dumps(event, default=str) + "\n").encode("utf-8"))
+        self.wfile.flush()
+
+    def handle(self) -> None:
+        try:
+            try:
+                req = json.loads(self.rfile.readline() or b"null")
+                if not isinstance(req, dict):
+                    raise ValueError("expected one JSON object per line")
+                self.server.dispatch(req, self.send)
+            except (BrokenPipeError, ConnectionResetError):
+                raise
+            except (Exception, SystemExit) as e:  # argparse exits on bad option values
+                self.send({"event": "error", "error": f"{type(e).__name__}: {e}"})
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # the client went away; whatever it asked for has still been written
+
+
+class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    `vireon-rd serve`: a pool of warm worker processes behind a Unix socket.
+
+    Each connection carries one JSON request line (see `request_args`, plus
+    {"cmd": "ping"} and {"cmd": "shutdown"}) and gets back JSON event lines:
+      {"event": "accepted", "id": n, "cmd": ...}
+      {"event": "run", "path": ..., "seed": ..., "status": ..., "cache": ...}  per run
+      {"event": "done", "status": "ok", "seconds": ..., "out": ..., ...}  or
+      {"event": "error", "error": "..."}
+    Requests are served concurrently and share the pool; artifacts are the
+    same as those of the equivalent in-process command.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, cfg: ServeConfig) -> None:
+        self.path = Path(cfg.socket) if cfg.socket is not None else default_socket_path()
+        self.workers = max(1, int(cfg.workers) or os.cpu_count() or 1)
+        self.warm = bool(cfg.warm)
+        self._lock = threading.Lock()
+        self.requests = 0
+        _claim_socket(self.path)
+        super().__init__(str(self.path), _Handler)
+        os.chmod(self.path, 0o600)
+        try:
+            self.pool = self._start_pool()
+        except BaseException:
+            super().server_close()
+            self.path.unlink(missing_ok=True)
+            raise
+
+    def _start_pool(self) -> ProcessPoolExecutor:
+        pool = ProcessPoolExecutor(
+            max_workers=self.workers, initializer=_warm_worker, initargs=(self.warm,)
+        )
+        for f in [pool.submit(os.getpid) for _ in range(self.workers)]:
+            f.result()  # every worker is up (and warm) before the first request
+        return pool
+
+    def dispatch(self, req: dict[str, Any], send: Send) -> None:
+        cmd = req.get("cmd")
+        if cmd == "ping":
+            info = {"pid": os.getpid(), "workers": self.workers, "requests": self.requests}
+            send({"event": "done", "status": "ok", **info})
+            return
+        if cmd == "shutdown":
+            send({"event": "done", "status": "ok"})
+            threading.Thread(target=self.shutdown, daemon=True).start()
+            return
+        args = request_args(req)
+        with self._lock:
+            self.requests += 1
+            rid, pool = self.requests, self.pool
+        send({"event": "accepted", "id": rid, "cmd": cmd})
+        t0 = time.perf_counter()
+        try:
+            done = _JOBS[cmd](pool, args, send)
+        except BrokenProcessPool:
+            # a worker died (e.g. out of memory): later requests get a fresh pool
+            with self._lock:
+                if self.pool is pool:
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    self.pool = self._start_pool()
+            raise
+        send(
+            {
+                "event": "done",
+                "status": "ok",
+                "id": rid,
+                "seconds": time.perf_counter() - t0,
+                **done,
+            }
+        )
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.pool.shutdown(wait=True, cancel_futures=True)
+        self.path.unlink(missing_ok=True)
+
+
+def _connect(path: Path) -> socket.socket | None:
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(path))
+    except (FileNotFoundError, ConnectionRefusedError):
+        sock.close()
+        return None
+    return sock
+
+
+def _claim_socket(path: Path) -> None:
+    if path.exists() or path.is_symlink():
+        if not path.is_socket():
+            raise FileExistsError(f"{path} exists and is not a socket")
+        sock = _connect(path)
+        if sock is not None:
+            sock.close()
+            raise RuntimeError(f"a vireon-rd server is already listening on {path}")
+        path.unlink()  # left behind by a server that did not shut down cleanly
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+
+def serve(cfg: ServeConfig, ready: Callable[[Server], None] | None = None) -> None:
+    """
+    Serve requests until a "shutdown" request, SIGINT or SIGTERM; `ready` is
+    called once the workers are up. The socket is removed on the way out.
+    """
+    with Server(cfg) as server:
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, signal.default_int_handler)
+        if ready is not None:
+            ready(server)
+        with contextlib.suppress(KeyboardInterrupt):
+            server.serve_forever()
+
+
+def _events(sock: socket.socket, req: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    with sock, sock.makefile("rb") as f:
+        sock.sendall((json.dumps(req) + "\n").encode("utf-8"))
+        for line in f:
+            event = json.loads(line)
+            yield event
+            if event["event"] in ("done", "error"):
+                return
+    raise ConnectionError("the server closed the connection mid-request")
+
+
+def request(req: dict[str, Any], path: Path | None = None) -> Iterator[dict[str, Any]]:
+    """
+    Send one request to a running server and iterate over its events (the
+    last one is "done" or "error"). Raises ConnectionError when no server is
+    listening on `path` (default: `default_socket_path()`).
+    """
+    path = default_socket_path() if path is None else Path(path)
+    sock = _connect(path)
+    if sock is None:
+        raise ConnectionError(f"no vireon-rd server on {path}")
+    return _events(sock, req)
+
+
+def client_main(argv: list[str], path: Path | None = None, fallback: bool = True) -> None:
+    """
+    `vireon-rd client <command ...>`: send a run / suite / sweep command line
+    (or ping / shutdown) to the server and print its events. Without a server,
+    or for --profile / --dry-run, the command runs in this process instead
+    (unless `fallback` is off).
+    """
+    path = default_socket_path() if path is None else Path(path)
+    if argv[:1] and argv[0] in CONTROL_COMMANDS:
+        req: dict[str, Any] = {"cmd": argv[0]}
+    else:
+        args = build_parser().parse_args(argv)
+        if args.cmd not in SERVE_COMMANDS:
+            raise SystemExit(f"error: the server runs {', '.join(SERVE_COMMANDS)}, not {args.cmd}")
+        if getattr(args, "profile", False) or getattr(args, "dry_run", False):
+            main(argv)
+            return
+        req = vars(args)
+        for k in PATH_FIELDS:
+            if req.get(k):
+                req[k] = str(Path(req[k]).resolve())
+
+    try:
+        events = request(req, path)
+    except ConnectionError as e:
+        if not fallback or req["cmd"] in CONTROL_COMMANDS:
+            raise SystemExit(f"error: {e}") from None
+        print(f"{e}; running in-process", file=sys.stderr)
+        main(argv)
+        return
+
+    for ev in events:
+        if ev["event"] == "run":
+            print(f"{ev['status']}: {ev['path']}{' (cached)' if ev['cache'] else ''}")
+        elif ev["event"] == "error":
+            raise SystemExit(f"error: {ev['error']}")
+        elif ev["event"] == "done" and req["cmd"] == "ping":
+            print(f"OK: server pid {ev['pid']}, {ev['workers']} workers, {ev['requests']} requests")
+        elif ev["event"] == "done" and req["cmd"] == "shutdown":
+            print(f"OK: server on {path} is shutting down")
+        elif ev["event"] == "done":
+            print(f"OK: wrote {ev['out']} ({ev['seconds']:.2f} s)")
@@ -1,11 +1,43 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import hashlib
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass, field, replace
+from typing import Any
 
 import numpy as np
 
-from .numerics import forcing_field, init_grayscott, init_sqk, laplacian_periodic
-from .specs import GrayScottSpec, SQKModelGSpec
+from .cache import canonical_hash
+from .checkpoint import CheckpointConfig, checkpoint_stride, load_checkpoint, save_checkpoint
+from .domain import SharedDomain
+from .fused import (
+    grayscott_euler_step,
+    grayscott_params,
+    resolve_backend,
+    sqk_euler_step,
+    sqk_params,
+)
+from .numerics import (
+    forcing_basis,
+    init_grayscott,
+    init_sqk,
+    laplacian_padded_into,
+    laplacian_stencil_into,
+    padded_empty,
+    padded_rows_into,
+    state_dtype,
+)
+from .parallel import split_chunks, thread_pool
+from .sinks import MemorySink, SnapshotSink
+from .specs import SCHEMES, GrayScottSpec, HealthSpec, SQKModelGSpec
+from .spectral import etdrk4_coefficients, laplacian_symbol
+from .timing import NULL_TIMER, PhaseTimer, StrideClock, fine_timer
+
+# target grid cells per ensemble stack (keeps the working set near L2 size)
+ENSEMBLE_CELLS = 1 << 15
+
+# fewest rows per block of threaded Euler stepping
+MIN_BLOCK_ROWS = 16
 
 
 @dataclass
@@ -15,122 +47,1178 @@ class SimResult:
     T: float
     save_every: int
     times: list[float] = field(default_factory=list)
-    snapshots: list[dict[str, np.ndarray]] = field(default_factory=list)
+    snapshots: list[dict[str, np.ndarray]] = field(default_factory=list)  # default sink only
     final: dict[str, np.ndarray] = field(default_factory=dict)
-    status: str = "ok"  # "ok" | "blowup"
+    status: str = "ok"  # "ok" | "blowup" | "early_stop"
     stop_step: int | None = None
     stop_time: float | None = None
+    # "nonfinite" | "max_abs" | "growth" | "step_underflow", or a sink's early-stop reason
+    stop_reason: str | None = None
+    stats: dict[str, Any] = field(default_factory=dict)  # integrator counters (meta.json)
+    timing: dict[str, Any] = field(default_factory=dict)  # phase times of its stack (meta.json)
+
+
+class _Stepper:
+    """
+    Ensemble bookkeeping shared by the time steppers.
+
+    State arrays are (B, N, N) of `dtype`: one row per ensemble member.
+    Subclasses implement `step(t)` (advance `cur` by one dt) and `_alloc()`
+    (per-shape work buffers, rebuilt when members are dropped). `timer`
+    accumulates the wall time of the time loop's phases; per-step phases
+    ("laplacian", "forcing", "fft") go to `phases` (see `fine_timer`).
+    """
+
+    fields: tuple[str, ...] = ()
+    rhs_per_step: int = 1
+    backend: str = "numpy"
+
+    def __init__(
+        self,
+        state: tuple[np.ndarray, ...],
+        dx: float,
+        dt: float,
+        dtype: np.dtype | type = float,
+    ) -> None:
+        self.dx = dx
+        self.dt = dt
+        self.dtype = np.dtype(dtype)
+        self.timer = PhaseTimer()
+        self.phases = fine_timer(self.timer)
+        self.cur = [np.array(a, dtype=self.dtype) for a in state]
+        self._alloc()
+
+    def _alloc(self) -> None:
+        pass
+
+    @property
+    def members(self) -> int:
+        return int(self.cur[0].shape[0])
 
+    def keep(self, idx: np.ndarray) -> None:
+        """
+        Drop ensemble members, keeping rows `idx` (in order).
+        """
+        self.cur = [a[idx] for a in self.cur]
+        self._alloc()
 
-def _finite_all(arrs: list[np.ndarray]) -> bool:
-    return all(bool(np.isfinite(a).all()) for a in arrs)
+    def member(self, i: int, copy: bool = False) -> dict[str, np.ndarray]:
+        return {
+            k: (a[i].copy() if copy else a[i]) for k, a in zip(self.fields, self.cur, strict=True)
+        }
 
+    def checkpoint(self) -> list[np.ndarray]:
+        return [a.copy() for a in self.cur]
 
-def run_sqk_model_g(spec: SQKModelGSpec, seed: int) -> SimResult:
+    def restore(self, saved: list[np.ndarray]) -> None:
+        for a, b in zip(self.cur, saved, strict=True):
+            a[...] = b
+
+    def max_abs(self) -> np.ndarray:
+        """
+        Per-member max |value| over all fields (nan if any value is nan).
+        """
+        return np.max([np.abs(a).max(axis=(-2, -1)) for a in self.cur], axis=0)
+
+    def finite(self) -> np.ndarray:
+        """
+        Per-member flag: all fields finite.
+        """
+        ok = np.ones(self.members, dtype=bool)
+        for a in self.cur:
+            ok &= np.isfinite(a).all(axis=(-2, -1))
+        return ok
+
+    def step(self, t: float) -> None:
+        raise NotImplementedError
+
+    def nbytes(self) -> int:
+        """
+        Bytes of the state and work arrays the stepper holds.
+        """
+        return _array_bytes(vars(self))
+
+    def close(self) -> None:
+        """
+        Release worker processes / shared memory (no-op for in-process steppers).
+        """
+
+
+class _EulerStepper(_Stepper):
     """
-    Explicit-Euler integrator for the 3-field forced RD testbed.
-    Periodic BC, 5-point Laplacian.
+    Explicit-Euler stepper on preallocated double buffers.
 
-    Engine rule: if the system diverges (nan/inf), stop cleanly and mark status="blowup".
+    `cur` holds the state, `nxt` receives the update and the two are swapped
+    after each step. Work arrays are allocated once (and again only when
+    members are dropped, except in a `SharedDomain`, which keeps its buffers
+    and workers), so stepping allocates nothing per step. Subclasses
+    evaluate the RHS with `out=` ufuncs in the same operation order as the
+    expression form, which keeps every member bit-identical to a standalone run.
     """
-    N = spec.grid.N
-    L = spec.grid.L
-    dt = spec.grid.dt
-    T = spec.grid.T
-    save_every = spec.grid.save_every
-    dx = L / N
 
-    G, X, Y = init_sqk(spec, seed=seed)
-    steps = int(np.ceil(T / dt))
+    n_work: int = 3
+    threads: int = 1
+    workers: int = 1
+    _domain: SharedDomain | None = None
 
-    out = SimResult(model="sqk", dt=dt, T=T, save_every=save_every)
+    def _alloc(self) -> None:
+        shape = self.cur[0].shape
+        self._blocks: list[_RowBlock] = []
+        if self._domain is not None:
+            self._domain.close()
+            self._domain = None
+        if self.workers > 1:
+            # state moves into shared memory; the row strips are stepped by worker processes
+            self._domain = SharedDomain(type(self), self.spec, self.cur, self.workers)
+            self.cur, self.nxt = self._domain.views(0), self._domain.views(1)
+            self.work = []
+            return
+        self.nxt = [np.empty(shape, dtype=self.dtype) for _ in self.cur]
+        self._pad, self._interior = padded_empty(shape, self.dtype)
+        self.work = [np.empty(shape, dtype=self.dtype) for _ in range(self.n_work)]
+        if self.threads > 1:
+            rows = split_chunks(range(shape[-2]), min(self.threads, shape[-2] // MIN_BLOCK_ROWS))
+            self._blocks = [self._row_block(r[0], r[-1] + 1, shape) for r in rows]
 
-    zero = np.zeros((N, N), dtype=float)
+    def _row_block(self, r0: int, r1: int, shape: tuple[int, ...]) -> _RowBlock:
+        *lead, _, m = shape
+        pads = [padded_empty((*lead, r1 - r0, m), self.dtype)[0] for _ in self.fields]
+        work = [np.empty((*lead, r1 - r0, m), dtype=self.dtype) for _ in range(self.n_work)]
+        return _RowBlock(r0, r1, pads, work)
 
-    for n in range(steps + 1):
-        t = n * dt
+    @classmethod
+    def tile(
+        cls,
+        spec: SQKModelGSpec | GrayScottSpec,
+        shape: tuple[int, ...],
+        r0: int,
+        r1: int,
+    ) -> tuple[_EulerStepper, _RowBlock]:
+        """
+        Stepper that only steps rows [r0, r1) of a (B, N, N) state it does not
+        own (a `SharedDomain` worker points `cur` / `nxt` at shared buffers).
+        """
+        *lead, _, m = shape
+        stepper = cls(spec, tuple(np.empty((*lead, 0, m)) for _ in cls.fields))
+        return stepper, stepper._row_block(r0, r1, shape)
+
+    def keep(self, idx: np.ndarray) -> None:
+        if self._domain is None:
+            super().keep(idx)
+            return
+        # pack the kept rows at the front of the shared buffers: the domain and its
+        # worker processes stay up and step only the first `members` rows from now on
+        k = len(idx)
+        for a in self.cur:
+            a[:k] = a[idx]
+        self.cur = [a[:k] for a in self.cur]
+        self.nxt = [a[:k] for a in self.nxt]
+        self._domain.members = k
+
+    def set_threads(self, threads: int) -> None:
+        """
+        Step in row blocks on `threads` threads (1: serial). Results do not change.
+        """
+        self.threads = max(1, int(threads))
+        self._alloc()
+
+    def set_workers(self, workers: int) -> None:
+        """
+        Step row strips in `workers` processes over shared memory (1: in process).
+        Results do not change.
+        """
+        self.workers = max(1, int(workers))
+        self._alloc()
+
+    def close(self) -> None:
+        if self._domain is not None:
+            # keep the state readable once the shared segment is gone
+            self.cur = [a.copy() for a in self.cur]
+            self.nxt = []
+            self._domain.close()
+            self._domain = None
+            self.workers = 1
+
+    def member(self, i: int, copy: bool = False) -> dict[str, np.ndarray]:
+        # views of the shared segment must not outlive it
+        return super().member(i, copy=copy or self._domain is not None)
+
+    def step(self, t: float) -> None:
+        if self._domain is not None:
+            self._domain.step(t)
+            self.cur, self.nxt = self.nxt, self.cur
+            return
+        if len(self._blocks) > 1:
+            self._step_blocks(t)
+            return
+        self.rhs_into(self.cur, t, self.nxt)
+        for u, du in zip(self.cur, self.nxt, strict=True):
+            # u + dt * du
+            np.multiply(du, self.dt, out=du)
+            np.add(u, du, out=du)
+        self.cur, self.nxt = self.nxt, self.cur
+
+    def _step_blocks(self, t: float) -> None:
+        # blocks read `cur` (halo rows included) and write disjoint rows of `nxt`,
+        # so waiting for all of them is the only synchronisation a step needs
+        with self.phases.phase("forcing"):
+            chi = self._forcing_term(t)
+        pool = thread_pool(self.threads)
+        rows = [None if chi is None else chi[b.r0 : b.r1] for b in self._blocks]
+        for f in [pool.submit(self._step_block, b, c) for b, c in zip(self._blocks, rows)]:
+            f.result()
+        self.cur, self.nxt = self.nxt, self.cur
+
+    def _step_block(self, blk: _RowBlock, chi: np.ndarray | None) -> None:
+        # one Euler step of rows [r0, r1); `chi` holds the source rows of the block
+        r0, r1 = blk.r0, blk.r1
+        u = [a[..., r0:r1, :] for a in self.cur]
+        out = [a[..., r0:r1, :] for a in self.nxt]
+        for a, p, d in zip(self.cur, blk.pads, out, strict=True):
+            padded_rows_into(a, r0, r1, p)
+            laplacian_stencil_into(p, self.dx, d, blk.work[-1])
+        self._reactions_into(u, out, blk.work, chi)
+        for x, dx in zip(u, out, strict=True):
+            np.multiply(dx, self.dt, out=dx)
+            np.add(x, dx, out=dx)
+
+    def _laplacian_into(self, u: np.ndarray, out: np.ndarray) -> np.ndarray:
+        self._interior[...] = u
+        return laplacian_padded_into(self._pad, self.dx, out, self.work[-1])
+
+    def rhs_into(self, u: list[np.ndarray], t: float, out: list[np.ndarray]) -> None:
+        """
+        Write du/dt at state `u`, time `t` into `out` (must not alias `u`).
+        """
+        with self.phases.phase("laplacian"):
+            for a, d in zip(u, out, strict=True):
+                self._laplacian_into(a, d)
+        with self.phases.phase("forcing"):
+            chi = self._forcing_term(t)
+        self._reactions_into(u, out, self.work, chi)
+
+    def _forcing_term(self, t: float, r0: int = 0, r1: int | None = None) -> np.ndarray | None:
+        """
+        Rows [r0, r1) of the additive (N, N) source at `t`, None while there is none.
+        """
+        return None
+
+    def _reactions_into(
+        self,
+        u: list[np.ndarray],
+        out: list[np.ndarray],
+        work: list[np.ndarray],
+        chi: np.ndarray | None,
+    ) -> None:
+        """
+        Turn the Laplacians in `out` into du/dt: diffusion coefficients,
+        reactions and the source `chi`. Arrays may be row slices of the state.
+        """
+        raise NotImplementedError
+
+
+@dataclass
+class _RowBlock:
+    # rows [r0, r1) of the stepper state, with their own halo-padded copies and work arrays
+    r0: int
+    r1: int
+    pads: list[np.ndarray]
+    work: list[np.ndarray]
+
+    def first(self, members: int) -> _RowBlock:
+        """
+        The same rows for the first `members` of the stack (views).
+        """
+        return replace(
+            self, pads=[p[:members] for p in self.pads], work=[w[:members] for w in self.work]
+        )
+
+
+def _array_bytes(obj: Any) -> int:
+    # arrays owning their memory (views are counted through their base), in nested containers
+    if isinstance(obj, np.ndarray):
+        return int(obj.nbytes) if obj.base is None else 0
+    if isinstance(obj, dict):
+        return sum(_array_bytes(v) for v in obj.values())
+    if isinstance(obj, list | tuple):
+        return sum(_array_bytes(v) for v in obj)
+    if isinstance(obj, _RowBlock):
+        return _array_bytes(obj.pads) + _array_bytes(obj.work)
+    if isinstance(obj, SharedDomain):
+        return int(obj.buffers.nbytes)
+    return 0
+
+
+class _SQKEuler(_EulerStepper):
+    fields = ("G", "X", "Y")
+
+    def __init__(self, spec: SQKModelGSpec, state: tuple[np.ndarray, ...]) -> None:
+        g = spec.grid
+        super().__init__(state, g.L / g.N, g.dt, state_dtype(g.precision))
+        self.spec = spec
+        self._forcing = forcing_basis(g.N, g.L, spec.forcing)
+        self._chi = np.empty((g.N, g.N), dtype=self.dtype)
 
-        if n % save_every == 0:
-            out.times.append(float(t))
-            out.snapshots.append({"G": G.copy(), "X": X.copy(), "Y": Y.copy()})
+    def _forcing_term(self, t: float, r0: int = 0, r1: int | None = None) -> np.ndarray | None:
+        # χ only enters the X channel, by design
+        if self.spec.enable_forcing and self._forcing.active(t):
+            r1 = self._chi.shape[0] if r1 is None else r1
+            return self._forcing.rows_into(t, r0, r1, self._chi[r0:r1])
+        return None
 
-        # build forcing χ (only into X channel by design)
-        chi = forcing_field(N, L, t, spec.forcing) if spec.enable_forcing else zero
+    def _reactions_into(
+        self,
+        u: list[np.ndarray],
+        out: list[np.ndarray],
+        work: list[np.ndarray],
+        chi: np.ndarray | None,
+    ) -> None:
+        s = self.spec
+        G, X, Y = u
+        dG, dX, dY = out
+        tmp, Q = work[0], work[1]
 
-        # quadratic coupling (may be stiff)
+        # quadratic coupling (may be stiff): Q = (X + c1)^2 * (Y + c2)
         with np.errstate(over="ignore", invalid="ignore"):
-            Q = (X + spec.c1) ** 2 * (Y + spec.c2)
+            np.add(X, s.c1, out=Q)
+            np.square(Q, out=Q)
+            np.add(Y, s.c2, out=tmp)
+            np.multiply(Q, tmp, out=Q)
 
-        # diffusion
-        LG = laplacian_periodic(G, dx)
-        LX = laplacian_periodic(X, dx)
-        LY = laplacian_periodic(Y, dx)
+        # dG = Dg*LG + alpha_g*Q - beta_g*G
+        np.multiply(dG, s.Dg, out=dG)
+        np.multiply(Q, s.alpha_g, out=tmp)
+        np.add(dG, tmp, out=dG)
+        np.multiply(G, s.beta_g, out=tmp)
+        np.subtract(dG, tmp, out=dG)
 
-        # reactions (engine-grade: explicit, tunable, not “claimed physics”)
-        dG = spec.Dg * LG + spec.alpha_g * Q - spec.beta_g * G
-        dX = spec.Dx * LX + spec.alpha_x * Q - spec.beta_x * X + chi
-        dY = spec.Dy * LY + spec.alpha_y * Q - spec.beta_y * Y
+        # dX = Dx*LX + alpha_x*Q - beta_x*X + chi
+        np.multiply(dX, s.Dx, out=dX)
+        np.multiply(Q, s.alpha_x, out=tmp)
+        np.add(dX, tmp, out=dX)
+        np.multiply(X, s.beta_x, out=tmp)
+        np.subtract(dX, tmp, out=dX)
+        if chi is not None:
+            np.add(dX, chi, out=dX)
 
-        # explicit Euler
-        G = G + dt * dG
-        X = X + dt * dX
-        Y = Y + dt * dY
+        # dY = Dy*LY + alpha_y*Q - beta_y*Y
+        np.multiply(dY, s.Dy, out=dY)
+        np.multiply(Q, s.alpha_y, out=tmp)
+        np.add(dY, tmp, out=dY)
+        np.multiply(Y, s.beta_y, out=tmp)
+        np.subtract(dY, tmp, out=dY)
 
-        # blow-up detection: stop early, label the run, return cleanly
-        if not _finite_all([G, X, Y]):
-            out.status = "blowup"
-            out.stop_step = int(n)
-            out.stop_time = float(t)
-            out.final = {"G": G, "X": X, "Y": Y}
-            return out
 
-    out.final = {"G": G, "X": X, "Y": Y}
-    return out
+class _GrayScottEuler(_EulerStepper):
+    fields = ("u", "v")
 
+    def __init__(self, spec: GrayScottSpec, state: tuple[np.ndarray, ...]) -> None:
+        g = spec.grid
+        super().__init__(state, g.L / g.N, g.dt, state_dtype(g.precision))
+        self.spec = spec
+
+    def _reactions_into(
+        self,
+        u: list[np.ndarray],
+        out: list[np.ndarray],
+        work: list[np.ndarray],
+        chi: np.ndarray | None,
+    ) -> None:
+        s = self.spec
+        a, b = u
+        du, dv = out
+        tmp, uv2 = work[0], work[1]
+
+        with np.errstate(over="ignore", invalid="ignore"):
+            np.multiply(a, b, out=uv2)
+            np.multiply(uv2, b, out=uv2)
 
-def run_grayscott(spec: GrayScottSpec, seed: int) -> SimResult:
+        # du = Du*Lu - uv2 + F*(1-u)
+        np.multiply(du, s.Du, out=du)
+        np.subtract(du, uv2, out=du)
+        np.subtract(1.0, a, out=tmp)
+        np.multiply(tmp, s.F, out=tmp)
+        np.add(du, tmp, out=du)
+
+        # dv = Dv*Lv + uv2 - (F+k)*v
+        np.multiply(dv, s.Dv, out=dv)
+        np.add(dv, uv2, out=dv)
+        np.multiply(b, s.F + s.k, out=tmp)
+        np.subtract(dv, tmp, out=dv)
+
+
+class _SQKFused(_SQKEuler):
+    """
+    `_SQKEuler` stepped by the fused `sqk_euler_step` kernel (backend "numba"):
+    one pass over the grid per step instead of ~15 array passes. Agrees with
+    the NumPy stepper to rounding, not bit for bit.
     """
-    Explicit-Euler Gray–Scott baseline.
 
-    Engine rule: if the system diverges (nan/inf), stop cleanly and mark status="blowup".
+    backend = "numba"
+
+    def __init__(self, spec: SQKModelGSpec, state: tuple[np.ndarray, ...]) -> None:
+        super().__init__(spec, state)
+        self._p = sqk_params(spec)
+
+    def step(self, t: float) -> None:
+        forced = bool(self.spec.enable_forcing and self._forcing.active(t))
+        if forced:
+            with self.phases.phase("forcing"):
+                self._forcing.field_into(t, self._chi)
+        sqk_euler_step(*self.cur, *self.nxt, self._chi, forced, self._p, self.dx, self.dt)
+        self.cur, self.nxt = self.nxt, self.cur
+
+
+class _GrayScottFused(_GrayScottEuler):
+    """
+    `_GrayScottEuler` stepped by the fused `grayscott_euler_step` kernel.
     """
-    N = spec.grid.N
-    L = spec.grid.L
-    dt = spec.grid.dt
-    T = spec.grid.T
-    save_every = spec.grid.save_every
-    dx = L / N
 
-    u, v = init_grayscott(spec, seed=seed)
-    steps = int(np.ceil(T / dt))
+    backend = "numba"
 
-    out = SimResult(model="gs", dt=dt, T=T, save_every=save_every)
+    def __init__(self, spec: GrayScottSpec, state: tuple[np.ndarray, ...]) -> None:
+        super().__init__(spec, state)
+        self._p = grayscott_params(spec)
+
+    def step(self, t: float) -> None:
+        grayscott_euler_step(*self.cur, *self.nxt, self._p, self.dx, self.dt)
+        self.cur, self.nxt = self.nxt, self.cur
 
-    for n in range(steps + 1):
-        t = n * dt
 
-        if n % save_every == 0:
-            out.times.append(float(t))
-            out.snapshots.append({"u": u.copy(), "v": v.copy()})
+class _SpectralStepper(_Stepper):
+    """
+    Semi-implicit Fourier stepper: diffusion + linear decay exactly, reactions explicitly.
+
+    Each field obeys u_t = L u + N(u, t) with diagonal L = D * lap_symbol - c.
+    scheme="etdrk4": Cox–Matthews exponential RK4 (4 nonlinear evaluations/step).
+    scheme="imex-spectral": first-order semi-implicit Euler, (1 - dt L) u' = u + dt N.
+    Subclasses provide `_linear()` -> [(D, c), ...] and `_nonlinear(fields, t)`.
+    """
 
-        Lu = laplacian_periodic(u, dx)
-        Lv = laplacian_periodic(v, dx)
+    def __init__(
+        self,
+        state: tuple[np.ndarray, ...],
+        dx: float,
+        dt: float,
+        scheme: str,
+        dtype: np.dtype | type = float,
+    ) -> None:
+        super().__init__(state, dx, dt, dtype)
+        self.scheme = scheme
+        self.rhs_per_step = 4 if scheme == "etdrk4" else 1
+        N = self.cur[0].shape[-1]
+        self._shape = (N, N)
+        sym = laplacian_symbol(N, dx)
+        ops = [D * sym - c for D, c in self._linear()]
+        # coefficients in the state precision, so products do not promote float32 spectra
+        if scheme == "etdrk4":
+            self._coef = [
+                {k: v.astype(self.dtype) for k, v in etdrk4_coefficients(L, dt).items()}
+                for L in ops
+            ]
+        else:
+            self._implicit = [(1.0 / (1.0 - dt * L)).astype(self.dtype) for L in ops]
 
+    def _linear(self) -> list[tuple[float, float]]:
+        raise NotImplementedError
+
+    def _nonlinear(self, u: list[np.ndarray], t: float) -> list[np.ndarray]:
+        raise NotImplementedError
+
+    def _fft(self, u: list[np.ndarray]) -> list[np.ndarray]:
+        with self.phases.phase("fft"):
+            return [np.fft.rfft2(a) for a in u]
+
+    def _ifft(self, v: list[np.ndarray]) -> list[np.ndarray]:
+        with self.phases.phase("fft"):
+            return [np.fft.irfft2(a, s=self._shape) for a in v]
+
+    def step(self, t: float) -> None:
         with np.errstate(over="ignore", invalid="ignore"):
-            uv2 = u * v * v
+            if self.scheme == "etdrk4":
+                self.cur = self._etdrk4(t)
+            else:
+                v = self._fft(self.cur)
+                Nv = self._fft(self._nonlinear(self.cur, t))
+                self.cur = self._ifft(
+                    [(a + self.dt * n) * m for a, n, m in zip(v, Nv, self._implicit, strict=True)]
+                )
+
+    def _etdrk4(self, t: float) -> list[np.ndarray]:
+        h = self.dt
+        c = self._coef
+        v = self._fft(self.cur)
+        Nv = self._fft(self._nonlinear(self.cur, t))
+        a = [k["E2"] * x + k["Q"] * n for k, x, n in zip(c, v, Nv, strict=True)]
+        Na = self._fft(self._nonlinear(self._ifft(a), t + h / 2.0))
+        b = [k["E2"] * x + k["Q"] * n for k, x, n in zip(c, v, Na, strict=True)]
+        Nb = self._fft(self._nonlinear(self._ifft(b), t + h / 2.0))
+        cc = [
+            k["E2"] * x + k["Q"] * (2.0 * nb - n) for k, x, nb, n in zip(c, a, Nb, Nv, strict=True)
+        ]
+        Nc = self._fft(self._nonlinear(self._ifft(cc), t + h))
+        return self._ifft(
+            [
+                k["E"] * x + k["f1"] * n + 2.0 * k["f2"] * (na + nb) + k["f3"] * nc
+                for k, x, n, na, nb, nc in zip(c, v, Nv, Na, Nb, Nc, strict=True)
+            ]
+        )
+
+
+class _SQKSpectral(_SpectralStepper):
+    fields = ("G", "X", "Y")
+
+    def __init__(self, spec: SQKModelGSpec, state: tuple[np.ndarray, ...]) -> None:
+        self.spec = spec
+        g = spec.grid
+        self._forcing = forcing_basis(g.N, g.L, spec.forcing)
+        super().__init__(state, g.L / g.N, g.dt, g.scheme, state_dtype(g.precision))
+
+    def _linear(self) -> list[tuple[float, float]]:
+        s = self.spec
+        return [(s.Dg, s.beta_g), (s.Dx, s.beta_x), (s.Dy, s.beta_y)]
+
+    def _nonlinear(self, u: list[np.ndarray], t: float) -> list[np.ndarray]:
+        s = self.spec
+        G, X, Y = u
+        Q = (X + s.c1) ** 2 * (Y + s.c2)
+        NX = s.alpha_x * Q
+        if s.enable_forcing and self._forcing.active(t):
+            NX = NX + self._forcing.field(t, self.dtype)
+        return [s.alpha_g * Q, NX, s.alpha_y * Q]
+
+
+class _GrayScottSpectral(_SpectralStepper):
+    fields = ("u", "v")
+
+    def __init__(self, spec: GrayScottSpec, state: tuple[np.ndarray, ...]) -> None:
+        self.spec = spec
+        g = spec.grid
+        super().__init__(state, g.L / g.N, g.dt, g.scheme, state_dtype(g.precision))
+
+    def _linear(self) -> list[tuple[float, float]]:
+        s = self.spec
+        return [(s.Du, s.F), (s.Dv, s.F + s.k)]
+
+    def _nonlinear(self, u: list[np.ndarray], t: float) -> list[np.ndarray]:
+        s = self.spec
+        a, b = u
+        uv2 = a * b * b
+        return [s.F - uv2, uv2]
+
+
+_STEPPERS: dict[tuple[str, str], type[_Stepper]] = {
+    ("sqk", "euler"): _SQKEuler,
+    ("gs", "euler"): _GrayScottEuler,
+    ("sqk", "etdrk4"): _SQKSpectral,
+    ("gs", "etdrk4"): _GrayScottSpectral,
+    ("sqk", "imex-spectral"): _SQKSpectral,
+    ("gs", "imex-spectral"): _GrayScottSpectral,
+}
+
+# fused compiled kernels, used when the resolved backend is "numba"
+_FUSED_STEPPERS: dict[tuple[str, str], type[_Stepper]] = {
+    ("sqk", "euler"): _SQKFused,
+    ("gs", "euler"): _GrayScottFused,
+}
+
+
+def _make_stepper(
+    model: str,
+    spec: SQKModelGSpec | GrayScottSpec,
+    state: tuple[np.ndarray, ...],
+    threads: int = 1,
+    workers: int = 1,
+) -> _Stepper:
+    key = (model, spec.grid.scheme)
+    if key not in _STEPPERS:
+        raise ValueError(f"Unknown scheme: {spec.grid.scheme!r} (use one of {SCHEMES})")
+    if resolve_backend(spec.grid.backend, spec.grid.scheme) == "numba":
+        # the fused kernels run their own (numba) thread pool
+        return _FUSED_STEPPERS[key](spec, state)
+    stepper = _STEPPERS[key](spec, state)
+    if workers > 1 and isinstance(stepper, _EulerStepper):
+        stepper.set_workers(workers)
+    elif threads > 1 and isinstance(stepper, _EulerStepper):
+        stepper.set_threads(threads)
+    return stepper
+
 
-        du = spec.Du * Lu - uv2 + spec.F * (1.0 - u)
-        dv = spec.Dv * Lv + uv2 - (spec.F + spec.k) * v
+def _fixed_step_stats(stepper: _Stepper, scheme: str, steps_taken: int) -> dict[str, Any]:
+    return {
+        "scheme": scheme,
+        "backend": stepper.backend,
+        "steps": int(steps_taken),
+        "rhs_evals": int(steps_taken * stepper.rhs_per_step),
+    }
 
-        u = u + dt * du
-        v = v + dt * dv
 
-        if not _finite_all([u, v]):
+def _timing_stats(stepper: _Stepper, members: int, steps_taken: int) -> dict[str, Any]:
+    step_s = stepper.timer.seconds.get("step", 0.0)
+    return {
+        "members": int(members),
+        "stack": stepper.timer.as_dict(),
+        "steps_per_second": steps_taken / step_s if step_s > 0.0 else None,
+        "alloc_bytes": stepper.nbytes(),
+    }
+
+
+def _default_sinks(outs: list[SimResult]) -> list[SnapshotSink]:
+    # historical behaviour: every field of every snapshot kept in SimResult.snapshots
+    return [MemorySink(snapshots=out.snapshots) for out in outs]
+
+
+def _max_frames(steps: int, save_every: int) -> int:
+    return steps // save_every + 1
+
+
+def _retire(
+    stepper: _Stepper,
+    outs: list[SimResult],
+    sinks: Sequence[SnapshotSink],
+    active: list[int],
+    reasons: list[str],
+    status: str,
+    n: int,
+    t: float,
+    steps_taken: int,
+    scheme: str,
+) -> np.ndarray:
+    """
+    Finalize the members whose `reasons[row]` is non-empty; return the rows to keep.
+    """
+    for row, why in enumerate(reasons):
+        if not why:
+            continue
+        out = outs[active[row]]
+        out.status = status
+        out.stop_step = int(n)
+        out.stop_time = float(t)
+        out.stop_reason = str(why)
+        out.final = stepper.member(row, copy=True)
+        out.stats = _fixed_step_stats(stepper, scheme, steps_taken)
+        out.timing = _timing_stats(stepper, len(outs), steps_taken)
+        sinks[active[row]].end()
+    return np.flatnonzero([not why for why in reasons])
+
+
+@dataclass
+class _Restart:
+    """
+    Checkpoint plumbing for `_integrate`: where and how often to save, plus
+    the loaded checkpoint (arrays, meta) when resuming.
+    """
+
+    cfg: CheckpointConfig
+    fingerprint: str
+    stride: int
+    loaded: tuple[dict[str, np.ndarray], dict[str, Any]] | None = None
+
+    def save(self, stepper: _Stepper, state: dict[str, Any]) -> None:
+        arrays = {f"state_{k}": a for k, a in zip(stepper.fields, stepper.cur, strict=True)}
+        save_checkpoint(self.cfg.path, arrays, {"fingerprint": self.fingerprint, **state})
+
+
+def _integrate(
+    stepper: _Stepper,
+    outs: list[SimResult],
+    steps: int,
+    scheme: str,
+    sinks: Sequence[SnapshotSink],
+    health: HealthSpec | None = None,
+    restart: _Restart | None = None,
+) -> list[SimResult]:
+    """
+    Shared time loop: snapshot cadence, stepping and per-member blow-up labelling.
+
+    `outs[i]` and `sinks[i]` belong to row i of the stepper state. A member
+    that diverges is labelled, frozen and dropped from the stack; the others
+    keep running.
+
+    Health checks follow `health` (see `HealthSpec`). With `check_every > 1`
+    the state is checkpointed at every passing check; a check that finds
+    nan/inf restores the checkpoint and replays that window with per-step
+    checks, so status, stop_step, stop_time and final are exactly those of
+    per-step checking. `max_abs` / `max_growth` stop a member at the check
+    that trips them. A sink that sets `stop_reason` while receiving a snapshot
+    ends its member there with status "early_stop".
+
+    With `restart`, the whole loop state (stepper state, results so far, sink
+    states, health bookkeeping) is saved every `restart.stride` steps, on
+    snapshot steps after the push; a loaded checkpoint continues from there
+    and produces the same results bit for bit. Initial conditions are the only
+    randomness (seeded), so no RNG state has to be carried.
+
+    `stepper.timer` records "step", "snapshot" and "checkpoint" time; each
+    result gets it as `timing` when its member stops. "step" (stepping and
+    health checks) is timed once per snapshot stride, or per step with
+    separate "health" under `profiled` (see `fine_timer`).
+    """
+    health = HealthSpec() if health is None else health
+    timer, phases = stepper.timer, stepper.phases
+    clock = StrideClock(timer if phases is NULL_TIMER else NULL_TIMER, "step")
+    stepped = 0  # step() calls since the last clock lap
+    k = max(1, int(health.check_every))
+    track = health.max_abs > 0.0 or health.max_growth > 0.0
+    dt = outs[0].dt
+    save_every = outs[0].save_every
+    active = list(range(len(outs)))
+    prev_mx = np.zeros(len(outs))
+    prev_n = 0
+    start = 0
+
+    if restart is not None and restart.loaded is not None:
+        arrays, meta = restart.loaded
+        start, active = int(meta["n"]), list(meta["active"])
+        for out, saved in zip(outs, meta["outs"], strict=True):
+            vars(out).update(vars(saved))
+        for sink, st in zip(sinks, meta["sinks"], strict=True):
+            sink.set_state(st)
+        stepper.keep(np.asarray(active))
+        stepper.restore([arrays[f"state_{f}"] for f in stepper.fields])
+        prev_mx, prev_n = np.asarray(meta["prev_mx"]), int(meta["prev_n"])
+    else:
+        for sink in sinks:
+            sink.begin(_max_frames(steps, save_every))
+
+    ck = stepper.checkpoint() if k > 1 else None
+    ck_n = start  # first step after the checkpointed state
+    replay_to = -1
+
+    n = start
+    while n <= steps:
+        t = n * dt
+        replaying = n <= replay_to
+
+        snap = n % save_every == 0 and not replaying and not (n == start > 0)
+        save = restart is not None and n > start and n % restart.stride == 0 and not replaying
+        if snap or save:
+            clock.lap(stepped)
+            stepped = 0
+
+        if snap:
+            with timer.phase("snapshot"):
+                for row, i in enumerate(active):
+                    outs[i].times.append(float(t))
+                    sinks[i].push(float(t), stepper.member(row))
+
+            # a sink (e.g. a gate probe) may settle a trajectory at a snapshot
+            why = [sinks[i].stop_reason or "" for i in active]
+            if any(why):
+                keep = _retire(stepper, outs, sinks, active, why, "early_stop", n, t, n, scheme)
+                active = [active[row] for row in keep]
+                if not active:
+                    return outs
+                stepper.keep(keep)
+                prev_mx = prev_mx[keep]
+                if k > 1:
+                    ck, ck_n = stepper.checkpoint(), n
+
+        if save:
+            with timer.phase("checkpoint"):
+                restart.save(
+                    stepper,
+                    {
+                        "n": n,
+                        "active": active,
+                        "outs": outs,
+                        "sinks": [s.get_state() for s in sinks],
+                        "prev_mx": prev_mx,
+                        "prev_n": prev_n,
+                    },
+                )
+        if snap or save:
+            clock.reset()
+
+        # divergence is reported by the health checks below, not by fp warnings
+        with phases.phase("step"), np.errstate(over="ignore", invalid="ignore"):
+            stepper.step(t)
+        stepped += 1
+
+        due = k == 1 or replaying or n + 1 - ck_n >= k or (n + 1) % save_every == 0 or n == steps
+        if not due:
+            n += 1
+            continue
+
+        with phases.phase("health"):
+            mx = stepper.max_abs() if track else None
+            ok = np.isfinite(mx) if mx is not None else stepper.finite()
+        if ck is not None and not replaying and not ok.all():
+            # pin the first bad step: rewind to the last good state, step-check that window
+            stepper.restore(ck)
+            replay_to = n
+            n = ck_n
+            continue
+
+        reason = np.where(ok, "", "nonfinite")
+        if mx is not None:
+            if health.max_abs > 0.0:
+                reason = np.where(ok & (mx > health.max_abs), "max_abs", reason)
+            if health.max_growth > 0.0:
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    rate = (mx / prev_mx) ** (1.0 / (n + 1 - prev_n))
+                fast = ok & (mx > health.growth_floor) & (prev_mx > 0.0)
+                fast &= rate > health.max_growth
+                reason = np.where(fast & (reason == ""), "growth", reason)
+            prev_mx, prev_n = mx, n + 1
+
+        # blow-up detection: stop early, label the member, keep the rest running
+        if (reason != "").any():
+            clock.lap(stepped)
+            stepped = 0
+            keep = _retire(
+                stepper, outs, sinks, active, list(reason), "blowup", n, t, n + 1, scheme
+            )
+            active = [active[row] for row in keep]
+            if not active:
+                return outs
+            stepper.keep(keep)
+            prev_mx = prev_mx[keep]
+
+        if k > 1:
+            ck, ck_n = stepper.checkpoint(), n + 1
+        n += 1
+
+    clock.lap(stepped)
+    for row, i in enumerate(active):
+        outs[i].final = stepper.member(row)
+        outs[i].stats = _fixed_step_stats(stepper, scheme, steps + 1)
+        outs[i].timing = _timing_stats(stepper, len(outs), steps + 1)
+        sinks[i].end()
+    return outs
+
+
+def _histogram(x: list[float], bins: int, log: bool = False, **kw: Any) -> dict[str, list]:
+    if not x:
+        return {"edges": [], "counts": []}
+    v = np.log10(x) if log else np.asarray(x, dtype=float)
+    counts, edges = np.histogram(v, bins=bins, **kw)
+    if log:
+        edges = 10.0**edges
+    return {"edges": [float(e) for e in edges], "counts": [int(c) for c in counts]}
+
+
+def _integrate_adaptive(
+    stepper: _EulerStepper,
+    out: SimResult,
+    steps: int,
+    rtol: float,
+    atol: float,
+    sink: SnapshotSink,
+) -> SimResult:
+    """
+    Adaptive Bogacki–Shampine 3(2) loop for a single-member stepper.
+
+    Covers the same time window as the fixed-step loop ((steps + 1) * dt) and
+    lands exactly on its snapshot times n * dt (n % save_every == 0), so
+    downstream drift metrics see the same sampling. Steps whose embedded error
+    estimate exceeds the tolerance, or that produce nan/inf, are rejected and
+    retried smaller; the run is labelled "blowup" only when the step would
+    have to shrink below 1e-6 * dt. For blow-ups, `stop_step` counts accepted
+    steps and `stop_time` is the start time of the failed step.
+    """
+    dt = out.dt
+    t_out = [n * dt for n in range(0, steps + 1, out.save_every)]
+    t_end = (steps + 1) * dt
+    h_min = 1e-6 * dt
+    sink.begin(len(t_out))
+
+    y = stepper.cur
+    k1, k2, k3, k4 = ([np.empty_like(a) for a in y] for _ in range(4))
+    stepper.rhs_into(y, 0.0, k1)
+    rhs_evals = 1
+
+    accepted: list[float] = []
+    rejected: list[float] = []
+    t = 0.0
+    h = dt
+    i_out = 0
+    phases = stepper.phases
+    clock = StrideClock(stepper.timer if phases is NULL_TIMER else NULL_TIMER, "step")
+    tries = 0  # step attempts since the last clock lap
+    while True:
+        if i_out < len(t_out) and t >= t_out[i_out]:
+            clock.lap(tries)
+            tries = 0
+            out.times.append(float(t_out[i_out]))
+            with stepper.timer.phase("snapshot"):
+                sink.push(float(t_out[i_out]), stepper.member(0))
+            clock.reset()
+            i_out += 1
+            if sink.stop_reason:
+                out.status = "early_stop"
+                out.stop_step = len(accepted)
+                out.stop_time = float(t)
+                out.stop_reason = sink.stop_reason
+                break
+        target = t_out[i_out] if i_out < len(t_out) else t_end
+        if t >= t_end:
+            break
+
+        h_try = min(h, target - t)
+        tries += 1
+        with phases.phase("step"), np.errstate(over="ignore", invalid="ignore"):
+            y2 = [a + (0.5 * h_try) * b for a, b in zip(y, k1, strict=True)]
+            stepper.rhs_into(y2, t + 0.5 * h_try, k2)
+            y3 = [a + (0.75 * h_try) * b for a, b in zip(y, k2, strict=True)]
+            stepper.rhs_into(y3, t + 0.75 * h_try, k3)
+            y_new = [
+                a + h_try * ((2.0 / 9.0) * b1 + (1.0 / 3.0) * b2 + (4.0 / 9.0) * b3)
+                for a, b1, b2, b3 in zip(y, k1, k2, k3, strict=True)
+            ]
+            stepper.rhs_into(y_new, t + h_try, k4)
+            rhs_evals += 3
+            sq = 0.0
+            size = 0
+            for a, an, b1, b2, b3, b4 in zip(y, y_new, k1, k2, k3, k4, strict=True):
+                err = h_try * (
+                    (-5.0 / 72.0) * b1 + (1.0 / 12.0) * b2 + (1.0 / 9.0) * b3 - 0.125 * b4
+                )
+                scale = atol + rtol * np.maximum(np.abs(a), np.abs(an))
+                sq += float(np.sum((err / scale) ** 2))
+                size += err.size
+            err_norm = float(np.sqrt(sq / size))
+
+        if np.isfinite(err_norm) and err_norm <= 1.0:
+            t = target if h_try == target - t else t + h_try
+            y = y_new
+            k1, k4 = k4, k1
+            stepper.cur = y
+            accepted.append(h_try)
+            grow = 5.0 if err_norm == 0.0 else min(5.0, 0.9 * err_norm ** (-1.0 / 3.0))
+            h = max(h, h_try * grow) if h_try < h else h_try * grow
+            continue
+
+        rejected.append(t)
+        shrink = 0.25 if not np.isfinite(err_norm) else max(0.2, 0.9 * err_norm ** (-1.0 / 3.0))
+        h = h_try * shrink
+        if h < h_min:
             out.status = "blowup"
-            out.stop_step = int(n)
+            out.stop_step = len(accepted)
             out.stop_time = float(t)
-            out.final = {"u": u, "v": v}
-            return out
+            out.stop_reason = "step_underflow"
+            stepper.cur = y_new
+            break
 
-    out.final = {"u": u, "v": v}
+    clock.lap(tries)
+    sink.end()
+    out.final = stepper.member(0, copy=out.status != "ok")
+    out.stats = {
+        "scheme": "rk23",
+        "backend": stepper.backend,
+        "rtol": float(rtol),
+        "atol": float(atol),
+        "steps": len(accepted),
+        "rejected": len(rejected),
+        "rhs_evals": int(rhs_evals),
+        "dt_hist": _histogram(accepted, bins=10, log=True),
+        "reject_hist": _histogram(rejected, bins=10, range=(0.0, t_end)),
+    }
+    out.timing = _timing_stats(stepper, 1, len(accepted))
     return out
+
+
+def _chunk_members(N: int, max_members: int | None) -> int:
+    # past ~L2 size, wider stacks only add cache misses; stay near ENSEMBLE_CELLS per stack
+    if max_members is not None:
+        return max(1, int(max_members))
+    return max(1, ENSEMBLE_CELLS // (N * N))
+
+
+def _make_restart(
+    model: str,
+    spec: SQKModelGSpec | GrayScottSpec,
+    seeds: Sequence[int],
+    cfg: CheckpointConfig,
+) -> _Restart:
+    fingerprint = canonical_hash(
+        {"model": model, "spec": asdict(spec), "seeds": list(seeds), "tag": cfg.tag}
+    )
+    restart = _Restart(cfg, fingerprint, checkpoint_stride(cfg.every, spec.grid.save_every))
+    if cfg.resume and cfg.path.exists():
+        arrays, meta = load_checkpoint(cfg.path)
+        if meta.get("fingerprint") != fingerprint:
+            raise ValueError(f"checkpoint {cfg.path} belongs to a different spec, seeds or tag")
+        restart.loaded = (arrays, meta)
+    return restart
+
+
+def _run_ensemble(
+    model: str,
+    spec: SQKModelGSpec | GrayScottSpec,
+    seeds: Sequence[int],
+    max_members: int | None,
+    sinks: Sequence[SnapshotSink] | None,
+    checkpoint: CheckpointConfig | None = None,
+    threads: int = 1,
+    workers: int = 1,
+    initial: Sequence[tuple[np.ndarray, ...]] | None = None,
+) -> list[SimResult]:
+    g = spec.grid
+    steps = int(np.ceil(g.T / g.dt))
+    init = init_sqk if model == "sqk" else init_grayscott
+    if initial is not None and len(initial) != len(seeds):
+        raise ValueError(f"need one initial state per seed: got {len(initial)} for {len(seeds)}")
+
+    def start(i: int) -> tuple[np.ndarray, ...]:
+        if initial is None:
+            return init(spec, seed=seeds[i])
+        return tuple(np.array(a, dtype=float) for a in initial[i])
+
+    outs = [SimResult(model=model, dt=g.dt, T=g.T, save_every=g.save_every) for _ in seeds]
+    if sinks is None:
+        sinks = _default_sinks(outs)
+    elif len(sinks) != len(seeds):
+        raise ValueError(f"need one sink per seed: got {len(sinks)} for {len(seeds)} seeds")
+
+    if g.scheme == "rk23":
+        # step sizes are chosen per trajectory, so every seed gets its own stepper
+        resolve_backend(g.backend, g.scheme)  # rk23 runs on NumPy; rejects "numba"
+        if checkpoint is not None:
+            raise ValueError("checkpointing needs a fixed-step scheme (not 'rk23')")
+        if threads > 1 or workers > 1:
+            raise ValueError("threads / workers need a fixed-step scheme (not 'rk23')")
+        euler = _SQKEuler if model == "sqk" else _GrayScottEuler
+        for i, (res, sink) in enumerate(zip(outs, sinks, strict=True)):
+            stepper = euler(spec, tuple(a[None] for a in start(i)))
+            _integrate_adaptive(stepper, res, steps, g.rtol, g.atol, sink)
+        return outs
+
+    if checkpoint is not None:
+        # one stack, one file (stacking does not change any member's result)
+        inits = [start(i) for i in range(len(seeds))]
+        if initial is not None:
+            # the restart fingerprint must also cover the custom start states
+            digest = [hashlib.sha256(a.tobytes()).hexdigest() for st in inits for a in st]
+            checkpoint = replace(checkpoint, tag=f"{checkpoint.tag}:{canonical_hash(digest)}")
+        restart = _make_restart(model, spec, seeds, checkpoint)
+        stepper = _make_stepper(model, spec, tuple(map(np.stack, zip(*inits))), threads, workers)
+        try:
+            _integrate(stepper, outs, steps, g.scheme, sinks, g.health, restart)
+        finally:
+            stepper.close()
+        if not checkpoint.keep:
+            checkpoint.path.unlink(missing_ok=True)
+        return outs
+
+    chunk = _chunk_members(g.N, max_members)
+    for c in range(0, len(seeds), chunk):
+        part = slice(c, c + chunk)
+        inits = [start(i) for i in range(len(seeds))[part]]
+        stepper = _make_stepper(model, spec, tuple(map(np.stack, zip(*inits))), threads, workers)
+        try:
+            _integrate(stepper, outs[part], steps, g.scheme, sinks[part], g.health)
+        finally:
+            stepper.close()
+    return outs
+
+
+def run_sqk_model_g(
+    spec: SQKModelGSpec,
+    seed: int,
+    sink: SnapshotSink | None = None,
+    checkpoint: CheckpointConfig | None = None,
+    threads: int = 1,
+    workers: int = 1,
+    initial: tuple[np.ndarray, ...] | None = None,
+) -> SimResult:
+    """
+    Explicit-Euler integrator for the 3-field forced RD testbed.
+    Periodic BC, 5-point Laplacian.
+
+    Engine rule: if the system diverges (nan/inf), stop cleanly and mark status="blowup".
+    Snapshots stream into `sink` (default: kept in `SimResult.snapshots`).
+    """
+    sinks = None if sink is None else [sink]
+    return run_sqk_model_g_ensemble(
+        spec,
+        [seed],
+        sinks=sinks,
+        checkpoint=checkpoint,
+        threads=threads,
+        workers=workers,
+        initial=None if initial is None else [initial],
+    )[0]
+
+
+def run_sqk_model_g_ensemble(
+    spec: SQKModelGSpec,
+    seeds: Sequence[int],
+    max_members: int | None = None,
+    sinks: Sequence[SnapshotSink] | None = None,
+    checkpoint: CheckpointConfig | None = None,
+    threads: int = 1,
+    workers: int = 1,
+    initial: Sequence[tuple[np.ndarray, ...]] | None = None,
+) -> list[SimResult]:
+    """
+    Ensemble mode of `run_sqk_model_g`: seeds advance together as (B, N, N) stacks.
+
+    Each member is bit-identical to its standalone run, including blow-up labels.
+    Seeds are split into stacks of at most `max_members` (default: sized from N).
+    Snapshots go to `sinks[i]` for seed i (default: `SimResult.snapshots`).
+    With `checkpoint`, the stack is saved periodically and can be resumed
+    (see `CheckpointConfig`). `threads` > 1 steps Euler in row blocks on that
+    many threads, `workers` > 1 in that many processes over shared memory
+    (see `SharedDomain`); results are bit-identical to serial stepping.
+    `initial[i]` replaces the seeded initial state of member i (e.g. a warm
+    start interpolated from a coarser run; see `spectral_resample`).
+    """
+    return _run_ensemble(
+        "sqk", spec, seeds, max_members, sinks, checkpoint, threads, workers, initial
+    )
+
+
+def run_grayscott(
+    spec: GrayScottSpec,
+    seed: int,
+    sink: SnapshotSink | None = None,
+    checkpoint: CheckpointConfig | None = None,
+    threads: int = 1,
+    workers: int = 1,
+    initial: tuple[np.ndarray, ...] | None = None,
+) -> SimResult:
+    """
+    Explicit-Euler Gray–Scott baseline.
+
+    Engine rule: if the system diverges (nan/inf), stop cleanly and mark status="blowup".
+    Snapshots stream into `sink` (default: kept in `SimResult.snapshots`).
+    """
+    sinks = None if sink is None else [sink]
+    return run_grayscott_ensemble(
+        spec,
+        [seed],
+        sinks=sinks,
+        checkpoint=checkpoint,
+        threads=threads,
+        workers=workers,
+        initial=None if initial is None else [initial],
+    )[0]
+
+
+def run_grayscott_ensemble(
+    spec: GrayScottSpec,
+    seeds: Sequence[int],
+    max_members: int | None = None,
+    sinks: Sequence[SnapshotSink] | None = None,
+    checkpoint: CheckpointConfig | None = None,
+    threads: int = 1,
+    workers: int = 1,
+    initial: Sequence[tuple[np.ndarray, ...]] | None = None,
+) -> list[SimResult]:
+    """
+    Ensemble mode of `run_grayscott`: seeds advance together as (B, N, N) stacks.
+
+    Each member is bit-identical to its standalone run, including blow-up labels.
+    Seeds are split into stacks of at most `max_members` (default: sized from N).
+    Snapshots go to `sinks[i]` for seed i (default: `SimResult.snapshots`).
+    With `checkpoint`, the stack is saved periodically and can be resumed
+    (see `CheckpointConfig`). `threads` > 1 steps Euler in row blocks on that
+    many threads, `workers` > 1 in that many processes over shared memory
+    (see `SharedDomain`); results are bit-identical to serial stepping.
+    `initial[i]` replaces the seeded initial state of member i (e.g. a warm
+    start interpolated from a coarser run; see `spectral_resample`).
+    """
+    return _run_ensemble(
+        "gs", spec, seeds, max_members, sinks, checkpoint, threads, workers, initial
+    )
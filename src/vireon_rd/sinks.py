@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+
+from .eval import DriftAccumulator
+
+
+class SnapshotSink:
+    """
+    Receiver for the snapshots an integrator emits every `save_every` steps.
+
+    The integrator calls `begin(max_frames)` once, `push(t, fields)` per save
+    stride and `end()` when the trajectory stops (finished or blow-up).
+    `fields` are views into live stepper buffers: a sink must copy, reduce or
+    write out whatever it keeps before returning. A sink may set `stop_reason`
+    during `push` to ask the integrator to stop that trajectory there
+    (status "early_stop").
+
+    For checkpoint/restart, `get_state()` returns a picklable snapshot of the
+    sink after a push and `set_state()` restores it in place on a fresh sink
+    (instead of `begin`). The default covers sinks whose attributes pickle.
+    """
+
+    stop_reason: str | None = None
+
+    def begin(self, max_frames: int) -> None:
+        pass
+
+    def push(self, t: float, fields: dict[str, np.ndarray]) -> None:
+        raise NotImplementedError
+
+    def end(self) -> None:
+        pass
+
+    def get_state(self) -> dict[str, Any]:
+        return dict(self.__dict__)
+
+    def set_state(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+
+
+class TeeSink(SnapshotSink):
+    """
+    Fan one snapshot stream out to several sinks.
+    """
+
+    def __init__(self, *sinks: SnapshotSink) -> None:
+        self.sinks = sinks
+
+    def begin(self, max_frames: int) -> None:
+        for s in self.sinks:
+            s.begin(max_frames)
+
+    def push(self, t: float, fields: dict[str, np.ndarray]) -> None:
+        for s in self.sinks:
+            s.push(t, fields)
+
+    def end(self) -> None:
+        for s in self.sinks:
+            s.end()
+
+    def get_state(self) -> dict[str, Any]:
+        return {"sinks": [s.get_state() for s in self.sinks]}
+
+    def set_state(self, state: dict[str, Any]) -> None:
+        for s, st in zip(self.sinks, state["sinks"], strict=True):
+            s.set_state(st)
+
+    @property
+    def stop_reason(self) -> str | None:  # type: ignore[override]
+        return next((s.stop_reason for s in self.sinks if s.stop_reason), None)
+
+
+class MemorySink(SnapshotSink):
+    """
+    Keep copies of the selected fields (all fields if `fields` is None) in RAM.
+    """
+
+    def __init__(
+        self,
+        fields: Sequence[str] | None = None,
+        snapshots: list[dict[str, np.ndarray]] | None = None,
+    ) -> None:
+        self.fields = None if fields is None else tuple(fields)
+        self.times: list[float] = []
+        self.snapshots = [] if snapshots is None else snapshots
+
+    def push(self, t: float, fields: dict[str, np.ndarray]) -> None:
+        keys = fields.keys() if self.fields is None else self.fields
+        self.times.append(float(t))
+        self.snapshots.append({k: fields[k].copy() for k in keys})
+
+    def set_state(self, state: dict[str, Any]) -> None:
+        # refill in place: the list may be shared with SimResult.snapshots
+        state = dict(state)
+        self.snapshots[:] = state.pop("snapshots")
+        self.__dict__.update(state)
+
+    def series(self, name: str) -> list[np.ndarray]:
+        return [snap[name] for snap in self.snapshots]
+
+
+class DriftSink(SnapshotSink):
+    """
+    Feed one field into a `DriftAccumulator`; in exact mode `result()` matches
+    `eval_time_drift`. With `dtype`, frames are cast first (e.g. float64
+    metrics of a float32 run).
+    """
+
+    def __init__(
+        self,
+        field: str,
+        mode: str = "exact",
+        factor: int = 4,
+        dtype: np.dtype | type | None = None,
+    ) -> None:
+        self.field = field
+        self.acc = DriftAccumulator(mode=mode, factor=factor)
+        self.dtype = dtype
+
+    def push(self, t: float, fields: dict[str, np.ndarray]) -> None:
+        u = fields[self.field]
+        self.acc.add(u if self.dtype is None else u.astype(self.dtype, copy=False))
+
+    def result(self) -> dict[str, float]:
+        return self.acc.result()
@@ -2,6 +2,28 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
+# time integrators selectable via GridSpec.scheme
+SCHEMES = ("euler", "etdrk4", "imex-spectral", "rk23")
+
+# state / metrics precision selectable via GridSpec.precision
+PRECISIONS = ("float64", "float32", "mixed")
+
+# stepping backends selectable via GridSpec.backend ("auto": numba when installed)
+BACKENDS = ("numpy", "numba", "auto")
+
+
+@dataclass(frozen=True)
+class HealthSpec:
+    # nan/inf scan stride in steps; the step before each snapshot and the last step are
+    # always checked, and a hit rolls back to the last good check to pin stop_step exactly
+    check_every: int = 1
+    # stop a member as "blowup" once max|field| exceeds this (0: off)
+    max_abs: float = 0.0
+    # stop a member as "blowup" when max|field| grows faster than this factor per step
+    # (geometric mean over a check window) while above growth_floor (0: off)
+    max_growth: float = 0.0
+    growth_floor: float = 1.0
+
 
 @dataclass(frozen=True)
 class GridSpec:
@@ -10,6 +32,14 @@ class GridSpec:
     dt: float = 0.01  # timestep
     T: float = 60.0  # final time
     save_every: int = 10  # save stride (steps)
+    scheme: str = "euler"  # "euler" | "etdrk4" | "imex-spectral" | "rk23" (adaptive)
+    rtol: float = 1e-3  # rk23: relative error tolerance per step
+    atol: float = 1e-6  # rk23: absolute error tolerance per step
+    health: HealthSpec = field(default_factory=HealthSpec)  # fixed-step blow-up monitoring
+    # "float64" | "float32" (state, FFTs and metrics) | "mixed" (float32 state, float64 metrics)
+    precision: str = "float64"
+    # "numpy" | "numba" (fused compiled Euler kernels, optional dependency) | "auto"
+    backend: str = "numpy"
 
 
 @dataclass(frozen=True)
@@ -19,6 +49,12 @@ class ForcingSpec:
     sigma_r: float = 2.0
     t0: float = 10.0
     sigma_t: float = 3.0
+    # organizer centres (x, y) relative to the domain centre, at t = t0; χ sums over them
+    centers: tuple[tuple[float, float], ...] = ((0.0, 0.0),)
+    # source drift (units / time); moving sources use periodic minimum-image distances
+    velocity: tuple[float, float] = (0.0, 0.0)
+    # skip χ while the temporal envelope is below this (0.0: only once it underflows to 0)
+    cutoff: float = 0.0
 
 
 @dataclass(frozen=True)
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import json
+import shutil
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, overload
+
+import numpy as np
+
+from .sinks import SnapshotSink
+
+STORE_DIR = "trajectory"
+STORE_FORMAT = "vireon-trajectory"
+STORE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class StoreConfig:
+    fields: tuple[str, ...] | None = None  # None: every field of the model
+    chunk_frames: int = 64  # frames per chunk file
+    compress: bool = False  # zlib chunks (.npz) instead of memory-mappable .npy
+
+
+class TrajectoryWriter(SnapshotSink):
+    """
+    Snapshot sink that writes a chunked trajectory store.
+
+    Layout of `path`:
+      index.json             format, fields, frame shape/dtype, chunking, n_frames
+      times.npy              (n_frames,) snapshot times
+      <field>/<chunk>.npy    (<= chunk_frames, N, N) frame stacks (or .npz if compressed)
+      final/<field>.npy      end-of-run state (see `write_final`)
+
+    Only one chunk per field is buffered in memory. `index.json` is written
+    last, so a store without it is incomplete and is rejected by the reader.
+    """
+
+    def __init__(self, path: Path, cfg: StoreConfig | None = None) -> None:
+        self.path = Path(path)
+        self.cfg = StoreConfig() if cfg is None else cfg
+        self.times: list[float] = []
+        self._buf: dict[str, np.ndarray] = {}
+        self._fill = 0
+        self._chunks = 0
+
+    def begin(self, max_frames: int) -> None:
+        if (self.path / "index.json").exists():
+            shutil.rmtree(self.path)  # replace a previous store of the same run
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    def push(self, t: float, fields: dict[str, np.ndarray]) -> None:
+        if not self._buf:
+            keys = tuple(fields) if self.cfg.fields is None else self.cfg.fields
+            for k in keys:
+                a = fields[k]
+                self._buf[k] = np.empty((self.cfg.chunk_frames, *a.shape), dtype=a.dtype)
+                (self.path / k).mkdir(exist_ok=True)
+        for k, buf in self._buf.items():
+            buf[self._fill] = fields[k]
+        self._fill += 1
+        self.times.append(float(t))
+        if self._fill == self.cfg.chunk_frames:
+            self._flush()
+
+    def get_state(self) -> dict[str, Any]:
+        state = dict(self.__dict__)
+        del state["path"]  # a resumed run writes where its new sink points
+        return state
+
+    def _flush(self) -> None:
+        if self._fill == 0:
+            return
+        for k, buf in self._buf.items():
+            name = self.path / k / f"{self._chunks:05d}"
+            if self.cfg.compress:
+                np.savez_compressed(name.with_suffix(".npz"), data=buf[: self._fill])
+            else:
+                np.save(name.with_suffix(".npy"), buf[: self._fill])
+        self._chunks += 1
+        self._fill = 0
+
+    def end(self) -> None:
+        self._flush()
+        np.save(self.path / "times.npy", np.asarray(self.times, dtype=float))
+        first = next(iter(self._buf.values()), None)
+        index = {
+            "format": STORE_FORMAT,
+            "version": STORE_VERSION,
+            "fields": list(self._buf),
+            "frame_shape": [] if first is None else list(first.shape[1:]),
+            "dtype": "float64" if first is None else str(first.dtype),
+            "chunk_frames": int(self.cfg.chunk_frames),
+            "compress": bool(self.cfg.compress),
+            "n_frames": len(self.times),
+        }
+        (self.path / "index.json").write_text(json.dumps(index, indent=2) + "\n", encoding="utf-8")
+        self._buf = {}
+
+    def write_final(self, final: dict[str, np.ndarray]) -> None:
+        """
+        Store the end-of-run state (it is generally not one of the saved frames).
+        """
+        d = self.path / "final"
+        d.mkdir(parents=True, exist_ok=True)
+        for k, a in final.items():
+            np.save(d / f"{k}.npy", a)
+
+
+class FieldSeries(Sequence[np.ndarray]):
+    """
+    Lazy frame sequence of one stored field; frames are read chunk by chunk.
+    """
+
+    def __init__(self, traj: Trajectory, name: str) -> None:
+        self._traj = traj
+        self.name = name
+
+    def __len__(self) -> int:
+        return self._traj.n_frames
+
+    @overload
+    def __getitem__(self, i: int) -> np.ndarray: ...
+
+    @overload
+    def __getitem__(self, i: slice) -> np.ndarray: ...
+
+    def __getitem__(self, i: int | slice) -> np.ndarray:
+        if isinstance(i, slice):
+            idx = range(*i.indices(len(self)))
+            out = np.empty((len(idx), *self._traj.frame_shape), dtype=self._traj.dtype)
+            for j, n in enumerate(idx):
+                out[j] = self[n]
+            return out
+        n = int(i) + len(self) if i < 0 else int(i)
+        if not 0 <= n < len(self):
+            raise IndexError(f"frame {i} out of range for {len(self)} frames")
+        c, off = divmod(n, self._traj.chunk_frames)
+        return self._traj._chunk(self.name, c)[off]
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        for n in range(len(self)):
+            yield self[n]
+
+
+class Trajectory:
+    """
+    Read-only view of a trajectory store.
+
+    Uncompressed chunks are memory-mapped, compressed ones are inflated on
+    first access; only the most recently used chunk per field stays open.
+    """
+
+    def __init__(self, path: Path) -> None:
+        path = Path(path)
+        if not (path / "index.json").exists() and (path / STORE_DIR / "index.json").exists():
+            path = path / STORE_DIR  # accept the run directory as well
+        index_path = path / "index.json"
+        if not index_path.exists():
+            raise FileNotFoundError(f"no trajectory store at {path}")
+        index: dict[str, Any] = json.loads(index_path.read_text(encoding="utf-8"))
+        if index.get("format") != STORE_FORMAT:
+            raise ValueError(f"not a trajectory store: {index_path}")
+        if int(index.get("version", 0)) > STORE_VERSION:
+            raise ValueError(f"unsupported trajectory store version {index['version']}")
+
+        self.path = path
+        self.fields: tuple[str, ...] = tuple(index["fields"])
+        self.frame_shape: tuple[int, ...] = tuple(index["frame_shape"])
+        self.dtype = np.dtype(index["dtype"])
+        self.chunk_frames = int(index["chunk_frames"])
+        self.compress = bool(index["compress"])
+        self.n_frames = int(index["n_frames"])
+        self.times = np.load(path / "times.npy")
+        self._open: dict[str, tuple[int, np.ndarray]] = {}
+
+    def __len__(self) -> int:
+        return self.n_frames
+
+    def _chunk(self, name: str, c: int) -> np.ndarray:
+        hit = self._open.get(name)
+        if hit is not None and hit[0] == c:
+            return hit[1]
+        if name not in self.fields:
+            raise KeyError(name)
+        if self.compress:
+            with np.load(self.path / name / f"{c:05d}.npz") as z:
+                data = z["data"]
+        else:
+            data = np.load(self.path / name / f"{c:05d}.npy", mmap_mode="r")
+        self._open[name] = (c, data)
+        return data
+
+    def series(self, name: str) -> FieldSeries:
+        if name not in self.fields:
+            raise KeyError(name)
+        return FieldSeries(self, name)
+
+    def frame(self, n: int) -> dict[str, np.ndarray]:
+        return {k: self.series(k)[n] for k in self.fields}
+
+    @property
+    def final(self) -> dict[str, np.ndarray]:
+        d = self.path / "final"
+        if not d.is_dir():
+            return {}
+        return {p.stem: np.load(p, mmap_mode="r") for p in sorted(d.glob("*.npy"))}
+
+
+def open_trajectory(path: Path) -> Trajectory:
+    """
+    Open the store of a run (`path` may be the run directory or its trajectory/).
+    """
+    return Trajectory(path)
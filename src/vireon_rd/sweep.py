@@ -0,0 +1,325 @@
+from __future__ import annotations
+
+import csv
+import itertools
+import json
+import math
+import tomllib
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor
+from dataclasses import asdict, dataclass, field, fields, is_dataclass, replace
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from .cache import canonical_hash
+from .engine import RunOptions, _run_dirs
+from .io import write_json
+from .parallel import make_pool
+from .specs import GrayScottSpec, SQKModelGSpec, get_spec
+
+# ways of turning `params` axes into points
+DESIGNS = ("grid", "random", "lhs")
+
+SWEEP_RUNS_DIR = "runs"
+
+
+@dataclass(frozen=True)
+class SweepDesign:
+    """
+    Declarative parameter sweep over one spec.
+
+    `params` maps a dotted spec field path ("F", "grid.N", "forcing.scale", ...)
+    to an axis: a list of values, or a range {low, high, num?, log?}.
+      grid    cartesian product; a range needs `num` points
+      random  `samples` independent uniform draws per axis (lists: uniform choice)
+      lhs     `samples` Latin-hypercube points (one draw per stratum per axis)
+    `base` overrides are applied to every point; every point runs every seed.
+    """
+
+    spec: str = "gs"
+    design: str = "grid"
+    params: dict[str, Any] = field(default_factory=dict)
+    base: dict[str, Any] = field(default_factory=dict)
+    seeds: tuple[int, ...] = (1,)
+    samples: int = 0
+    rng_seed: int = 0
+
+
+@dataclass(frozen=True)
+class SweepJob:
+    id: str
+    spec_name: str
+    spec: SQKModelGSpec | GrayScottSpec
+    seed: int
+    params: dict[str, Any]
+
+
+def load_design(path: Path) -> SweepDesign:
+    """
+    Read a sweep design from a .toml or .json file (keys as in `SweepDesign`).
+    """
+    path = Path(path)
+    if path.suffix.lower() == ".toml":
+        raw = tomllib.loads(path.read_text(encoding="utf-8"))
+    else:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+    return design_from_dict(raw)
+
+
+def design_from_dict(raw: dict[str, Any]) -> SweepDesign:
+    """
+    Build a `SweepDesign` from a parsed design document (unknown keys are an error).
+    """
+    raw = dict(raw)
+    known = {f.name for f in fields(SweepDesign)}
+    unknown = sorted(set(raw) - known)
+    if unknown:
+        raise ValueError(f"unknown sweep design keys: {unknown}")
+    if "seeds" in raw:
+        raw["seeds"] = tuple(int(s) for s in raw["seeds"])
+    return SweepDesign(**raw)
+
+
+_BOOL_STRINGS = {"true": True, "1": True, "false": False, "0": False}
+
+
+def _coerce(default: Any, value: Any, path: str, round_ints: bool) -> Any:
+    if isinstance(default, bool):
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, str) and value.strip().lower() in _BOOL_STRINGS:
+            return _BOOL_STRINGS[value.strip().lower()]
+        raise ValueError(f"{path} must be a boolean (true/false/1/0), got {value!r}")
+    if isinstance(default, int):
+        if not round_ints and float(value) != int(round(float(value))):
+            raise ValueError(f"{path} must be an integer, got {value!r}")
+        return int(round(float(value)))
+    if isinstance(default, float):
+        return float(value)
+    if isinstance(default, tuple):
+        return tuple(tuple(v) if isinstance(v, list) else v for v in value)
+    return value
+
+
+def set_field(spec: Any, path: str, value: Any, *, round_ints: bool = False) -> Any:
+    """
+    Return a copy of the (nested, frozen) dataclass `spec` with the dotted
+    field `path` set to `value`, coerced to the type of the current value.
+    Non-integral values of int fields are an error unless `round_ints`.
+    """
+    head, _, rest = path.partition(".")
+    names = {f.name for f in fields(spec)}
+    if head not in names:
+        raise ValueError(f"unknown field {path!r} for {type(spec).__name__}")
+    current = getattr(spec, head)
+    if rest:
+        if not is_dataclass(current):
+            raise ValueError(f"{head!r} of {type(spec).__name__} has no sub-fields")
+        return replace(spec, **{head: set_field(current, rest, value, round_ints=round_ints)})
+    if is_dataclass(current):
+        raise ValueError(f"{path!r} is a nested spec; set its fields instead")
+    name = f"{type(spec).__name__}.{head}"
+    return replace(spec, **{head: _coerce(current, value, name, round_ints)})
+
+
+def get_field(spec: Any, path: str) -> Any:
+    for name in path.split("."):
+        spec = getattr(spec, name)
+    return spec
+
+
+def _model(spec: SQKModelGSpec | GrayScottSpec) -> str:
+    return "sqk" if isinstance(spec, SQKModelGSpec) else "gs"
+
+
+def job_id(spec: SQKModelGSpec | GrayScottSpec, seed: int) -> str:
+    """
+    Content hash of (model, every spec field, seed): equal runs share an id.
+    """
+    return canonical_hash({"model": _model(spec), "spec": asdict(spec), "seed": int(seed)})[:16]
+
+
+def _is_range(axis: Any) -> bool:
+    return isinstance(axis, dict)
+
+
+def _grid_values(path: str, axis: Any) -> list[Any]:
+    if not _is_range(axis):
+        return list(axis)
+    if "num" not in axis:
+        raise ValueError(f"grid axis {path!r} needs `num` points")
+    lo, hi, num = float(axis["low"]), float(axis["high"]), int(axis["num"])
+    vals = np.geomspace(lo, hi, num) if axis.get("log") else np.linspace(lo, hi, num)
+    return [float(v) for v in vals]
+
+
+def _from_unit(axis: Any, u: float) -> Any:
+    # map u in [0, 1) onto the axis
+    if not _is_range(axis):
+        return list(axis)[min(int(u * len(axis)), len(axis) - 1)]
+    lo, hi = float(axis["low"]), float(axis["high"])
+    if axis.get("log"):
+        return float(math.exp(math.log(lo) + u * (math.log(hi) - math.log(lo))))
+    return float(lo + u * (hi - lo))
+
+
+def design_points(design: SweepDesign) -> list[dict[str, Any]]:
+    """
+    Expand the design into parameter points ({path: value}, in `params` order).
+    """
+    if design.design not in DESIGNS:
+        raise ValueError(f"unknown design {design.design!r} (use one of {DESIGNS})")
+    names = list(design.params)
+    axes = [design.params[k] for k in names]
+    if design.design == "grid":
+        combos = itertools.product(*(_grid_values(k, a) for k, a in zip(names, axes, strict=True)))
+        return [dict(zip(names, c, strict=True)) for c in combos]
+
+    n = int(design.samples)
+    if n < 1:
+        raise ValueError(f"{design.design} design needs samples >= 1")
+    rng = np.random.default_rng(design.rng_seed)
+    if design.design == "random":
+        U = rng.random((n, len(names)))
+    else:
+        # one point per stratum [i/n, (i+1)/n) on every axis, strata paired at random
+        U = np.empty((n, len(names)))
+        for j in range(len(names)):
+            U[:, j] = (rng.permutation(n) + rng.random(n)) / n
+    return [
+        {k: _from_unit(a, float(U[i, j])) for j, (k, a) in enumerate(zip(names, axes, strict=True))}
+        for i in range(n)
+    ]
+
+
+def expand_design(design: SweepDesign) -> list[SweepJob]:
+    """
+    Expand the design into jobs (points x seeds) with content-hashed ids.
+    Duplicate points (same spec and seed) are kept once.
+    """
+    base = get_spec(design.spec)
+    for path, value in design.base.items():
+        base = set_field(base, path, value)
+    jobs: list[SweepJob] = []
+    seen: set[str] = set()
+    for point in design_points(design):
+        spec = base
+        for path, value in point.items():
+            # continuous ranges over integer fields (grid.N, ...) snap to the nearest integer
+            spec = set_field(spec, path, value, round_ints=_is_range(design.params[path]))
+        point = {path: get_field(spec, path) for path in point}  # as coerced
+        for seed in design.seeds:
+            jid = job_id(spec, seed)
+            if jid in seen:
+                continue
+            seen.add(jid)
+            jobs.append(SweepJob(jid, design.spec, spec, int(seed), point))
+    return jobs
+
+
+def summary_row(job: SweepJob, run_dir: Path) -> dict[str, Any]:
+    """
+    One flat summary row (id, seed, params, health, metrics, gates) of a finished run.
+    """
+    meta = json.loads((run_dir / "meta.json").read_text(encoding="utf-8"))
+    metrics = json.loads((run_dir / "metrics.json").read_text(encoding="utf-8"))
+    gates = json.loads((run_dir / "falsifiers.json").read_text(encoding="utf-8"))
+    row: dict[str, Any] = {"id": job.id, "seed": job.seed}
+    row.update(job.params)
+    row.update({k: meta.get(k) for k in ("status", "stop_step", "stop_reason")})
+    row.update({k: v for k, v in metrics.items() if isinstance(v, int | float)})
+    row.update({k: int(bool(v)) for k, v in gates.items()})
+    return row
+
+
+def _run_group(
+    group: list[SweepJob],
+    runs_dir: Path,
+    opts: RunOptions | None,
+) -> list[dict[str, Any]]:
+    # jobs of one group share a spec and are stepped as one ensemble
+    spec = group[0].spec
+    dirs = [runs_dir / j.id for j in group]
+    done = _run_dirs(group[0].spec_name, spec, [j.seed for j in group], dirs, True, opts)
+    rows = []
+    for j, d, (_, hit, _) in zip(group, dirs, done, strict=True):
+        row = summary_row(j, d)
+        if opts is not None and opts.cache is not None:
+            row["cached"] = int(hit)
+        rows.append(row)
+    return rows
+
+
+def write_summary_csv(path: Path, rows: list[dict[str, Any]]) -> None:
+    """
+    Write rows as CSV; columns are the union of row keys in first-seen order.
+    """
+    cols: dict[str, None] = {}
+    for r in rows:
+        cols.update(dict.fromkeys(r))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", newline="", encoding="utf-8") as f:
+        w = csv.DictWriter(f, fieldnames=list(cols), restval="")
+        w.writeheader()
+        w.writerows(rows)
+
+
+def run_sweep(
+    design: SweepDesign,
+    out_dir: Path,
+    *,
+    jobs: int = 1,
+    opts: RunOptions | None = None,
+    executor: Executor | None = None,
+    progress: Callable[[list[dict[str, Any]]], None] | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Run every job of `design` and write:
+      sweep.json    the design and the expanded job list
+      runs/<id>/    the usual run artifacts of each job
+      summary.csv   one row per job, in job order
+
+    Seeds of one point run as a stacked ensemble; points are spread over
+    `jobs` worker processes, or over `executor` when one is given (e.g. the
+    warm pool of `vireon-rd serve`). `progress` gets the rows of each point
+    as it finishes. Returns the summary rows.
+    """
+    out_dir = Path(out_dir)
+    expanded = expand_design(design)
+    write_json(
+        out_dir / "sweep.json",
+        {
+            "design": asdict(design),
+            "jobs": [{"id": j.id, "seed": j.seed, "params": j.params} for j in expanded],
+        },
+    )
+
+    groups: dict[Any, list[SweepJob]] = {}
+    for j in expanded:
+        groups.setdefault(j.spec, []).append(j)
+    runs_dir = out_dir / SWEEP_RUNS_DIR
+    parts = list(groups.values())
+    n = len(parts)
+    results: list[list[dict[str, Any]]] = []
+
+    def collect(done: Iterable[list[dict[str, Any]]]) -> None:
+        for rows in done:
+            results.append(rows)
+            if progress is not None:
+                progress(rows)
+
+    if executor is not None:
+        collect(executor.map(_run_group, parts, [runs_dir] * n, [opts] * n))
+    elif jobs > 1 and n > 1:
+        with make_pool(jobs) as pool:
+            chunk = max(1, n // (4 * jobs))
+            collect(pool.map(_run_group, parts, [runs_dir] * n, [opts] * n, chunksize=chunk))
+    else:
+        collect(_run_group(p, runs_dir, opts) for p in parts)
+
+    by_id = {r["id"]: r for rows in results for r in rows}
+    rows = [by_id[j.id] for j in expanded]
+    write_summary_csv(out_dir / "summary.csv", rows)
+    return rows
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import cProfile
+import io
+import pstats
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+try:  # POSIX only
+    import resource
+except ImportError:  # pragma: no cover - depends on the platform
+    resource = None
+
+PROFILE_FILE = "profile.pstats"
+PROFILE_TEXT = "profile.txt"
+MEMORY_TEXT = "memory.txt"
+
+
+class PhaseTimer:
+    """
+    Wall time and call count per named phase (`time.perf_counter`).
+
+    `with timer.phase("write"): ...` records one call. Phases may nest (e.g.
+    "laplacian" inside "step"); each one simply accumulates its own time.
+    Per-step work goes through `fine_timer` or a `StrideClock` instead, so it
+    costs nothing unless profiling.
+    """
+
+    def __init__(self) -> None:
+        self.seconds: dict[str, float] = {}
+        self.calls: dict[str, int] = {}
+
+    def add(self, name: str, seconds: float, calls: int = 1) -> None:
+        self.seconds[name] = self.seconds.get(name, 0.0) + seconds
+        self.calls[name] = self.calls.get(name, 0) + calls
+
+    def phase(self, name: str) -> _Phase:
+        return _Phase(self, name)
+
+    def as_dict(self) -> dict[str, dict[str, float]]:
+        return {k: {"seconds": s, "calls": self.calls[k]} for k, s in self.seconds.items()}
+
+
+class _Phase:
+    __slots__ = ("name", "t0", "timer")
+
+    def __init__(self, timer: PhaseTimer, name: str) -> None:
+        self.timer = timer
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.t0 = perf_counter()
+
+    def __exit__(self, *exc: object) -> None:
+        self.timer.add(self.name, perf_counter() - self.t0)
+
+
+class NullTimer(PhaseTimer):
+    """
+    A PhaseTimer that records nothing; `phase()` is a shared no-op context.
+    """
+
+    def add(self, name: str, seconds: float, calls: int = 1) -> None:
+        pass
+
+    def phase(self, name: str) -> nullcontext[None]:  # type: ignore[override]
+        return _NO_PHASE
+
+
+_NO_PHASE: nullcontext[None] = nullcontext()
+NULL_TIMER = NullTimer()
+_fine = False  # per-step phases on (inside `profiled`)
+
+
+def fine_timer(timer: PhaseTimer) -> PhaseTimer:
+    """
+    Where per-step phases ("step", "health", "laplacian", ...) go: `timer`
+    while `profiled` is active in this process, NULL_TIMER otherwise.
+    """
+    return timer if _fine else NULL_TIMER
+
+
+class StrideClock:
+    """
+    Per-step work timed once per stride: `lap(calls)` adds the wall time
+    since the previous `lap` / `reset` to `timer` as `calls` calls of `name`.
+    """
+
+    __slots__ = ("name", "t0", "timer")
+
+    def __init__(self, timer: PhaseTimer, name: str) -> None:
+        self.timer = timer
+        self.name = name
+        self.reset()
+
+    def reset(self) -> None:
+        self.t0 = perf_counter()
+
+    def lap(self, calls: int) -> None:
+        if calls:
+            self.timer.add(self.name, perf_counter() - self.t0, calls)
+        self.reset()
+
+
+def peak_rss_bytes() -> int | None:
+    """
+    Peak resident set size of this process so far (None where unavailable).
+    """
+    if resource is None:
+        return None
+    return int(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss) * 1024  # Linux: KiB
+
+
+def rollup(timings: list[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Suite-level totals of per-run `timing` blocks (see `engine._write_run`).
+
+    "stack" phases are shared by the `members` runs stepped together, so each
+    run contributes 1/members of them; "run" phases add up as they are.
+    """
+    phases: dict[str, float] = {}
+    for tm in timings:
+        share = 1.0 / max(1, int(tm.get("members", 1)))
+        for k, v in tm.get("stack", {}).items():
+            phases[k] = phases.get(k, 0.0) + share * float(v["seconds"])
+        for k, v in tm.get("run", {}).items():
+            phases[k] = phases.get(k, 0.0) + float(v["seconds"])
+    rates = [float(tm["steps_per_second"]) for tm in timings if tm.get("steps_per_second")]
+    return {
+        "runs": len(timings),
+        "seconds": phases,
+        "steps_per_second_mean": sum(rates) / len(rates) if rates else None,
+        "alloc_bytes_max": max((int(tm.get("alloc_bytes", 0)) for tm in timings), default=0),
+    }
+
+
+@contextmanager
+def profiled(out_dir: Path, top: int = 40) -> Iterator[None]:
+    """
+    cProfile + tracemalloc around the block. Writes into `out_dir`:
+      profile.pstats  the raw profile (`python -m pstats`, snakeviz, ...)
+      profile.txt     the `top` functions by cumulative time
+      memory.txt      tracemalloc peak and the `top` allocation sites at the end
+
+    Steppers created inside the block also time their per-step phases (see
+    `fine_timer`). Only this process is profiled (not pool or domain workers).
+    """
+    global _fine
+    out_dir = Path(out_dir)
+    prof = cProfile.Profile()
+    fine, _fine = _fine, True
+    tracemalloc.start()
+    prof.enable()
+    try:
+        yield
+    finally:
+        prof.disable()
+        _fine = fine
+        current, peak = tracemalloc.get_traced_memory()
+        stats = tracemalloc.take_snapshot().statistics("lineno")
+        tracemalloc.stop()
+        out_dir.mkdir(parents=True, exist_ok=True)
+        prof.dump_stats(out_dir / PROFILE_FILE)
+        buf = io.StringIO()
+        pstats.Stats(prof, stream=buf).sort_stats("cumulative").print_stats(top)
+        (out_dir / PROFILE_TEXT).write_text(buf.getvalue(), encoding="utf-8")
+        lines = [f"peak traced: {peak} bytes", f"current traced: {current} bytes", ""]
+        lines += [str(s) for s in stats[:top]]
+        (out_dir / MEMORY_TEXT).write_text("\n".join(lines) + "\n", encoding="utf-8")
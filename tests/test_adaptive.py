@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from vireon_rd.checkpoint import CheckpointConfig
+from vireon_rd.sim import run_grayscott
+from vireon_rd.specs import GrayScottSpec, GridSpec
+
+BASE = GrayScottSpec(
+    grid=GridSpec(N=16, L=16.0, dt=0.05, T=100.0, save_every=100),
+    F=0.04,
+    k=0.06,
+    seed_square_frac=0.3,
+)
+
+
+def _with_grid(**kw) -> GrayScottSpec:
+    return replace(BASE, grid=replace(BASE.grid, **kw))
+
+
+def test_rk23_matches_reference_with_fewer_rhs_evals() -> None:
+    euler = run_grayscott(BASE, seed=1)
+    adaptive = run_grayscott(_with_grid(scheme="rk23", rtol=1e-5, atol=1e-8), seed=1)
+    # fine Euler reference over the same window ((steps + 1) * dt = 100.05)
+    ref = run_grayscott(_with_grid(dt=0.0125, T=100.0375, save_every=400), seed=1)
+
+    assert adaptive.status == "ok"
+    assert adaptive.times == euler.times
+    assert adaptive.stats["rhs_evals"] < euler.stats["rhs_evals"] / 2
+
+    err_adaptive = np.abs(adaptive.final["v"] - ref.final["v"]).max()
+    err_euler = np.abs(euler.final["v"] - ref.final["v"]).max()
+    assert err_adaptive < err_euler
+
+
+def test_rk23_records_step_histograms() -> None:
+    sim = run_grayscott(_with_grid(scheme="rk23", T=10.0), seed=2)
+
+    stats = sim.stats
+    assert stats["scheme"] == "rk23"
+    assert sum(stats["dt_hist"]["counts"]) == stats["steps"]
+    assert sum(stats["reject_hist"]["counts"]) == stats["rejected"]
+
+
+@pytest.mark.parametrize(
+    "kw",
+    [
+        {"checkpoint": "every"},
+        {"checkpoint": "resume"},
+        {"threads": 2},
+        {"workers": 2},
+    ],
+    ids=["checkpoint", "resume", "threads", "workers"],
+)
+def test_rk23_rejects_fixed_step_options(kw: dict, tmp_path: Path) -> None:
+    if "checkpoint" in kw:
+        ck = tmp_path / "ck.npz"
+        kw = {"checkpoint": CheckpointConfig(path=ck, every=5, resume=kw["checkpoint"] == "resume")}
+    with pytest.raises(ValueError, match="fixed-step scheme"):
+        run_grayscott(_with_grid(scheme="rk23", T=1.0), seed=1, **kw)
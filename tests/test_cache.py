@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import replace
+from pathlib import Path
+
+from vireon_rd import engine
+from vireon_rd.cache import CacheConfig, ResultCache
+from vireon_rd.engine import RunOptions, cache_key, run_one, run_suite
+from vireon_rd.specs import GrayScottSpec, GridSpec
+from vireon_rd.store import StoreConfig
+
+SPEC = GrayScottSpec(grid=GridSpec(N=16, L=16.0, dt=0.5, T=10.0, save_every=5))
+FILES = ("meta.json", "metrics.json", "falsifiers.json", "report.md")
+
+
+def test_hit_reuses_artifacts_without_simulating(tmp_path: Path, monkeypatch) -> None:
+    opts = RunOptions(cache=CacheConfig(root=tmp_path / "cache"))
+    first = run_one("gs", 1, tmp_path / "a", spec=SPEC, opts=opts)
+
+    def no_sim(*args, **kwargs):
+        raise AssertionError("simulated on a cache hit")
+
+    monkeypatch.setattr(engine, "_simulate", no_sim)
+    again = run_one("gs", 1, tmp_path / "b", spec=SPEC, opts=opts)
+
+    assert again == first
+    for f in FILES:
+        assert (tmp_path / "a" / f).read_bytes() == (tmp_path / "b" / f).read_bytes()
+
+
+def test_key_covers_spec_seed_and_options() -> None:
+    base = cache_key("gs", SPEC, 1)
+    assert cache_key("gs", SPEC, 1) == base
+    assert cache_key("gs", SPEC, 2) != base
+    assert cache_key("gs", replace(SPEC, k=0.061), 1) != base
+    assert cache_key("gs", SPEC, 1, RunOptions(store=StoreConfig())) != base
+
+    old = engine.ENGINE_VERSION
+    try:
+        engine.ENGINE_VERSION = "0.0.0-test"
+        assert cache_key("gs", SPEC, 1) != base
+    finally:
+        engine.ENGINE_VERSION = old
+
+
+def test_lru_eviction_drops_least_recently_used(tmp_path: Path) -> None:
+    cache = ResultCache(CacheConfig(root=tmp_path / "cache", max_bytes=10**9))
+    for i, key in enumerate(("aa01", "bb02", "cc03")):
+        src = tmp_path / key
+        src.mkdir()
+        (src / "metrics.json").write_bytes(b"x" * 1000)
+        cache.put(key, src)
+        os.utime(cache.path(key) / ".entry.json", (i, i))
+    assert cache.get("aa01", tmp_path / "use")  # aa01 becomes most recently used
+
+    freed = cache.evict(max_bytes=2500)
+
+    assert freed == 1000
+    assert not cache.path("bb02").exists()
+    assert cache.path("aa01").exists() and cache.path("cc03").exists()
+    assert cache.stats() == {"hits": 1, "misses": 0, "evictions": 1}
+
+
+def test_suite_reuses_canonical_run(tmp_path: Path) -> None:
+    opts = RunOptions(cache=CacheConfig(root=tmp_path / "cache"))
+    run_one("gs", 1, tmp_path / "gs" / "seed_1", spec=SPEC, opts=opts)
+
+    summary = run_suite("gs", [1, 2], tmp_path / "suite", spec=SPEC, opts=opts)
+
+    assert summary["cache"] == {"hits": 1, "misses": 1}
+    suite = json.loads((tmp_path / "suite" / "suite.json").read_text(encoding="utf-8"))
+    assert suite["cache"] == summary["cache"]
+
+    parse = engine.build_parser().parse_args
+    assert engine._run_options(parse(["run", "--no-cache"])).cache is None
+    assert engine._run_options(parse(["run", "--cache-dir", "c"])).cache.root == Path("c")
+
+
+def test_hit_leaves_unrelated_files_alone(tmp_path: Path) -> None:
+    opts = RunOptions(cache=CacheConfig(root=tmp_path / "cache"))
+    out = tmp_path / "out"
+    (out / "notes").mkdir(parents=True)
+    (out / "keep.txt").write_text("mine", encoding="utf-8")
+    (out / "notes" / "a.md").write_text("also mine", encoding="utf-8")
+
+    run_one("gs", 1, out, spec=SPEC, opts=opts)  # miss: only run artifacts are stored
+    (entry,) = (p for _, _, p in ResultCache(opts.cache).entries())
+    assert sorted(p.name for p in entry.iterdir()) == sorted((".entry.json", *FILES))
+
+    (out / "metrics.json").write_text("stale", encoding="utf-8")
+    ((_, hit, _),) = engine._run_dirs("gs", SPEC, [1], [out], True, opts)  # restores in place
+    assert hit
+
+    assert (out / "keep.txt").read_text(encoding="utf-8") == "mine"
+    assert (out / "notes" / "a.md").read_text(encoding="utf-8") == "also mine"
+    assert json.loads((out / "metrics.json").read_text(encoding="utf-8"))
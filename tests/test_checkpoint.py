@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from vireon_rd.checkpoint import CheckpointConfig, load_checkpoint
+from vireon_rd.engine import RunOptions, run_one
+from vireon_rd.sim import run_grayscott_ensemble, run_sqk_model_g_ensemble
+from vireon_rd.sinks import DriftSink, MemorySink, SnapshotSink, TeeSink
+from vireon_rd.specs import GrayScottSpec, GridSpec, HealthSpec, SQKModelGSpec
+from vireon_rd.store import StoreConfig, open_trajectory
+
+
+class _Kill(SnapshotSink):
+    """
+    Simulated pre-emption: raise on the `at`-th push while armed.
+    """
+
+    armed = True
+
+    def __init__(self, at: int) -> None:
+        self.at = at
+        self.pushed = 0
+
+    def push(self, t: float, fields: dict[str, np.ndarray]) -> None:
+        self.pushed += 1
+        if _Kill.armed and self.pushed == self.at:
+            raise RuntimeError("killed")
+
+
+def _sinks(n: int, kill_at: int) -> tuple[list[MemorySink], list[DriftSink], list[SnapshotSink]]:
+    mems = [MemorySink() for _ in range(n)]
+    drifts = [DriftSink("v") for _ in range(n)]
+    tees = [TeeSink(m, d, _Kill(kill_at)) for m, d in zip(mems, drifts, strict=True)]
+    return mems, drifts, tees
+
+
+def _assert_same(a, b) -> None:
+    assert (a.status, a.stop_step, a.stop_time, a.stop_reason) == (
+        b.status,
+        b.stop_step,
+        b.stop_time,
+        b.stop_reason,
+    )
+    assert a.times == b.times
+    assert a.stats == b.stats
+    for k in a.final:
+        assert np.array_equal(a.final[k], b.final[k], equal_nan=True)
+
+
+def test_resume_after_kill_is_bit_identical(tmp_path: Path) -> None:
+    spec = GrayScottSpec(grid=GridSpec(N=16, L=16.0, dt=0.5, T=60.0, save_every=5))
+    seeds = [1, 2]
+    ck = CheckpointConfig(path=tmp_path / "ck.npz", every=12, resume=True)
+    ref = run_grayscott_ensemble(spec, seeds)
+
+    _Kill.armed = True
+    with pytest.raises(RuntimeError, match="killed"):
+        run_grayscott_ensemble(spec, seeds, sinks=_sinks(2, kill_at=20)[2], checkpoint=ck)
+    _, meta = load_checkpoint(ck.path)
+    assert meta["n"] == 90  # last multiple of 15 (12 rounded up to save_every) before step 95
+
+    _Kill.armed = False
+    mems, drifts, tees = _sinks(2, kill_at=20)
+    got = run_grayscott_ensemble(spec, seeds, sinks=tees, checkpoint=ck)
+
+    mems_ref, drifts_ref, tees_ref = _sinks(2, kill_at=0)
+    run_grayscott_ensemble(spec, seeds, sinks=tees_ref)
+    for g, r, m, mr, d, dr in zip(got, ref, mems, mems_ref, drifts, drifts_ref, strict=True):
+        _assert_same(g, r)
+        assert m.times == mr.times
+        assert all(np.array_equal(x["v"], y["v"]) for x, y in zip(m.snapshots, mr.snapshots))
+        assert d.result() == dr.result()
+    assert not ck.path.exists()
+
+
+def test_resume_keeps_blowup_labels_with_strided_checks(tmp_path: Path) -> None:
+    grid = GridSpec(N=32, L=12.0, T=1.0, save_every=5, health=HealthSpec(check_every=3))
+    spec = SQKModelGSpec(grid=grid)
+    ck = CheckpointConfig(path=tmp_path / "ck.npz", every=5, resume=True)
+    ref = run_sqk_model_g_ensemble(spec, [1, 2])
+    assert all(r.status == "blowup" for r in ref)
+
+    _Kill.armed = True
+    kill = [TeeSink(MemorySink(), _Kill(4)) for _ in range(2)]
+    with pytest.raises(RuntimeError):
+        run_sqk_model_g_ensemble(spec, [1, 2], sinks=kill, checkpoint=ck)
+
+    # a resumed run needs the same sink layout as the one that wrote the checkpoint
+    _Kill.armed = False
+    mems = [MemorySink() for _ in range(2)]
+    got = run_sqk_model_g_ensemble(
+        spec, [1, 2], sinks=[TeeSink(m, _Kill(4)) for m in mems], checkpoint=ck
+    )
+
+    for g, r, m in zip(got, ref, mems, strict=True):
+        _assert_same(g, r)
+        assert all(
+            np.array_equal(x["X"], y["X"]) for x, y in zip(m.snapshots, r.snapshots, strict=True)
+        )
+
+
+def test_checkpoint_rejects_other_spec(tmp_path: Path) -> None:
+    spec = GrayScottSpec(grid=GridSpec(N=16, L=16.0, dt=0.5, T=20.0, save_every=5))
+    ck = CheckpointConfig(path=tmp_path / "ck.npz", every=5, keep=True)
+    run_grayscott_ensemble(spec, [1], checkpoint=ck)
+    assert ck.path.exists()
+
+    with pytest.raises(ValueError, match="different spec"):
+        run_grayscott_ensemble(replace(spec, k=0.05), [1], checkpoint=replace(ck, resume=True))
+
+
+def test_run_resume_reproduces_artifacts(tmp_path: Path, monkeypatch) -> None:
+    spec = GrayScottSpec(grid=GridSpec(N=16, L=16.0, dt=0.5, T=60.0, save_every=5))
+    store = StoreConfig(chunk_frames=4)
+    run_one("gs", 1, tmp_path / "ref", spec=spec, opts=RunOptions(store=store))
+
+    push = DriftSink.push
+    calls = {"n": 0}
+
+    def dying_push(self, t, fields):
+        calls["n"] += 1
+        if calls["n"] == 17:
+            raise RuntimeError("killed")
+        push(self, t, fields)
+
+    opts = RunOptions(store=store, checkpoint_every=20, resume=True)
+    monkeypatch.setattr(DriftSink, "push", dying_push)
+    with pytest.raises(RuntimeError):
+        run_one("gs", 1, tmp_path / "run", spec=spec, opts=opts)
+    assert (tmp_path / "run" / "checkpoint.npz").exists()
+    monkeypatch.setattr(DriftSink, "push", push)
+
+    run_one("gs", 1, tmp_path / "run", spec=spec, opts=opts)
+
+    for f in ("metrics.json", "falsifiers.json"):
+        assert (tmp_path / "run" / f).read_bytes() == (tmp_path / "ref" / f).read_bytes()
+    a, b = open_trajectory(tmp_path / "run"), open_trajectory(tmp_path / "ref")
+    assert np.array_equal(a.times, b.times)
+    assert np.array_equal(a.series("v")[:], b.series("v")[:])
+    assert not (tmp_path / "run" / "checkpoint.npz").exists()
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import numpy as np
+
+from vireon_rd.numerics import init_grayscott
+from vireon_rd.sim import _GrayScottEuler, run_grayscott_ensemble, run_sqk_model_g
+from vireon_rd.specs import ForcingSpec, GrayScottSpec, GridSpec, SQKModelGSpec
+
+
+def test_shared_memory_workers_are_bit_identical() -> None:
+    grid = GridSpec(N=48, L=48.0, dt=1.0, T=150.0, save_every=50)
+    spec = GrayScottSpec(grid=grid, seed_square_frac=0.25)
+    ref = run_grayscott_ensemble(spec, [1, 2])
+    res = run_grayscott_ensemble(spec, [1, 2], workers=3)
+    for a, b in zip(ref, res, strict=True):
+        assert (a.status, a.stats) == (b.status, b.stats)
+        assert all(np.array_equal(a.final[k], b.final[k]) for k in a.final)
+        assert len(a.snapshots) == len(b.snapshots)
+        for sa, sb in zip(a.snapshots, b.snapshots, strict=True):
+            assert all(np.array_equal(sa[k], sb[k]) for k in sa)
+
+
+def test_shared_memory_workers_with_forcing() -> None:
+    grid = GridSpec(N=32, L=20.0, dt=0.05, T=2.0, save_every=10)
+    spec = SQKModelGSpec(grid=grid, forcing=ForcingSpec(t0=1.0, velocity=(0.5, 0.0)))
+    ref = run_sqk_model_g(spec, seed=3)
+    res = run_sqk_model_g(spec, seed=3, workers=2)
+    assert all(np.array_equal(ref.final[k], res.final[k]) for k in ref.final)
+
+
+def test_dropping_members_keeps_the_domain() -> None:
+    grid = GridSpec(N=32, L=32.0, dt=1.0)
+    spec = GrayScottSpec(grid=grid, seed_square_frac=0.25)
+    state = tuple(map(np.stack, zip(*[init_grayscott(spec, s) for s in (1, 2, 3)], strict=True)))
+    ref, shared = _GrayScottEuler(spec, state), _GrayScottEuler(spec, state)
+    shared.set_workers(2)
+    domain = shared._domain
+    assert domain is not None
+    procs = list(domain.procs)
+    try:
+        for n in range(8):
+            if n in (3, 5):
+                keep = np.array([0, 2]) if n == 3 else np.array([1])
+                ref.keep(keep)
+                shared.keep(keep)
+            ref.step(n * grid.dt)
+            shared.step(n * grid.dt)
+            assert all(np.array_equal(a, b) for a, b in zip(ref.cur, shared.cur, strict=True))
+        assert shared._domain is domain and domain.procs == procs
+        assert all(p.is_alive() for p in procs)
+    finally:
+        shared.close()
+    assert shared.cur[0].shape == (1, 32, 32)
+
+
+def test_blowup_mid_run_matches_serial_with_workers() -> None:
+    grid = GridSpec(N=32, L=32.0, dt=1.0, T=40.0, save_every=10)
+    spec = GrayScottSpec(grid=grid, seed_square_frac=0.25)
+    starts = [init_grayscott(spec, s) for s in (1, 2, 3)]
+    u, v = starts[1]
+    starts[1] = (u, v * 1e40)  # diverges within a few steps; the others keep running
+    ref = run_grayscott_ensemble(spec, [1, 2, 3], initial=starts)
+    res = run_grayscott_ensemble(spec, [1, 2, 3], workers=2, initial=starts)
+    assert [r.status for r in ref] == ["ok", "blowup", "ok"]
+    for a, b in zip(ref, res, strict=True):
+        assert (a.status, a.stop_step, a.times) == (b.status, b.stop_step, b.times)
+        assert all(np.array_equal(a.final[k], b.final[k], equal_nan=True) for k in a.final)
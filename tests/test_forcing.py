@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import numpy as np
+
+from vireon_rd.numerics import forcing_basis, forcing_field, init_sqk
+from vireon_rd.sim import _SQKEuler
+from vireon_rd.specs import ForcingSpec, GridSpec, SQKModelGSpec
+
+
+def _rebuild(N: int, L: float, t: float, fs: ForcingSpec) -> np.ndarray:
+    # the original per-step construction
+    x = (np.arange(N) - (N - 1) / 2.0) * (L / N)
+    X, Y = np.meshgrid(x, x, indexing="xy")
+    spatial = np.exp(-0.5 * (X * X + Y * Y) / (fs.sigma_r * fs.sigma_r))
+    temporal = np.exp(-0.5 * ((t - fs.t0) ** 2) / (fs.sigma_t * fs.sigma_t))
+    return -fs.scale * spatial * temporal
+
+
+def test_cached_forcing_is_bit_identical_to_rebuild() -> None:
+    fs = ForcingSpec(scale=0.7, sigma_r=1.3, t0=2.0, sigma_t=0.5)
+    assert forcing_basis(40, 12.0, fs) is forcing_basis(40, 12.0, fs)
+    for t in np.linspace(0.0, 6.0, 25):
+        assert np.array_equal(forcing_field(40, 12.0, t, fs), _rebuild(40, 12.0, t, fs))
+
+
+def test_cutoff_skips_the_tail() -> None:
+    fs = ForcingSpec(t0=1.0, sigma_t=0.1, cutoff=1e-6)
+    spec = SQKModelGSpec(grid=GridSpec(N=16, L=8.0), forcing=fs)
+    stepper = _SQKEuler(spec, init_sqk(spec, seed=1))
+
+    assert not forcing_basis(16, 8.0, fs).active(5.0)
+    assert stepper._forcing_term(5.0) is None
+    assert np.array_equal(stepper._forcing_term(1.0), forcing_field(16, 8.0, 1.0, fs))
+    assert np.array_equal(stepper._forcing_term(1.0, 4, 9), forcing_field(16, 8.0, 1.0, fs)[4:9])
+
+
+def test_multiple_and_moving_sources() -> None:
+    N, L = 32, 32.0
+    two = forcing_basis(N, L, ForcingSpec(centers=((-8.0, 0.0), (8.0, 0.0)))).field(10.0)
+    left = forcing_basis(N, L, ForcingSpec(centers=((-8.0, 0.0),))).field(10.0)
+    right = forcing_basis(N, L, ForcingSpec(centers=((8.0, 0.0),))).field(10.0)
+    assert np.allclose(two, left + right)
+
+    moving = forcing_basis(N, L, ForcingSpec(velocity=(2.0, 0.0), sigma_t=100.0))
+    x = (np.arange(N) - (N - 1) / 2.0) * (L / N)
+    # at t0 the source sits at the centre; 4 time units later it has moved 8 units in +x
+    assert np.allclose(moving.field(10.0), forcing_field(N, L, 10.0, ForcingSpec(sigma_t=100.0)))
+    col = int(np.argmin(moving.field(14.0).min(axis=0)))
+    assert abs(x[col] - 8.0) <= L / N
+    # and wraps around the periodic domain
+    col = int(np.argmin(moving.field(10.0 + 12.0).min(axis=0)))
+    assert abs(x[col] - (24.0 - L)) <= L / N
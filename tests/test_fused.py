@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import json
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from vireon_rd.engine import RunOptions, run_one
+from vireon_rd.fused import HAVE_NUMBA, resolve_backend
+from vireon_rd.numerics import init_grayscott, init_sqk
+from vireon_rd.sim import _GrayScottEuler, _GrayScottFused, _SQKEuler, _SQKFused, run_grayscott
+from vireon_rd.specs import ForcingSpec, GrayScottSpec, GridSpec, SQKModelGSpec
+
+
+def _stack(inits: list[tuple[np.ndarray, ...]]) -> tuple[np.ndarray, ...]:
+    return tuple(map(np.stack, zip(*inits, strict=True)))
+
+
+def test_resolve_backend() -> None:
+    assert resolve_backend("numpy") == "numpy"
+    assert resolve_backend("auto") == ("numba" if HAVE_NUMBA else "numpy")
+    assert resolve_backend("auto", "etdrk4") == "numpy"
+    with pytest.raises(ValueError, match="Unknown backend"):
+        resolve_backend("cuda")
+
+
+@pytest.mark.skipif(HAVE_NUMBA, reason="numba is installed")
+def test_numba_backend_requires_numba() -> None:
+    with pytest.raises(ValueError, match="needs numba"):
+        resolve_backend("numba")
+
+
+@pytest.mark.parametrize("precision", ["float64", "float32"])
+def test_fused_kernels_match_numpy_steppers(precision: str) -> None:
+    # without numba the kernels run as plain Python loops, so keep the grid tiny
+    grid = GridSpec(N=8, L=8.0, dt=0.05, precision=precision)
+    sqk = SQKModelGSpec(grid=grid, forcing=ForcingSpec(t0=0.0, sigma_r=1.5))
+    gs = GrayScottSpec(grid=replace(grid, dt=1.0))
+    cases = [
+        (_SQKEuler, _SQKFused, sqk, _stack([init_sqk(sqk, s) for s in (1, 2)])),
+        (_GrayScottEuler, _GrayScottFused, gs, _stack([init_grayscott(gs, s) for s in (1, 2)])),
+    ]
+    rtol = 1e-12 if precision == "float64" else 1e-5
+    for ref_cls, fused_cls, spec, state in cases:
+        ref, fused = ref_cls(spec, state), fused_cls(spec, state)
+        for n in range(4):
+            ref.step(n * spec.grid.dt)
+            fused.step(n * spec.grid.dt)
+        for a, b in zip(ref.cur, fused.cur, strict=True):
+            assert b.dtype == np.dtype(precision)
+            np.testing.assert_allclose(b, a, rtol=rtol, atol=rtol)
+
+
+def test_meta_records_backend(tmp_path: Path) -> None:
+    grid = GridSpec(N=16, L=16.0, dt=1.0, T=20.0, save_every=5)
+    run_one("gs", 1, tmp_path, spec=GrayScottSpec(grid=grid), opts=RunOptions())
+    meta = json.loads((tmp_path / "meta.json").read_text(encoding="utf-8"))
+    assert meta["grid"]["backend"] == "numpy"
+    assert meta["integrator"]["backend"] == "numpy"
+
+
+@pytest.mark.skipif(not HAVE_NUMBA, reason="numba not installed")
+def test_numba_backend_run_matches_numpy() -> None:
+    grid = GridSpec(N=32, L=32.0, dt=1.0, T=200.0, save_every=50)
+    ref = run_grayscott(GrayScottSpec(grid=grid), seed=1)
+    res = run_grayscott(GrayScottSpec(grid=replace(grid, backend="numba")), seed=1)
+    assert res.stats["backend"] == "numba"
+    np.testing.assert_allclose(res.final["v"], ref.final["v"], rtol=1e-9, atol=1e-12)
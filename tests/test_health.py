@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from dataclasses import replace
+
+import numpy as np
+
+from vireon_rd.sim import run_sqk_model_g, run_sqk_model_g_ensemble
+from vireon_rd.specs import GridSpec, HealthSpec, SQKModelGSpec
+
+# default SQK coefficients diverge after ~20 steps at this resolution
+GRID = GridSpec(N=32, L=12.0, T=1.0, save_every=5)
+
+
+def _spec(health: HealthSpec) -> SQKModelGSpec:
+    return SQKModelGSpec(grid=replace(GRID, health=health))
+
+
+def test_strided_checks_pin_the_same_stop_step() -> None:
+    seeds = [1, 2, 3]
+    ref = [run_sqk_model_g(_spec(HealthSpec()), seed=s) for s in seeds]
+    assert all(r.status == "blowup" for r in ref)
+
+    for every in (3, 7, 50):
+        got = run_sqk_model_g_ensemble(_spec(HealthSpec(check_every=every)), seeds)
+        for a, b in zip(got, ref, strict=True):
+            assert (a.status, a.stop_step, a.stop_time) == (b.status, b.stop_step, b.stop_time)
+            assert a.stop_reason == b.stop_reason == "nonfinite"
+            assert a.times == b.times
+            for k in ("G", "X", "Y"):
+                assert np.array_equal(a.final[k], b.final[k], equal_nan=True)
+                for sa, sb in zip(a.snapshots, b.snapshots, strict=True):
+                    assert np.array_equal(sa[k], sb[k])
+
+
+def test_growth_and_amplitude_limits_stop_before_overflow() -> None:
+    ref = run_sqk_model_g(_spec(HealthSpec()), seed=1)
+
+    for health, reason in (
+        (HealthSpec(max_abs=1e6), "max_abs"),
+        (HealthSpec(max_growth=1.5, check_every=4), "growth"),
+    ):
+        sim = run_sqk_model_g(_spec(health), seed=1)
+        assert sim.status == "blowup"
+        assert sim.stop_reason == reason
+        assert sim.stop_step < ref.stop_step
+        assert all(np.isfinite(a).all() for a in sim.final.values())
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from vireon_rd.eval import EvalConfig, classify_pattern, eval_field, eval_field_batch
+from vireon_rd.metrics import (
+    anisotropy_index,
+    anisotropy_index_batch,
+    kl_divergence,
+    localization_index,
+    localization_index_batch,
+    peak_wavelength_from_profile,
+    radial_average,
+    radial_geometry,
+    spectral_pipeline,
+    structure_factor_batch,
+)
+
+
+@pytest.mark.parametrize("shape", [(4, 16, 16), (3, 15, 15), (2, 12, 17)])
+def test_rfft_structure_factor_matches_full_fft(shape: tuple[int, ...]) -> None:
+    x = np.random.default_rng(0).normal(size=shape)
+    ref = np.stack([np.fft.fftshift(np.abs(np.fft.fft2(a - a.mean())) ** 2) for a in x])
+
+    S = structure_factor_batch(x)
+
+    assert S.shape == ref.shape
+    assert np.allclose(S, ref, rtol=1e-12, atol=1e-12 * ref.max())
+
+
+def test_spectral_pipeline_matches_per_frame_metrics() -> None:
+    rng = np.random.default_rng(1)
+    stack = rng.normal(size=(6, 32, 32)).cumsum(axis=1)
+    stack[2] = 3.0  # blank frame: zero spectrum, KL 0, no peak
+
+    out = spectral_pipeline(stack, lambda_star=True)
+
+    for t, u in enumerate(stack):
+        S = np.fft.fftshift(np.abs(np.fft.fft2(u - u.mean())) ** 2)
+        Sf = np.fft.fftshift(np.abs(np.fft.fft2(stack[-1] - stack[-1].mean())) ** 2)
+        assert out["kl_to_final"][t] == pytest.approx(kl_divergence(S, Sf), rel=1e-10, abs=1e-14)
+        if t != 2:
+            lam = peak_wavelength_from_profile(*radial_average(S))
+            assert out["lambda_star"][t] == pytest.approx(lam)
+
+
+def test_cached_radial_geometry_binning() -> None:
+    S = np.random.default_rng(2).random((32, 32))
+    y, x = np.indices(S.shape)
+    r_int = np.sqrt((x - 15.5) ** 2 + (y - 15.5) ** 2).astype(int)
+    ref = np.array([S[r_int == k].mean() for k in range(r_int.max() + 1)])
+
+    r, prof = radial_average(S)
+    assert np.array_equal(r, np.arange(ref.size))
+    assert np.allclose(prof, ref, rtol=1e-13)
+    assert radial_geometry((32, 32)) is radial_geometry((32, 32))
+    assert not radial_geometry((32, 32)).bins.flags.writeable
+
+    # physical k: same bins, rescaled coordinates; λ* comes out in length units
+    k, prof_k = radial_average(S, dx=0.5)
+    assert np.array_equal(prof_k, prof)
+    assert np.allclose(k, r * 2.0 * np.pi / (32 * 0.5))
+    lam_idx = peak_wavelength_from_profile(r, prof)
+    assert peak_wavelength_from_profile(k, prof_k) == pytest.approx(
+        lam_idx * 32 * 0.5 / (2 * np.pi)
+    )
+
+    r_half, prof_half = radial_average(S, bin_width=0.5)
+    assert np.allclose(r_half[:4], [0.0, 0.5, 1.0, 1.5])
+    # half-width bins 2k and 2k+1 partition integer bin k
+    counts = radial_geometry((32, 32), None, 0.5).counts
+    starts = np.arange(0, counts.size, 2)
+    merged = np.add.reduceat(prof_half * counts, starts) / np.add.reduceat(counts, starts)
+    assert np.allclose(merged, prof, rtol=1e-13)
+
+    assert anisotropy_index(S) == anisotropy_index(S.copy())
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_eval_field_batch_matches_single_fields(dtype: type) -> None:
+    rng = np.random.default_rng(2)
+    stack = np.stack(
+        [
+            rng.normal(size=(24, 24)).cumsum(axis=1),  # stripes-like
+            np.exp(-(np.add.outer(np.arange(24.0) - 12, np.arange(24.0) - 12) ** 2) / 8),
+            np.full((24, 24), 0.3),  # blank
+            rng.random((24, 24)) ** 6,
+        ]
+    ).astype(dtype)
+    cfg = EvalConfig()
+
+    batch = eval_field_batch(stack, cfg)
+
+    for i, u in enumerate(stack):
+        single = eval_field(u, cfg)
+        assert batch["label"][i] == single["label"]
+        assert batch["label"][i] == classify_pattern(structure_factor_batch(u), u, cfg)
+        for k in ("lambda_star", "anisotropy", "localization"):
+            assert np.array_equal(batch[k][i], single[k], equal_nan=True), k
+    assert batch["label"][2] == "blank"
+
+
+def _reference_localization(u: np.ndarray, q: float, eps: float = 1e-12) -> float:
+    # the original single-field definition
+    e = u * u
+    total = float(e.sum())
+    if eps >= total:
+        return 0.0
+    flat = np.sort(e.ravel())
+    k = int(max(1, round((1.0 - q) * flat.size)))
+    return float(float(flat[k:].sum()) / total)
+
+
+def _reference_anisotropy(S: np.ndarray, eps: float = 1e-12) -> float:
+    geo = radial_geometry(S.shape)
+    w = np.maximum(S, 0.0)
+    Z = float(w.sum())
+    if eps >= Z:
+        return 0.0
+    mxx = float((w * geo.gx * geo.gx).sum()) / Z
+    myy = float((w * geo.gy * geo.gy).sum()) / Z
+    return float(abs(mxx - myy) / (mxx + myy + eps))
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_batched_moments_match_single_field_definitions_exactly(dtype: type) -> None:
+    rng = np.random.default_rng(3)
+    for shape in ((5, 33, 33), (4, 64, 64), (3, 12, 17)):
+        stack = (rng.normal(size=shape) * rng.random((shape[0], 1, 1))).astype(dtype)
+        S = structure_factor_batch(stack)
+        aniso = anisotropy_index_batch(S)
+        for q in (0.5, 0.95, 0.999):
+            loc = localization_index_batch(stack, q=q)
+            for u, got in zip(stack, loc, strict=True):
+                assert got == _reference_localization(u, q)
+                assert localization_index(u, q=q) == got
+        for s, got in zip(S, aniso, strict=True):
+            assert got == _reference_anisotropy(s)
+            assert anisotropy_index(s) == got
+    assert localization_index(np.zeros((8, 8))) == 0.0
+
+
+def test_nonfinite_fields_propagate_like_single_field_definitions() -> None:
+    rng = np.random.default_rng(4)
+    stack = rng.normal(size=(5, 16, 16))
+    stack[0, 3, 4] = np.nan
+    stack[1, 7, 7] = np.inf
+    stack[2, :, :] = -np.inf
+    stack[3] = 0.0  # blank: still 0.0
+    S = np.maximum(structure_factor_batch(np.nan_to_num(stack)), 0.0)
+    S[0, 2, 2] = np.nan
+    S[1, 5, 9] = np.inf
+    with np.errstate(invalid="ignore", over="ignore"):
+        loc = localization_index_batch(stack)
+        aniso = anisotropy_index_batch(S)
+        for i in range(stack.shape[0]):
+            for got, one, ref in (
+                (loc[i], localization_index(stack[i]), _reference_localization(stack[i], 0.95)),
+                (aniso[i], anisotropy_index(S[i]), _reference_anisotropy(S[i])),
+            ):
+                assert np.array_equal(got, ref, equal_nan=True)
+                assert np.array_equal(one, ref, equal_nan=True)
+    assert np.isnan(loc[:3]).all() and loc[3] == 0.0
+    assert np.isnan(aniso[:2]).all()
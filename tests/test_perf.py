@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import json
+from dataclasses import replace
+
+import numpy as np
+
+from vireon_rd.perf import (
+    LEGACY_PREFIX,
+    PerfConfig,
+    check,
+    compare,
+    config_from,
+    machine_info,
+    mann_whitney_greater,
+    run_perf,
+    select_cases,
+)
+
+
+def _doc(samples: dict[str, list[float]], tag: str = "box") -> dict:
+    return {
+        "machine": {"tag": tag},
+        "benchmarks": {
+            k: {"kind": "micro", "samples": v, "median": float(np.median(v))}
+            for k, v in samples.items()
+        },
+    }
+
+
+def test_mann_whitney_one_sided() -> None:
+    fast, slow = [1.0, 1.1, 0.9, 1.05, 0.95, 1.02, 0.98], [1.3, 1.4, 1.25, 1.35, 1.5, 1.28, 1.32]
+    assert mann_whitney_greater(slow, fast) < 0.01
+    assert mann_whitney_greater(fast, slow) > 0.99
+    assert mann_whitney_greater([1.0] * 5, [1.0] * 5) == 1.0  # all tied: no evidence
+
+
+def test_compare_flags_only_significant_changes() -> None:
+    rng = np.random.default_rng(0)
+    base = {k: list(1.0 + 0.01 * rng.standard_normal(7)) for k in ("a", "b", "c", "d")}
+    cur = {
+        "a": [x * 1.3 for x in base["a"]],  # clearly slower
+        "b": [x * 0.7 for x in base["b"]],  # clearly faster
+        "c": list(1.0 + 0.01 * rng.standard_normal(7)),  # noise
+        "d": [x * 1.02 for x in base["d"]],  # significant but under the threshold
+    }
+    res = compare(_doc(base), _doc(cur, tag="other"), alpha=0.01, threshold=0.05)
+    verdicts = {r["name"]: r["verdict"] for r in res["rows"]}
+    assert verdicts == {"a": "slower", "b": "faster", "c": "same", "d": "same"}
+    assert res["regressions"] == ["a"]
+    assert not res["same_machine"]
+    assert check(_doc(base), _doc(cur))[0]["regressions"] == ["a"]
+
+
+def test_run_perf_records_a_baseline() -> None:
+    cfg = PerfConfig(kinds=("micro",), sizes=(16,), repeats=3, min_time=0.001, filter="laplacian*")
+    assert [c.name for c in select_cases(cfg)] == ["laplacian_periodic[N=16]"]
+    doc = json.loads(json.dumps(run_perf(cfg)))
+    (res,) = doc["benchmarks"].values()
+    assert len(res["samples"]) == 3 and res["median"] > 0.0 and res["number"] >= 1
+    assert doc["machine"]["tag"] == machine_info()["tag"]
+    assert config_from(doc) == cfg
+    assert {c.name.split("[")[0] for c in select_cases(PerfConfig(kinds=("macro",)))} == {
+        "run_one",
+        "run_suite",
+    }
+
+
+def test_legacy_cases_pair_with_micro_cases() -> None:
+    cfg = PerfConfig(kinds=("micro", "legacy"), sizes=(16,), threads=(1, 2), repeats=1)
+    cases = {c.name: c for c in select_cases(cfg)}
+    legacy = [n for n in cases if n.startswith(LEGACY_PREFIX)]
+    assert legacy and all(n.removeprefix(LEGACY_PREFIX) in cases for n in legacy)
+    assert "euler_step[sqk,N=16,threads=2]" in cases
+    names = {"legacy:euler_step[gs,N=16]", "euler_step[gs,N=16]"}
+    doc = run_perf(replace(cfg, min_time=0.001), names=names)
+    assert set(doc["benchmarks"]) == names
+    assert all(r["peak_alloc_bytes"] > 0 for r in doc["benchmarks"].values())
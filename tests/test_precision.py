@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from vireon_rd.engine import _evaluate, _simulate, validate_precision
+from vireon_rd.sim import run_grayscott
+from vireon_rd.sinks import MemorySink
+from vireon_rd.specs import GrayScottSpec, GridSpec
+
+
+def _gs(precision: str = "float64", scheme: str = "euler") -> GrayScottSpec:
+    grid = GridSpec(N=32, L=32.0, dt=1.0, T=300.0, save_every=50, scheme=scheme)
+    return GrayScottSpec(grid=replace(grid, precision=precision), seed_square_frac=0.25)
+
+
+@pytest.mark.parametrize("scheme", ["euler", "etdrk4"])
+def test_float32_state_and_snapshots(scheme: str) -> None:
+    mem = MemorySink()
+    res = run_grayscott(_gs("float32", scheme), seed=1, sink=mem)
+    assert all(a.dtype == np.float32 for a in res.final.values())
+    assert all(f.dtype == np.float32 for s in mem.snapshots for f in s.values())
+
+
+def test_float64_default_unchanged() -> None:
+    a = run_grayscott(_gs(), seed=1)
+    b = run_grayscott(GrayScottSpec(grid=_gs().grid, seed_square_frac=0.25), seed=1)
+    assert a.final["v"].dtype == np.float64
+    np.testing.assert_array_equal(a.final["v"], b.final["v"])
+
+
+def test_mixed_evaluates_in_float64() -> None:
+    spec = _gs("mixed")
+    ((sim, drift),) = _simulate(spec, [1])
+    assert sim.final["v"].dtype == np.float32
+    metrics, _ = _evaluate(spec, sim, drift)
+    ref, _ = _evaluate(_gs(), *_simulate(_gs(), [1])[0])
+    assert np.isclose(metrics["kl_mean_to_final"], ref["kl_mean_to_final"], rtol=1e-3)
+
+
+def test_validate_precision_reports_safe() -> None:
+    res = validate_precision("gs", [1, 2], "float32", spec=_gs())
+    assert res["safe"]
+    assert [r["seed"] for r in res["seeds"]] == [1, 2]
+    assert set(res["seconds"]) == {"float64", "float32"}
+    strict = validate_precision("gs", [1], "float32", spec=_gs(), rtol=0.0, atol=0.0)
+    assert not strict["safe"]
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import numpy as np
+
+from vireon_rd.engine import RunOptions, run_one
+from vireon_rd.falsify import GateProbe, ProbeConfig
+from vireon_rd.sim import run_grayscott, run_grayscott_ensemble
+from vireon_rd.sinks import MemorySink
+from vireon_rd.specs import GrayScottSpec, GridSpec
+
+# k = 0.1 kills the seeded spot: std(v) decays to ~1e-10 within a few snapshots
+BLANK = GrayScottSpec(grid=GridSpec(N=32, L=32.0, dt=0.5, T=2000.0, save_every=20), k=0.1)
+
+
+def test_blank_run_stops_early_with_nonblank_reason() -> None:
+    full = run_grayscott(BLANK, seed=1)
+    assert full.status == "ok"
+    assert float(np.std(full.final["v"])) <= 1e-6  # the full run ends blank too
+
+    sim = run_grayscott(BLANK, seed=1, sink=GateProbe("v", ProbeConfig()))
+
+    assert sim.status == "early_stop"
+    assert sim.stop_reason is not None and sim.stop_reason.startswith("NonBlankGate")
+    assert sim.stop_step is not None and sim.stop_step < len(full.times) * 20 // 10
+    assert sim.stop_time == sim.stop_step * BLANK.grid.dt
+
+
+def test_probe_stops_only_its_own_ensemble_member() -> None:
+    mem = MemorySink()
+    ref = run_grayscott(BLANK, seed=2)
+
+    a, b = run_grayscott_ensemble(BLANK, [1, 2], sinks=[GateProbe("v"), mem])
+
+    assert a.status == "early_stop"
+    assert (b.status, b.stop_step, b.stop_reason) == ("ok", None, None)
+    assert mem.times == ref.times
+    assert np.array_equal(b.final["v"], ref.final["v"])
+
+
+def test_patterned_run_is_not_stopped() -> None:
+    spec = GrayScottSpec(
+        grid=GridSpec(N=32, L=32.0, dt=0.5, T=200.0, save_every=20), seed_square_frac=0.25
+    )
+
+    sim = run_grayscott(spec, seed=1, sink=GateProbe("v", ProbeConfig(localization=True)))
+
+    assert (sim.status, sim.stop_reason) == ("ok", None)
+
+
+def test_run_one_records_early_stop(tmp_path: Path) -> None:
+    opts = RunOptions(probe=ProbeConfig(every=2))
+    run_one("blank", 1, tmp_path, spec=BLANK, opts=opts)
+
+    meta = json.loads((tmp_path / "meta.json").read_text(encoding="utf-8"))
+    assert meta["status"] == "early_stop"
+    assert meta["stop_reason"].startswith("NonBlankGate")
+    assert (
+        json.loads((tmp_path / "falsifiers.json").read_text(encoding="utf-8"))["NonBlankGate"]
+        is False
+    )
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from vireon_rd.numerics import init_grayscott
+from vireon_rd.refine import _WarmCapture, level_spec, richardson, run_refine
+from vireon_rd.sim import run_grayscott, run_sqk_model_g
+from vireon_rd.specs import ForcingSpec, GrayScottSpec, GridSpec, SQKModelGSpec
+from vireon_rd.spectral import spectral_resample
+
+
+def _cell_grid(N: int, L: float) -> tuple[np.ndarray, np.ndarray]:
+    x = (np.arange(N) - (N - 1) / 2.0) * L / N
+    return np.meshgrid(x, x, indexing="xy")
+
+
+@pytest.mark.parametrize(("N", "n"), [(16, 32), (15, 32), (16, 48)])
+def test_spectral_resample_is_exact_for_band_limited_fields(N: int, n: int) -> None:
+    L = 40.0
+
+    def f(X: np.ndarray, Y: np.ndarray) -> np.ndarray:
+        k = 2.0 * np.pi / L
+        return np.cos(3 * k * X) + np.sin(2 * k * Y) * np.cos(k * X) + 0.3 * np.cos(7 * k * Y + 0.4)
+
+    out = spectral_resample(f(*_cell_grid(N, L)), n)
+    assert out.shape == (n, n)
+    np.testing.assert_allclose(out, f(*_cell_grid(n, L)), atol=1e-12)
+    with pytest.raises(ValueError):
+        spectral_resample(out, N)
+
+
+def test_richardson_recovers_order_and_limit() -> None:
+    Ns = [16, 32, 64]
+    est = richardson([1.0 + 3.0 / n**2 for n in Ns], Ns)
+    assert est["observed_order"] == pytest.approx(2.0)
+    assert est["extrapolated"] == pytest.approx(1.0)
+    assert est["error"] == pytest.approx(3.0 / 64**2)
+
+    # two levels (or non-monotone differences): fall back to the assumed order
+    two = richardson([1.0 + 3.0 / n**2 for n in Ns[:2]], Ns[:2])
+    assert two["observed_order"] is None and two["order"] == 2.0
+    assert two["extrapolated"] == pytest.approx(1.0)
+
+
+def test_initial_state_replaces_seeded_init() -> None:
+    spec = GrayScottSpec(grid=GridSpec(N=16, L=16.0, T=5.0, save_every=50))
+    a = run_grayscott(spec, seed=2)
+    b = run_grayscott(spec, seed=2, initial=init_grayscott(spec, seed=2))
+    assert all(np.array_equal(a.final[k], b.final[k]) for k in a.final)
+
+
+def test_warm_restart_keeps_sqk_forcing_timing() -> None:
+    # resuming at the same N from a mid-run snapshot reproduces the full run
+    grid = GridSpec(N=16, L=16.0, dt=0.01, T=0.15, save_every=5)
+    forcing = ForcingSpec(scale=2.0, t0=0.12, sigma_t=0.03, velocity=(20.0, 0.0))
+    spec = SQKModelGSpec(grid=grid, forcing=forcing)
+    full = run_sqk_model_g(spec, seed=1)
+    cap = _WarmCapture("X", 0.1)
+    run_sqk_model_g(spec, seed=1, sink=cap)
+    assert cap.t == pytest.approx(0.1) and len(cap.frames) == 2
+    tail = replace(
+        spec,
+        grid=replace(spec.grid, T=spec.grid.T - cap.t),
+        forcing=replace(spec.forcing, t0=spec.forcing.t0 - cap.t),
+    )
+    res = run_sqk_model_g(tail, seed=1, initial=tuple(cap.state[k] for k in ("G", "X", "Y")))
+    assert full.status == res.status == "ok"
+    for k in full.final:
+        np.testing.assert_allclose(res.final[k], full.final[k], rtol=1e-9, atol=1e-12)
+
+
+def test_run_refine_warm_starts_finer_levels() -> None:
+    spec = GrayScottSpec(grid=GridSpec(N=16, L=32.0, dt=1.0, T=200.0, save_every=20))
+    res = run_refine(spec, 1, [16, 32], warm_frac=0.5)
+    coarse, fine = res["levels"]
+    assert coarse["start"] == "cold" and fine["start"] == "warm"
+    assert res["t_warm"] == pytest.approx(100.0)
+    assert fine["dt"] == pytest.approx(0.25) and fine["save_every"] == 80
+    assert fine["steps"] < 0.6 * 200.0 / 0.25
+    assert set(res["convergence"]) == {"lambda_star", "localization", "anisotropy"}
+    assert set(res["gates"]) == set(coarse["gates"])
+    assert level_spec(spec, 8).grid.dt == spec.grid.dt
+
+    cold = run_refine(spec, 1, [16, 32], warm_frac=0.0)
+    assert cold["t_warm"] is None
+    assert [lv["start"] for lv in cold["levels"]] == ["cold", "cold"]
+    with pytest.raises(ValueError):
+        run_refine(spec, 1, [32, 16])
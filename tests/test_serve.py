@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import csv
+import socket
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from vireon_rd.engine import main
+from vireon_rd.serve import ServeConfig, Server, request
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix sockets")
+
+SMALL = {"grid.N": 16, "grid.L": 16.0, "grid.dt": 0.5, "grid.T": 10.0, "grid.save_every": 5}
+
+
+@pytest.fixture
+def server(tmp_path: Path) -> Iterator[Server]:
+    srv = Server(ServeConfig(socket=tmp_path / "s.sock", workers=2))
+    t = threading.Thread(target=srv.serve_forever, daemon=True)
+    t.start()
+    yield srv
+    srv.shutdown()
+    t.join()
+    srv.server_close()
+    assert not srv.path.exists()
+
+
+def test_served_runs_match_in_process(server: Server, tmp_path: Path) -> None:
+    out = tmp_path / "served"
+    events = list(
+        request({"cmd": "run", "spec": "sqk", "no-cache": True, "out": str(out)}, server.path)
+    )
+    assert [e["event"] for e in events] == ["accepted", "run", "done"]
+    assert events[1]["path"] == str(out) and events[1]["status"] == "blowup"
+
+    main(["run", "--spec", "sqk", "--no-cache", "--out", str(tmp_path / "local")])
+    for name in ("metrics.json", "falsifiers.json"):
+        assert (out / name).read_bytes() == (tmp_path / "local" / name).read_bytes()
+
+    req = {"cmd": "suite", "spec": "sqk", "seeds": [1, 2, 3], "jobs": 2, "no_cache": True}
+    events = list(request({**req, "out": str(tmp_path / "suite")}, server.path))
+    assert sorted(e["seed"] for e in events if e["event"] == "run") == [1, 2, 3]
+    assert (tmp_path / "suite" / "suite.json").exists()
+
+    design = {"spec": "gs", "params": {"F": [0.03, 0.04]}, "base": SMALL}
+    req = {"cmd": "sweep", "design": design, "no_cache": True, "out": str(tmp_path / "sweep")}
+    events = list(request(req, server.path))
+    assert sum(e["event"] == "run" for e in events) == 2 and events[-1]["runs"] == 2
+    with (tmp_path / "sweep" / "summary.csv").open(encoding="utf-8") as f:
+        assert len(list(csv.DictReader(f))) == 2
+
+    assert next(request({"cmd": "ping"}, server.path))["requests"] == 3
+
+
+def test_bad_requests_get_error_events(server: Server, tmp_path: Path) -> None:
+    for req in ({"cmd": "audit"}, {"cmd": "run", "nope": 1}, {"cmd": "sweep"}):
+        (ev,) = request(req, server.path)
+        assert ev["event"] == "error"
+    (_, ev) = request({"cmd": "run", "spec": "nope", "out": str(tmp_path / "x")}, server.path)
+    assert ev["event"] == "error" and "Unknown spec" in ev["error"]
+    with pytest.raises(ConnectionError):
+        request({"cmd": "ping"}, tmp_path / "missing.sock")
+
+
+def test_client_uses_the_server_or_runs_in_process(
+    server: Server, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    run = ["run", "--spec", "sqk", "--no-cache", "--out"]
+    main(["client", "--socket", str(server.path), *run, str(tmp_path / "a")])
+    assert f"blowup: {tmp_path / 'a'}" in capsys.readouterr().out
+
+    missing = str(tmp_path / "missing.sock")
+    main(["client", "--socket", missing, *run, str(tmp_path / "b")])
+    assert (tmp_path / "b" / "metrics.json").exists()
+    assert "running in-process" in capsys.readouterr().err
+    with pytest.raises(SystemExit):
+        main(["client", "--socket", missing, "--no-fallback", *run, str(tmp_path / "c")])
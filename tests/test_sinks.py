@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from vireon_rd.eval import DriftAccumulator, eval_time_drift
+from vireon_rd.sim import run_grayscott
+from vireon_rd.sinks import DriftSink, MemorySink, TeeSink
+from vireon_rd.specs import GrayScottSpec, GridSpec
+from vireon_rd.store import TrajectoryWriter, open_trajectory
+
+
+def test_drift_accumulator_matches_eval_time_drift() -> None:
+    rng = np.random.default_rng(0)
+    frames = [rng.normal(size=(16, 16)) for _ in range(6)]
+    frames.insert(2, np.ones((16, 16)))  # blank spectrum contributes 0
+
+    acc = DriftAccumulator()
+    for u in frames:
+        acc.add(u)
+
+    ref = eval_time_drift(frames)["kl_mean_to_final"]
+    assert acc.result()["kl_mean_to_final"] == pytest.approx(ref, rel=1e-12)
+
+    single = DriftAccumulator()
+    single.add(frames[0])
+    assert single.result() == {"kl_mean_to_final": 0.0}
+
+
+def test_reduced_drift_modes_lower_bound_exact() -> None:
+    spec = GrayScottSpec(grid=GridSpec(N=64, L=64.0, dt=0.5, T=1000.0, save_every=100))
+    frames = [snap["v"] for snap in run_grayscott(spec, seed=1).snapshots]
+    exact = eval_time_drift(frames)["kl_mean_to_final"]
+
+    def drift(mode: str, factor: int = 4) -> float:
+        acc = DriftAccumulator(mode=mode, factor=factor)
+        for u in frames:
+            acc.add(u)
+        return acc.result()["kl_mean_to_final"]
+
+    assert exact > 0.0
+    assert drift("downsample", 1) == pytest.approx(exact, rel=1e-12)
+    coarse = [drift("downsample", f) for f in (1, 2, 4, 8)]
+    # nested blocks: coarse-graining can only lose divergence
+    assert all(a >= b - 1e-12 for a, b in zip(coarse, coarse[1:], strict=False))
+    assert 0.0 < drift("radial") <= exact
+
+    with pytest.raises(ValueError):
+        DriftAccumulator(mode="downsample", factor=3).add(frames[0])
+
+
+def test_sinks_stream_the_same_snapshots(tmp_path) -> None:
+    spec = GrayScottSpec(grid=GridSpec(N=24, L=24.0, dt=0.5, T=20.0, save_every=4))
+    mem = MemorySink(fields=["v"])
+    drift = DriftSink("v")
+    disk = TrajectoryWriter(tmp_path / "snaps")
+
+    sim = run_grayscott(spec, seed=3, sink=TeeSink(mem, drift, disk))
+    ref = run_grayscott(spec, seed=3)
+
+    assert sim.snapshots == []
+    assert mem.times == sim.times == ref.times
+    for a, b in zip(mem.series("v"), ref.snapshots, strict=True):
+        assert np.array_equal(a, b["v"])
+
+    expected = eval_time_drift([snap["v"] for snap in ref.snapshots])["kl_mean_to_final"]
+    assert drift.result()["kl_mean_to_final"] == pytest.approx(expected, rel=1e-12)
+
+    traj = open_trajectory(tmp_path / "snaps")
+    assert list(traj.times) == ref.times
+    assert set(traj.fields) == {"u", "v"}
+    for i, snap in enumerate(ref.snapshots):
+        assert np.array_equal(traj.series("u")[i], snap["u"])
+        assert np.array_equal(traj.series("v")[i], snap["v"])
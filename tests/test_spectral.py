@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from dataclasses import replace
+
+import numpy as np
+
+from vireon_rd.sim import run_grayscott
+from vireon_rd.specs import GrayScottSpec, GridSpec
+
+BASE = GrayScottSpec(grid=GridSpec(N=16, L=16.0, save_every=4))
+
+
+def _final_v(dt: float, scheme: str, t_end: float = 4.0) -> np.ndarray:
+    # the stepping loop performs ceil(T/dt) + 1 steps; pin the end time across dt
+    grid = replace(BASE.grid, dt=dt, T=t_end - dt, scheme=scheme)
+    sim = run_grayscott(replace(BASE, grid=grid), seed=1)
+    assert sim.status == "ok"
+    return sim.final["v"]
+
+
+def test_spectral_schemes_converge_to_euler_reference() -> None:
+    ref = _final_v(2.0**-11, "euler")
+
+    err_etd = abs(_final_v(1.0, "etdrk4") - ref).max()
+    err_euler = abs(_final_v(1.0, "euler") - ref).max()
+    assert err_etd < 1e-4
+    assert err_etd < 0.01 * err_euler
+
+    errs = [abs(_final_v(dt, "imex-spectral") - ref).max() for dt in (1.0, 0.5, 0.25)]
+    assert errs[0] > errs[1] > errs[2]
+    assert 1.5 < errs[0] / errs[1] < 2.5
+
+
+def test_etdrk4_is_stable_beyond_euler_diffusion_limit() -> None:
+    grid = replace(BASE.grid, dt=3.0, T=60.0)
+    euler = run_grayscott(replace(BASE, grid=grid), seed=1)
+    etd = run_grayscott(replace(BASE, grid=replace(grid, scheme="etdrk4")), seed=1)
+
+    assert euler.status == "blowup"
+    assert etd.status == "ok"
+    # same snapshot cadence as the Euler contract: every save_every steps of dt
+    assert etd.times == [n * grid.dt for n in range(0, 21, grid.save_every)]
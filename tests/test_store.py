@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from vireon_rd.engine import RunOptions, audit_run, main, run_one
+from vireon_rd.eval import eval_time_drift
+from vireon_rd.sim import run_grayscott
+from vireon_rd.specs import GrayScottSpec, GridSpec
+from vireon_rd.store import StoreConfig, TrajectoryWriter, open_trajectory
+
+
+def _spec() -> GrayScottSpec:
+    return GrayScottSpec(grid=GridSpec(N=24, L=24.0, dt=0.5, T=20.0, save_every=4))
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_trajectory_round_trip(tmp_path: Path, compress: bool) -> None:
+    spec = _spec()
+    writer = TrajectoryWriter(tmp_path / "traj", StoreConfig(chunk_frames=3, compress=compress))
+    sim = run_grayscott(spec, seed=2, sink=writer)
+    writer.write_final(sim.final)
+    ref = run_grayscott(spec, seed=2)
+
+    traj = open_trajectory(tmp_path / "traj")
+    assert len(traj) == len(ref.snapshots) == 11
+    assert np.array_equal(traj.times, ref.times)
+    v = traj.series("v")
+    for i, snap in enumerate(ref.snapshots):
+        assert np.array_equal(v[i], snap["v"])
+    assert np.array_equal(v[-1], ref.snapshots[-1]["v"])
+    assert np.array_equal(v[2:7], np.stack([s["v"] for s in ref.snapshots[2:7]]))
+    assert np.array_equal(traj.final["u"], ref.final["u"])
+
+    expected = eval_time_drift([s["v"] for s in ref.snapshots])
+    assert eval_time_drift(v) == expected
+
+
+def test_engine_store_and_audit(tmp_path: Path, capsys) -> None:
+    out = tmp_path / "run"
+    run_one("gs", 3, out, spec=_spec(), opts=RunOptions(store=StoreConfig(fields=("v",))))
+
+    meta = json.loads((out / "meta.json").read_text(encoding="utf-8"))
+    assert meta["trajectory"]["fields"] == ["v"]
+    assert open_trajectory(out).fields == ("v",)
+
+    res = audit_run(out)
+    assert res["ok"], res["checks"]
+
+    main(["audit", "--run", str(out)])
+    assert "matches its trajectory" in capsys.readouterr().out
+
+    metrics = json.loads((out / "metrics.json").read_text(encoding="utf-8"))
+    metrics["anisotropy"] += 1.0
+    (out / "metrics.json").write_text(json.dumps(metrics), encoding="utf-8")
+    with pytest.raises(SystemExit):
+        main(["audit", "--run", str(out)])
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import numpy as np
+from threadpoolctl import threadpool_limits
+
+from vireon_rd.engine import run_suite
+from vireon_rd.parallel import make_pool, native_threads
+from vireon_rd.specs import GrayScottSpec, GridSpec
+
+
+def _load(p: Path) -> dict:
+    return json.loads(p.read_text(encoding="utf-8"))
+
+
+def test_ensemble_suite_matches_sequential_artifacts(tmp_path: Path) -> None:
+    spec = GrayScottSpec(grid=GridSpec(N=24, L=24.0, dt=0.5, T=20.0, save_every=4))
+    seeds = [1, 2, 3]
+
+    run_suite("gs", seeds, tmp_path / "ens", spec=spec)
+    run_suite("gs", seeds, tmp_path / "seq", ensemble=False, spec=spec)
+
+    for s in seeds:
+        a = tmp_path / "ens" / f"seed_{s}"
+        b = tmp_path / "seq" / f"seed_{s}"
+        for name in ("metrics.json", "falsifiers.json"):
+            assert (a / name).read_bytes() == (b / name).read_bytes()
+        meta_a, meta_b = _load(a / "meta.json"), _load(b / "meta.json")
+        for m in (meta_a, meta_b):
+            m.pop("utc")
+            m.pop("timing")  # wall clock
+        assert meta_a == meta_b
+
+    suite_a, suite_b = (
+        _load(tmp_path / "ens" / "suite.json"),
+        _load(tmp_path / "seq" / "suite.json"),
+    )
+    assert suite_a.pop("timing")["runs"] == suite_b.pop("timing")["runs"] == len(seeds)
+    assert suite_a == suite_b
+
+
+def test_parallel_suite_is_deterministic(tmp_path: Path) -> None:
+    spec = GrayScottSpec(grid=GridSpec(N=24, L=24.0, dt=0.5, T=20.0, save_every=4))
+    seeds = [4, 1, 3, 2, 5]
+
+    run_suite("gs", seeds, tmp_path / "serial", spec=spec)
+    run_suite("gs", seeds, tmp_path / "pool", jobs=2, spec=spec)
+    run_suite("gs", seeds, tmp_path / "pool_seq", jobs=3, ensemble=False, spec=spec)
+
+    def results(name: str) -> dict:
+        suite = _load(tmp_path / name / "suite.json")
+        suite.pop("timing")  # wall clock; everything else must match
+        return suite
+
+    serial = results("serial")
+    assert results("pool") == serial
+    assert results("pool_seq") == serial
+
+
+def test_pool_workers_run_single_threaded_native_code() -> None:
+    assert np.dot(np.ones(4), np.ones(4)) == 4.0  # BLAS is loaded
+    # a parent with multi-threaded BLAS: forked workers inherit the loaded pool as it is
+    with threadpool_limits(limits=4):
+        assert set(native_threads().values()) == {4}
+        with make_pool(2) as pool:
+            assert set(pool.submit(native_threads).result().values()) == {1}
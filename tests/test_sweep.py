@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import csv
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from vireon_rd.engine import main
+from vireon_rd.specs import get_spec
+from vireon_rd.sweep import (
+    SweepDesign,
+    design_points,
+    expand_design,
+    load_design,
+    run_sweep,
+    set_field,
+)
+
+SMALL = {"grid.N": 16, "grid.L": 16.0, "grid.dt": 0.5, "grid.T": 10.0, "grid.save_every": 5}
+
+
+def test_grid_design_expands_with_stable_ids() -> None:
+    design = SweepDesign(
+        spec="gs",
+        params={"F": [0.03, 0.04], "k": {"low": 0.05, "high": 0.07, "num": 3}},
+        seeds=(1, 2),
+    )
+
+    jobs = expand_design(design)
+
+    assert len(jobs) == 12
+    assert len({j.id for j in jobs}) == 12
+    assert [j.id for j in jobs] == [j.id for j in expand_design(design)]
+    assert jobs[0].spec.F == 0.03 and jobs[0].spec.k == 0.05
+    assert jobs[-1].params == {"F": 0.04, "k": 0.07}
+
+
+def test_lhs_puts_one_sample_in_each_stratum() -> None:
+    n = 20
+    design = SweepDesign(
+        design="lhs",
+        samples=n,
+        params={"F": {"low": 0.02, "high": 0.06}, "grid.N": {"low": 32, "high": 96}},
+    )
+
+    pts = design_points(design)
+    F = np.array([p["F"] for p in pts])
+
+    assert sorted(((F - 0.02) / 0.04 * n).astype(int)) == list(range(n))
+    assert all(isinstance(j.spec.grid.N, int) for j in expand_design(design))
+
+
+def test_unknown_field_is_rejected() -> None:
+    with pytest.raises(ValueError, match="unknown field"):
+        expand_design(SweepDesign(params={"grid.nope": [1]}))
+    with pytest.raises(ValueError, match="integer"):
+        expand_design(SweepDesign(params={"grid.N": [16.5]}))
+
+
+def test_bool_fields_parse_strings_explicitly() -> None:
+    sqk = get_spec("sqk")
+    for value, want in (
+        (False, False),
+        ("false", False),
+        ("0", False),
+        (" TRUE ", True),
+        ("1", True),
+    ):
+        assert set_field(sqk, "enable_forcing", value).enable_forcing is want
+    for bad in ("no", "", 0, 1.0, None):
+        with pytest.raises(ValueError, match="enable_forcing must be a boolean"):
+            set_field(sqk, "enable_forcing", bad)
+
+
+def test_run_sweep_writes_one_summary_row_per_job(tmp_path: Path) -> None:
+    design = SweepDesign(params={"F": [0.03, 0.05]}, base=SMALL, seeds=(1, 2))
+
+    rows = run_sweep(design, tmp_path, jobs=2)
+
+    with (tmp_path / "summary.csv").open(encoding="utf-8") as f:
+        table = list(csv.DictReader(f))
+    assert [r["id"] for r in table] == [j.id for j in expand_design(design)]
+    assert [r["id"] for r in rows] == [r["id"] for r in table]
+    for col in ("seed", "F", "status", "lambda_star", "TRP", "NonBlankGate"):
+        assert col in table[0]
+    assert all((tmp_path / "runs" / r["id"] / "meta.json").exists() for r in table)
+
+
+def test_sweep_cli_reads_toml(tmp_path: Path) -> None:
+    path = tmp_path / "design.toml"
+    path.write_text(
+        'spec = "gs"\n'
+        'design = "random"\n'
+        "samples = 2\n"
+        "seeds = [3]\n"
+        "[base]\n" + "".join(f'"{k}" = {v}\n' for k, v in SMALL.items()) + "[params]\n"
+        "k = { low = 0.05, high = 0.07 }\n",
+        encoding="utf-8",
+    )
+    assert load_design(path).samples == 2
+
+    main(["sweep", "--design", str(path), "--out", str(tmp_path / "out"), "--no-cache"])
+
+    with (tmp_path / "out" / "summary.csv").open(encoding="utf-8") as f:
+        assert len(list(csv.DictReader(f))) == 2
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from vireon_rd.sim import run_grayscott_ensemble, run_sqk_model_g_ensemble
+from vireon_rd.specs import ForcingSpec, GrayScottSpec, GridSpec, SQKModelGSpec
+
+
+@pytest.mark.parametrize("precision", ["float64", "float32"])
+def test_threaded_sqk_is_bit_identical(precision: str) -> None:
+    grid = GridSpec(N=64, L=32.0, dt=0.05, T=12.0, save_every=40, precision=precision)
+    spec = SQKModelGSpec(grid=grid, forcing=ForcingSpec(t0=5.0))
+    ref = run_sqk_model_g_ensemble(spec, [1, 2])
+    res = run_sqk_model_g_ensemble(spec, [1, 2], threads=4)
+    for a, b in zip(ref, res, strict=True):
+        assert b.status == a.status
+        for k in a.final:
+            assert np.array_equal(a.final[k], b.final[k])
+        for sa, sb in zip(a.snapshots, b.snapshots, strict=True):
+            assert all(np.array_equal(sa[k], sb[k]) for k in sa)
+
+
+def test_threaded_grayscott_is_bit_identical_with_uneven_blocks() -> None:
+    # 50 rows over 3 blocks of 17/17/16 rows
+    grid = GridSpec(N=50, L=50.0, dt=1.0, T=200.0, save_every=50)
+    spec = GrayScottSpec(grid=grid, seed_square_frac=0.25)
+    ref = run_grayscott_ensemble(spec, [1, 2, 3])
+    res = run_grayscott_ensemble(spec, [1, 2, 3], threads=3)
+    for a, b in zip(ref, res, strict=True):
+        assert np.array_equal(a.final["u"], b.final["u"])
+        assert np.array_equal(a.final["v"], b.final["v"])
+
+
+def test_threads_ignored_outside_euler() -> None:
+    grid = GridSpec(N=32, L=32.0, dt=1.0, T=20.0, save_every=10, scheme="etdrk4")
+    spec = GrayScottSpec(grid=grid)
+    (a,) = run_grayscott_ensemble(spec, [1])
+    (b,) = run_grayscott_ensemble(spec, [1], threads=4)
+    assert np.array_equal(a.final["v"], b.final["v"])
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from vireon_rd.engine import run_one, run_suite
+from vireon_rd.sim import run_grayscott
+from vireon_rd.specs import GrayScottSpec, GridSpec
+from vireon_rd.timing import (
+    MEMORY_TEXT,
+    NULL_TIMER,
+    PROFILE_FILE,
+    PhaseTimer,
+    fine_timer,
+    profiled,
+    rollup,
+)
+
+SPEC = GrayScottSpec(grid=GridSpec(N=16, L=16.0, dt=0.5, T=10.0, save_every=4))
+
+
+def test_phase_timer_and_rollup_shares() -> None:
+    t = PhaseTimer()
+    for _ in range(3):
+        with t.phase("a"):
+            pass
+    t.add("b", 2.0, calls=4)
+    d = t.as_dict()
+    assert d["a"]["calls"] == 3 and d["a"]["seconds"] >= 0.0
+    assert d["b"] == {"seconds": 2.0, "calls": 4}
+
+    stack = {"step": {"seconds": 3.0, "calls": 1}}
+    runs = [{"members": 3, "stack": stack, "run": {"write": {"seconds": 0.5, "calls": 1}}}] * 3
+    totals = rollup(runs)["seconds"]
+    assert totals["step"] == pytest.approx(3.0) and totals["write"] == pytest.approx(1.5)
+
+
+def test_sim_and_meta_timing(tmp_path: Path) -> None:
+    sim = run_grayscott(SPEC, seed=1)
+    assert sim.timing["stack"]["step"]["calls"] == 21
+    assert set(sim.timing["stack"]) == {"step", "snapshot"}  # stepping timed per stride
+    assert sim.timing["steps_per_second"] > 0 and sim.timing["alloc_bytes"] > 0
+
+    run_one("gs", 1, tmp_path / "run", spec=SPEC)
+    timing = json.loads((tmp_path / "run" / "meta.json").read_text(encoding="utf-8"))["timing"]
+    assert {"simulate", "eval_field", "step"} <= set(timing["stack"])
+    assert set(timing["run"]) == {"drift", "falsify", "write"}
+
+    suite = run_suite("gs", [1, 2], tmp_path / "suite", spec=SPEC)
+    assert suite["timing"]["runs"] == 2
+    metas = [tmp_path / "suite" / f"seed_{s}" / "meta.json" for s in (1, 2)]
+    written = [json.loads(m.read_text(encoding="utf-8"))["timing"] for m in metas]
+    assert suite["timing"] == rollup(written)  # rolled up in memory, same as the artifacts
+    assert suite["timing"]["seconds"]["simulate"] > 0.0
+
+
+def test_profiled_writes_reports(tmp_path: Path) -> None:
+    with profiled(tmp_path):
+        sim = run_grayscott(SPEC, seed=1)
+    stack = sim.timing["stack"]
+    assert stack["step"]["calls"] == 21 and {"laplacian", "health"} <= set(stack)
+    assert fine_timer(PhaseTimer()) is NULL_TIMER
+    assert (tmp_path / PROFILE_FILE).stat().st_size > 0
+    assert (tmp_path / MEMORY_TEXT).read_text(encoding="utf-8").startswith("peak traced:")